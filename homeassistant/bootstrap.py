@@ -15,20 +15,27 @@ from homeassistant import (
     core, config as conf_util, loader, components as core_components)
 from homeassistant.components import persistent_notification
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import async_get_timeline, async_setup_component
 from homeassistant.util.logging import AsyncHandler
 from homeassistant.util.package import async_get_user_site, get_user_site
-from homeassistant.util.yaml import clear_secret_cache
+from homeassistant.util.yaml import clear_secret_cache, enable_cache
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.state_snapshot import async_setup_snapshot
 from homeassistant.helpers.signal import async_register_signal_handling
 
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = 'home-assistant.log'
 
+# Parsed YAML files of the config dir are cached in this file
+YAML_CACHE_FILENAME = '.yaml_cache'
+
 # hass.data key for logging information.
 DATA_LOGGING = 'logging'
 
+# Timeline track of the bootstrap stages
+TIMELINE_TRACK = 'bootstrap'
+
 FIRST_INIT_COMPONENT = set((
     'system_log', 'recorder', 'mqtt', 'mqtt_eventstream', 'logger',
     'introduction', 'frontend', 'history'))
@@ -81,6 +88,7 @@ def async_from_config_dict(config: Dict[str, Any],
     This method is a coroutine.
     """
     start = time()
+    timeline = async_get_timeline(hass)
 
     if enable_log:
         async_enable_logging(hass, verbose, log_rotate_days, log_file)
@@ -96,12 +104,16 @@ def async_from_config_dict(config: Dict[str, Any],
     core_config = config.get(core.DOMAIN, {})
 
     try:
-        yield from conf_util.async_process_ha_core_config(hass, core_config)
+        with timeline.span(TIMELINE_TRACK, 'core_config'):
+            yield from conf_util.async_process_ha_core_config(
+                hass, core_config)
     except vol.Invalid as ex:
         conf_util.async_log_exception(ex, 'homeassistant', core_config, hass)
         return None
 
-    yield from hass.async_add_job(conf_util.process_ha_config_upgrade, hass)
+    with timeline.span(TIMELINE_TRACK, 'config_upgrade'):
+        yield from hass.async_add_job(
+            conf_util.process_ha_config_upgrade, hass)
 
     hass.config.skip_pip = skip_pip
     if skip_pip:
@@ -109,7 +121,8 @@ def async_from_config_dict(config: Dict[str, Any],
                         "This may cause issues")
 
     if not loader.PREPARED:
-        yield from hass.async_add_job(loader.prepare, hass)
+        with timeline.span(TIMELINE_TRACK, 'loader_prepare'):
+            yield from hass.async_add_job(loader.prepare, hass)
 
     # Merge packages
     conf_util.merge_packages_config(
@@ -129,31 +142,37 @@ def async_from_config_dict(config: Dict[str, Any],
 
     # setup components
     # pylint: disable=not-an-iterable
-    res = yield from core_components.async_setup(hass, config)
+    with timeline.span(TIMELINE_TRACK, 'core'):
+        res = yield from core_components.async_setup(hass, config)
     if not res:
         _LOGGER.error("Home Assistant core failed to initialize. "
                       "further initialization aborted")
         return hass
 
-    yield from persistent_notification.async_setup(hass, config)
+    with timeline.span(TIMELINE_TRACK, 'persistent_notification'):
+        yield from persistent_notification.async_setup(hass, config)
 
     _LOGGER.info("Home Assistant core initialized")
 
+    async_setup_snapshot(hass)
+
     # stage 1
-    for component in components:
-        if component not in FIRST_INIT_COMPONENT:
-            continue
-        hass.async_add_job(async_setup_component(hass, component, config))
+    with timeline.span(TIMELINE_TRACK, 'stage_1'):
+        for component in components:
+            if component not in FIRST_INIT_COMPONENT:
+                continue
+            hass.async_add_job(async_setup_component(hass, component, config))
 
-    yield from hass.async_block_till_done()
+        yield from hass.async_block_till_done()
 
     # stage 2
-    for component in components:
-        if component in FIRST_INIT_COMPONENT:
-            continue
-        hass.async_add_job(async_setup_component(hass, component, config))
+    with timeline.span(TIMELINE_TRACK, 'stage_2'):
+        for component in components:
+            if component in FIRST_INIT_COMPONENT:
+                continue
+            hass.async_add_job(async_setup_component(hass, component, config))
 
-    yield from hass.async_block_till_done()
+        yield from hass.async_block_till_done()
 
     stop = time()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop-start)
@@ -204,9 +223,12 @@ def async_from_config_file(config_path: str,
 
     async_enable_logging(hass, verbose, log_rotate_days, log_file)
 
+    enable_cache(config_dir, os.path.join(config_dir, YAML_CACHE_FILENAME))
+
     try:
-        config_dict = yield from hass.async_add_job(
-            conf_util.load_yaml_config_file, config_path)
+        with async_get_timeline(hass).span(TIMELINE_TRACK, 'config_load'):
+            config_dict = yield from hass.async_add_job(
+                conf_util.load_yaml_config_file, config_path)
     except HomeAssistantError as err:
         _LOGGER.error("Error loading %s: %s", config_path, err)
         return None
@@ -15,7 +15,8 @@ import os
 import homeassistant.core as ha
 import homeassistant.config as conf_util
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.service import extract_entity_ids
+from homeassistant.helpers.service import (
+    extract_entity_ids, lazy_descriptions)
 from homeassistant.const import (
     ATTR_ENTITY_ID, SERVICE_TURN_ON, SERVICE_TURN_OFF, SERVICE_TOGGLE,
     SERVICE_HOMEASSISTANT_STOP, SERVICE_HOMEASSISTANT_RESTART,
@@ -111,10 +112,8 @@ def async_reload_core_config(hass):
 @asyncio.coroutine
 def async_setup(hass, config):
     """Set up general services related to Home Assistant."""
-    descriptions = yield from hass.async_add_job(
-        conf_util.load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml')
-    )
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     @asyncio.coroutine
     def async_handle_turn_service(service):
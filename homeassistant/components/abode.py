@@ -11,7 +11,7 @@ from os import path
 
 import voluptuous as vol
 
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.const import (
     ATTR_ATTRIBUTION, ATTR_DATE, ATTR_TIME, ATTR_ENTITY_ID, CONF_USERNAME,
     CONF_PASSWORD, CONF_EXCLUDE, CONF_NAME, CONF_LIGHTS,
@@ -188,8 +188,8 @@ def setup_hass_services(hass):
         for device in target_devices:
             device.trigger()
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))[DOMAIN]
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))[DOMAIN]
 
     hass.services.register(
         DOMAIN, SERVICE_SETTINGS, change_setting,
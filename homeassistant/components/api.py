@@ -12,20 +12,25 @@ from aiohttp import web
 import async_timeout
 
 import homeassistant.core as ha
-import homeassistant.remote as rem
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.const import (
-    EVENT_HOMEASSISTANT_STOP, EVENT_TIME_CHANGED,
+    CONTENT_TYPE_JSON, EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST, HTTP_CREATED, HTTP_NOT_FOUND,
     MATCH_ALL, URL_API, URL_API_COMPONENTS,
     URL_API_CONFIG, URL_API_DISCOVERY_INFO, URL_API_ERROR_LOG,
-    URL_API_EVENTS, URL_API_SERVICES,
+    URL_API_EVENTS, URL_API_POLLING, URL_API_RECORDER, URL_API_SERVICES,
     URL_API_STATES, URL_API_STATES_ENTITY, URL_API_STREAM, URL_API_TEMPLATE,
-    __version__)
+    URL_API_TIMELINE, __version__)
 from homeassistant.exceptions import TemplateError
-from homeassistant.helpers.state import AsyncTrackStates
+from homeassistant.helpers.state import (
+    AsyncTrackStates, state_changed_delta, state_diff)
 from homeassistant.helpers import template
+from homeassistant.helpers.entity_component import async_polling_stats
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder import async_recorder_stats
+from homeassistant.setup import async_get_timeline
+from homeassistant.remote import JSONEncoder
 
 DOMAIN = 'api'
 DEPENDENCIES = ['http']
@@ -50,6 +55,9 @@ def setup(hass, config):
     hass.http.register_view(APIDomainServicesView)
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APITemplateView)
+    hass.http.register_view(APIPollingView)
+    hass.http.register_view(APIRecorderView)
+    hass.http.register_view(APITimelineView)
 
     log_path = hass.data.get(DATA_LOGGING, None)
     if log_path:
@@ -88,6 +96,11 @@ class APIEventStream(HomeAssistantView):
         if restrict:
             restrict = restrict.split(',') + [EVENT_HOMEASSISTANT_STOP]
 
+        # With delta, state changes are sent as diff to the last sent state
+        last_states = None
+        if request.query.get('delta') in ('1', 'true'):
+            last_states = {}
+
         @asyncio.coroutine
         def forward_events(event):
             """Forward events to the open request."""
@@ -101,8 +114,12 @@ class APIEventStream(HomeAssistantView):
 
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
+            elif last_states is not None and \
+                    event.event_type == EVENT_STATE_CHANGED:
+                data = _delta_event_json(
+                    event, state_changed_delta(event, last_states))
             else:
-                data = json.dumps(event, cls=rem.JSONEncoder)
+                data = event.as_json()
 
             yield from to_write.put(data)
 
@@ -118,6 +135,17 @@ class APIEventStream(HomeAssistantView):
             # Fire off one message so browsers fire open event right away
             yield from to_write.put(STREAM_PING_PAYLOAD)
 
+            if last_states is not None and \
+                    (not restrict or EVENT_STATE_CHANGED in restrict):
+                # Start with a snapshot of all states the deltas build on
+                for state in hass.states.async_all():
+                    last_states[state.entity_id] = state
+                    to_write.put_nowait(_delta_event_json(ha.Event(
+                        EVENT_STATE_CHANGED, time_fired=state.last_updated), {
+                            'entity_id': state.entity_id,
+                            'diff': state_diff(None, state),
+                        }))
+
             while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL,
@@ -184,7 +212,9 @@ class APIStatesView(HomeAssistantView):
     @ha.callback
     def get(self, request):
         """Get current states."""
-        return self.json(request.app['hass'].states.async_all())
+        states = request.app['hass'].states.async_all()
+        return _json_response(
+            '[{}]'.format(', '.join(state.as_json() for state in states)))
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -198,7 +228,7 @@ class APIEntityStateView(HomeAssistantView):
         """Retrieve state of entity."""
         state = request.app['hass'].states.get(entity_id)
         if state:
-            return self.json(state)
+            return _json_response(state.as_json())
         return self.json_message('Entity not found', HTTP_NOT_FOUND)
 
     @asyncio.coroutine
@@ -293,10 +323,12 @@ class APIServicesView(HomeAssistantView):
     url = URL_API_SERVICES
     name = "api:services"
 
-    @ha.callback
+    @asyncio.coroutine
     def get(self, request):
         """Get registered services."""
-        return self.json(async_services_json(request.app['hass']))
+        hass = request.app['hass']
+        yield from hass.services.async_load_descriptions()
+        return self.json(async_services_json(hass))
 
 
 class APIDomainServicesView(HomeAssistantView):
@@ -337,6 +369,45 @@ class APIComponentsView(HomeAssistantView):
         return self.json(request.app['hass'].config.components)
 
 
+class APIPollingView(HomeAssistantView):
+    """View to handle polling statistics requests."""
+
+    url = URL_API_POLLING
+    name = "api:polling"
+
+    @ha.callback
+    def get(self, request):
+        """Get the polling statistics of the entity platforms."""
+        return self.json(async_polling_stats(request.app['hass']))
+
+
+class APIRecorderView(HomeAssistantView):
+    """View to handle recorder statistics requests."""
+
+    url = URL_API_RECORDER
+    name = "api:recorder"
+
+    @ha.callback
+    def get(self, request):
+        """Get the queue depth and commit latency of the recorder."""
+        stats = async_recorder_stats(request.app['hass'])
+        if stats is None:
+            return self.json_message('Recorder not loaded', HTTP_NOT_FOUND)
+        return self.json(stats)
+
+
+class APITimelineView(HomeAssistantView):
+    """View to handle startup timeline requests."""
+
+    url = URL_API_TIMELINE
+    name = "api:timeline"
+
+    @ha.callback
+    def get(self, request):
+        """Get the setup timeline as Chrome trace events."""
+        return self.json(async_get_timeline(request.app['hass']).as_trace())
+
+
 class APITemplateView(HomeAssistantView):
     """View to handle requests."""
 
@@ -355,6 +426,22 @@ class APITemplateView(HomeAssistantView):
                                      HTTP_BAD_REQUEST)
 
 
+def _delta_event_json(event, data):
+    """Return an event with delta data encoded as JSON."""
+    return json.dumps({
+        'event_type': event.event_type,
+        'data': data,
+        'origin': str(event.origin),
+        'time_fired': event.time_fired,
+    }, cls=JSONEncoder)
+
+
+def _json_response(body):
+    """Return a response with a body already encoded as JSON."""
+    return web.Response(
+        body=body.encode('UTF-8'), content_type=CONTENT_TYPE_JSON)
+
+
 def async_services_json(hass):
     """Generate services data to JSONify."""
     return [{"domain": key, "services": value}
@@ -12,7 +12,7 @@ import voluptuous as vol
 
 from typing import Union, TypeVar, Sequence
 from homeassistant.const import (CONF_HOST, CONF_NAME, ATTR_ENTITY_ID)
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import discovery
 from homeassistant.components.discovery import SERVICE_APPLE_TV
@@ -183,9 +183,8 @@ def async_setup(hass, config):
     if tasks:
         yield from asyncio.wait(tasks, loop=hass.loop)
 
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SCAN, async_service_handler,
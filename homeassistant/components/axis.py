@@ -11,7 +11,7 @@ import os
 import voluptuous as vol
 
 from homeassistant.components.discovery import SERVICE_AXIS
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.const import (ATTR_LOCATION, ATTR_TRIPPED,
                                  CONF_EVENT, CONF_HOST, CONF_INCLUDE,
                                  CONF_NAME, CONF_PASSWORD, CONF_PORT,
@@ -196,8 +196,8 @@ def setup(hass, config):
                 _LOGGER.error("Couldn\'t set up %s", device_config[CONF_NAME])
 
     # Services to communicate with device.
-    descriptions = load_yaml_config_file(
-        os.path.join(os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     def vapix_service(call):
         """Service to send a message."""
@@ -15,12 +15,13 @@ from homeassistant.components.binary_sensor import (
     DEVICE_CLASSES_SCHEMA)
 from homeassistant.const import (
     ATTR_FRIENDLY_NAME, ATTR_ENTITY_ID, CONF_VALUE_TEMPLATE,
-    CONF_SENSORS, CONF_DEVICE_CLASS, EVENT_HOMEASSISTANT_START)
+    CONF_SENSORS, CONF_DEVICE_CLASS, EVENT_HOMEASSISTANT_START, MATCH_ALL)
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.event import (
-    async_track_state_change, async_track_same_state)
+    async_track_state_change, async_track_same_state,
+    async_track_template_result)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,8 +51,7 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
 
     for device, device_config in config[CONF_SENSORS].items():
         value_template = device_config[CONF_VALUE_TEMPLATE]
-        entity_ids = (device_config.get(ATTR_ENTITY_ID) or
-                      value_template.extract_entities())
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
         friendly_name = device_config.get(ATTR_FRIENDLY_NAME, device)
         device_class = device_config.get(CONF_DEVICE_CLASS)
         delay_on = device_config.get(CONF_DELAY_ON)
@@ -98,11 +98,22 @@ class BinarySensorTemplate(BinarySensorDevice):
             """Handle the target device state changes."""
             self.async_check_state()
 
+        @callback
+        def template_bsensor_result_listener(event, info):
+            """Handle state changes the template result depends on."""
+            self.async_check_state()
+
         @callback
         def template_bsensor_startup(event):
             """Update template on startup."""
-            async_track_state_change(
-                self.hass, self._entities, template_bsensor_state_listener)
+            if self._entities is None:
+                # Follow the states the template reads
+                async_track_template_result(
+                    self.hass, self._template,
+                    template_bsensor_result_listener)
+            else:
+                async_track_state_change(
+                    self.hass, self._entities, template_bsensor_state_listener)
 
             self.hass.async_add_job(self.async_check_state)
 
@@ -165,6 +176,8 @@ class BinarySensorTemplate(BinarySensorDevice):
             return
 
         period = self._delay_on if state else self._delay_off
+        # Without entity_id the template is checked on every state change
         async_track_same_state(
-            self.hass, period, set_state, entity_ids=self._entities,
+            self.hass, period, set_state,
+            entity_ids=self._entities or MATCH_ALL,
             async_check_same_func=lambda *args: self._async_render() == state)
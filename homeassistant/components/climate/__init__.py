@@ -12,7 +12,7 @@ import functools as ft
 
 import voluptuous as vol
 
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.temperature import display_temp as show_temp
 from homeassistant.util.temperature import convert as convert_temperature
@@ -227,9 +227,8 @@ def async_setup(hass, config):
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
     yield from component.async_setup(config)
 
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file,
-        os.path.join(os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     @asyncio.coroutine
     def async_away_mode_set_service(service):
@@ -238,19 +237,13 @@ def async_setup(hass, config):
 
         away_mode = service.data.get(ATTR_AWAY_MODE)
 
-        update_tasks = []
-        for climate in target_climate:
-            if away_mode:
-                yield from climate.async_turn_away_mode_on()
-            else:
-                yield from climate.async_turn_away_mode_off()
+        if away_mode:
+            method = 'async_turn_away_mode_on'
+        else:
+            method = 'async_turn_away_mode_off'
 
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate, lambda climate: getattr(climate, method)())
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AWAY_MODE, async_away_mode_set_service,
@@ -264,16 +257,9 @@ def async_setup(hass, config):
 
         hold_mode = service.data.get(ATTR_HOLD_MODE)
 
-        update_tasks = []
-        for climate in target_climate:
-            yield from climate.async_set_hold_mode(hold_mode)
-
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate,
+            lambda climate: climate.async_set_hold_mode(hold_mode))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_HOLD_MODE, async_hold_mode_set_service,
@@ -287,19 +273,13 @@ def async_setup(hass, config):
 
         aux_heat = service.data.get(ATTR_AUX_HEAT)
 
-        update_tasks = []
-        for climate in target_climate:
-            if aux_heat:
-                yield from climate.async_turn_aux_heat_on()
-            else:
-                yield from climate.async_turn_aux_heat_off()
+        if aux_heat:
+            method = 'async_turn_aux_heat_on'
+        else:
+            method = 'async_turn_aux_heat_off'
 
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate, lambda climate: getattr(climate, method)())
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AUX_HEAT, async_aux_heat_set_service,
@@ -311,8 +291,8 @@ def async_setup(hass, config):
         """Set temperature on the target climate devices."""
         target_climate = component.async_extract_from_service(service)
 
-        update_tasks = []
-        for climate in target_climate:
+        def async_set_temperature(climate):
+            """Set the temperature in the unit of the climate device."""
             kwargs = {}
             for value, temp in service.data.items():
                 if value in CONVERTIBLE_ATTRIBUTE:
@@ -324,14 +304,10 @@ def async_setup(hass, config):
                 else:
                     kwargs[value] = temp
 
-            yield from climate.async_set_temperature(**kwargs)
-
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
+            return climate.async_set_temperature(**kwargs)
 
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate, async_set_temperature)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_TEMPERATURE, async_temperature_set_service,
@@ -345,15 +321,9 @@ def async_setup(hass, config):
 
         humidity = service.data.get(ATTR_HUMIDITY)
 
-        update_tasks = []
-        for climate in target_climate:
-            yield from climate.async_set_humidity(humidity)
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate,
+            lambda climate: climate.async_set_humidity(humidity))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_HUMIDITY, async_humidity_set_service,
@@ -367,15 +337,8 @@ def async_setup(hass, config):
 
         fan = service.data.get(ATTR_FAN_MODE)
 
-        update_tasks = []
-        for climate in target_climate:
-            yield from climate.async_set_fan_mode(fan)
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate, lambda climate: climate.async_set_fan_mode(fan))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_FAN_MODE, async_fan_mode_set_service,
@@ -389,15 +352,9 @@ def async_setup(hass, config):
 
         operation_mode = service.data.get(ATTR_OPERATION_MODE)
 
-        update_tasks = []
-        for climate in target_climate:
-            yield from climate.async_set_operation_mode(operation_mode)
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate,
+            lambda climate: climate.async_set_operation_mode(operation_mode))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_OPERATION_MODE, async_operation_set_service,
@@ -411,15 +368,9 @@ def async_setup(hass, config):
 
         swing_mode = service.data.get(ATTR_SWING_MODE)
 
-        update_tasks = []
-        for climate in target_climate:
-            yield from climate.async_set_swing_mode(swing_mode)
-            if not climate.should_poll:
-                continue
-            update_tasks.append(climate.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_climate,
+            lambda climate: climate.async_set_swing_mode(swing_mode))
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_SWING_MODE, async_swing_set_service,
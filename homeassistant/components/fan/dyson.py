@@ -13,7 +13,7 @@ from homeassistant.components.fan import (FanEntity, SUPPORT_OSCILLATE,
                                           DOMAIN)
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.components.dyson import DYSON_DEVICES
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 
 DEPENDENCIES = ['dyson']
 
@@ -44,8 +44,8 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
 
     add_devices(hass.data[DYSON_FAN_DEVICES])
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
 
     def service_handle(service):
         """Handle dyson services."""
@@ -19,7 +19,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant  # NOQA
 from typing import Dict, Any  # NOQA
 
-from homeassistant import config as conf_util
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import bind_hass
@@ -68,10 +68,8 @@ def async_setup(hass: HomeAssistant, yaml_config: Dict[str, Any]):
     agent_user_id = config.get(CONF_AGENT_USER_ID)
     api_key = config.get(CONF_API_KEY)
     if api_key is not None:
-        descriptions = yield from hass.async_add_job(
-            conf_util.load_yaml_config_file, os.path.join(
-                os.path.dirname(__file__), 'services.yaml')
-        )
+        descriptions = lazy_descriptions(os.path.join(
+            os.path.dirname(__file__), 'services.yaml'))
     hass.http.register_view(GoogleAssistantAuthView(hass, config))
     hass.http.register_view(GoogleAssistantView(hass, config))
 
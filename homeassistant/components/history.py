@@ -8,18 +8,25 @@ import asyncio
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
+import json
 import logging
+import threading
 import time
 
+from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.const import (
-    HTTP_BAD_REQUEST, CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE)
+    HTTP_BAD_REQUEST, CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE,
+    CONTENT_TYPE_JSON)
+from homeassistant.core import State, split_entity_id
 import homeassistant.util.dt as dt_util
 from homeassistant.components import recorder, script
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import ATTR_HIDDEN
 from homeassistant.components.recorder.util import session_scope, execute
+from homeassistant.remote import JSONEncoder
+from homeassistant.util.async import run_coroutine_threadsafe
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +40,11 @@ CONFIG_SCHEMA = vol.Schema({
 SIGNIFICANT_DOMAINS = ('thermostat', 'climate')
 IGNORE_DOMAINS = ('zone', 'scene',)
 
+# Number of rows fetched from the cursor at once when streaming
+STREAM_YIELD_PER = 1000
+# Number of serialized entity chunks buffered for a streaming response
+STREAM_QUEUE_SIZE = 10
+
 
 def last_recorder_run(hass):
     """Retrieve the last closed recorder run from the database."""
@@ -57,20 +69,19 @@ def get_significant_states(hass, start_time, end_time=None, entity_ids=None,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
     """
+    cached = _get_cached_significant_states(
+        hass, start_time, end_time, entity_ids, filters,
+        include_start_time_state)
+
+    if cached is not None:
+        return cached
+
     timer_start = time.perf_counter()
     from homeassistant.components.recorder.models import States
 
     with session_scope(hass=hass) as session:
-        query = session.query(States).filter(
-            (States.domain.in_(SIGNIFICANT_DOMAINS) |
-             (States.last_changed == States.last_updated)) &
-            (States.last_updated > start_time))
-
-        if filters:
-            query = filters.apply(query, entity_ids)
-
-        if end_time is not None:
-            query = query.filter(States.last_updated < end_time)
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters)
 
         query = query.order_by(States.last_updated)
 
@@ -89,6 +100,144 @@ def get_significant_states(hass, start_time, end_time=None, entity_ids=None,
         include_start_time_state)
 
 
+def _get_cached_significant_states(hass, start_time, end_time, entity_ids,
+                                   filters, include_start_time_state):
+    """Return significant states from the recorder cache.
+
+    Returns None if the cache does not cover the period.
+    """
+    cache = hass.data[recorder.DATA_INSTANCE].cache
+    # Like the query, only filters restrict the changes to entity_ids
+    cached = cache.states_during(
+        start_time, end_time, entity_ids if filters else None)
+
+    if cached is None:
+        _LOGGER.debug('History cache miss (%d hits, %d misses)',
+                      cache.hits, cache.misses)
+        return None
+
+    start_states, states = cached
+    result = defaultdict(list)
+
+    if include_start_time_state:
+        for entity_id, state in start_states.items():
+            if filters:
+                match = filters.matches(entity_id, entity_ids)
+            else:
+                match = entity_ids is None or entity_id in entity_ids
+            if (not match or state.domain in IGNORE_DOMAINS or
+                    state.attributes.get(ATTR_HIDDEN, False)):
+                continue
+            result[entity_id].append(State(
+                entity_id, state.state, state.attributes, start_time,
+                start_time))
+
+    for state in states:
+        if filters and not filters.matches(state.entity_id, entity_ids):
+            continue
+        if ((state.domain in SIGNIFICANT_DOMAINS or
+             state.last_changed == state.last_updated) and
+                _is_significant(state) and
+                not state.attributes.get(ATTR_HIDDEN, False)):
+            result[state.entity_id].append(state)
+
+    _LOGGER.debug('History cache hit (%d hits, %d misses)',
+                  cache.hits, cache.misses)
+
+    return result
+
+
+def stream_significant_states(hass, start_time, end_time=None,
+                              entity_ids=None, filters=None,
+                              include_start_time_state=True):
+    """Yield the significant states of each entity as they are read.
+
+    Yields tuples of an entity id with the list of its states, in the same
+    form get_significant_states returns them. The rows are read from the
+    cursor ordered by entity, so only one entity is held in memory at once.
+    """
+    from homeassistant.components.recorder.models import States
+
+    start_states = {}
+    if include_start_time_state:
+        for state in get_states(hass, start_time, entity_ids,
+                                filters=filters):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_states[state.entity_id] = state
+
+    with session_scope(hass=hass) as session:
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters)
+
+        query = query.order_by(
+            States.entity_id, States.last_updated).yield_per(
+                STREAM_YIELD_PER)
+
+        states = (
+            state for state in (row.to_native() for row in query)
+            if (state is not None and _is_significant(state) and
+                not state.attributes.get(ATTR_HIDDEN, False)))
+
+        for entity_id, group in groupby(
+                states, lambda state: state.entity_id):
+            entity_states = list(group)
+            start_state = start_states.pop(entity_id, None)
+            if start_state is not None:
+                entity_states.insert(0, start_state)
+            yield entity_id, entity_states
+
+    for entity_id in sorted(start_states):
+        yield entity_id, [start_states[entity_id]]
+
+
+def _significant_states_query(session, start_time, end_time, entity_ids,
+                              filters):
+    """Return the query for significant states, without ordering."""
+    from homeassistant.components.recorder.models import States
+
+    query = session.query(States).filter(
+        (States.domain.in_(SIGNIFICANT_DOMAINS) |
+         (States.last_changed == States.last_updated)) &
+        (States.last_updated > start_time))
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+
+    return query
+
+
+def states_to_minimal_json(entity_id, states):
+    """Encode the states of an entity as parallel arrays.
+
+    Timestamps are UNIX timestamps of the last change. Attributes are None
+    when they did not change compared to the previous state.
+    """
+    last_changed = []
+    values = []
+    attributes = []
+    previous_attributes = None
+
+    for state in states:
+        last_changed.append(dt_util.as_timestamp(state.last_changed))
+        values.append(state.state)
+        if state.attributes == previous_attributes:
+            attributes.append(None)
+        else:
+            attributes.append(dict(state.attributes))
+            previous_attributes = state.attributes
+
+    return {
+        'entity_id': entity_id,
+        'last_changed': last_changed,
+        'state': values,
+        'attributes': attributes,
+    }
+
+
 def state_changes_during_period(hass, start_time, end_time=None,
                                 entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
@@ -155,8 +304,9 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None,
             )
 
             if entity_ids:
-                most_recent_states_by_date.filter(
-                    States.entity_id.in_(entity_ids))
+                most_recent_states_by_date = \
+                    most_recent_states_by_date.filter(
+                        States.entity_id.in_(entity_ids))
 
             most_recent_states_by_date = most_recent_states_by_date.group_by(
                 States.entity_id)
@@ -295,16 +445,94 @@ class HistoryPeriodView(HomeAssistantView):
         if entity_ids:
             entity_ids = entity_ids.lower().split(',')
         include_start_time_state = 'skip_initial_state' not in request.query
+        minimal_response = 'minimal_response' in request.query
+
+        if 'stream' in request.query:
+            return (yield from self._async_stream(
+                request, start_time, end_time, entity_ids,
+                include_start_time_state, minimal_response))
 
         result = yield from request.app['hass'].async_add_job(
             get_significant_states, request.app['hass'], start_time, end_time,
             entity_ids, self.filters, include_start_time_state)
-        result = result.values()
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
             _LOGGER.debug(
-                'Extracted %d states in %fs', sum(map(len, result)), elapsed)
-        return self.json(result)
+                'Extracted %d states in %fs',
+                sum(map(len, result.values())), elapsed)
+
+        if minimal_response:
+            return self.json([
+                states_to_minimal_json(entity_id, states)
+                for entity_id, states in result.items()])
+
+        return self.json(list(result.values()))
+
+    @asyncio.coroutine
+    def _async_stream(self, request, start_time, end_time, entity_ids,
+                      include_start_time_state, minimal_response):
+        """Stream the history as a JSON list, one entity at a time."""
+        hass = request.app['hass']
+        to_write = asyncio.Queue(STREAM_QUEUE_SIZE, loop=hass.loop)
+        stop_obj = object()
+        cancelled = threading.Event()
+
+        def produce():
+            """Read the states and hand serialized chunks to the loop."""
+            try:
+                for entity_id, states in stream_significant_states(
+                        hass, start_time, end_time, entity_ids,
+                        self.filters, include_start_time_state):
+                    if cancelled.is_set():
+                        return
+                    if minimal_response:
+                        states = states_to_minimal_json(entity_id, states)
+                    chunk = json.dumps(
+                        states, sort_keys=True, cls=JSONEncoder)
+                    run_coroutine_threadsafe(
+                        to_write.put(chunk.encode('UTF-8')), hass.loop
+                    ).result()
+            except Exception as err:  # pylint: disable=broad-except
+                # Hand the error to the loop to abort the response
+                run_coroutine_threadsafe(
+                    to_write.put(err), hass.loop).result()
+            finally:
+                run_coroutine_threadsafe(
+                    to_write.put(stop_obj), hass.loop).result()
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        yield from response.prepare(request)
+
+        hass.async_add_job(produce)
+        chunk = None
+
+        try:
+            separator = b'['
+            while True:
+                chunk = yield from to_write.get()
+                if chunk is stop_obj:
+                    break
+                if isinstance(chunk, Exception):
+                    _LOGGER.error("Error streaming history: %s", chunk)
+                    # Close the connection before the list is complete, so
+                    # the client does not take a partial history as valid
+                    request.transport.close()
+                    return response
+                response.write(separator + chunk)
+                separator = b','
+                yield from response.drain()
+
+            response.write(b'[]' if separator == b'[' else b']')
+            yield from response.write_eof()
+        finally:
+            if chunk is not stop_obj:
+                # Let the producer finish when the client went away
+                cancelled.set()
+                while (yield from to_write.get()) is not stop_obj:
+                    pass
+
+        return response
 
 
 class Filters(object):
@@ -366,6 +594,45 @@ class Filters(object):
             query = query.filter(~States.entity_id.in_(self.excluded_entities))
         return query
 
+    def matches(self, entity_id, entity_ids=None):
+        """Return if an entity passes the filters, in the same way as apply.
+
+        Used for states that are not read from the database.
+        """
+        # specific entities requested - do not in/exclude anything
+        if entity_ids is not None:
+            return entity_id in entity_ids
+
+        domain = split_entity_id(entity_id)[0]
+        if domain in IGNORE_DOMAINS:
+            return False
+
+        match = True
+        # filter if only excluded domain is configured
+        if self.excluded_domains and not self.included_domains:
+            match = domain not in self.excluded_domains
+            if self.included_entities:
+                match = match and entity_id in self.included_entities
+        # filter if only included domain is configured
+        elif not self.excluded_domains and self.included_domains:
+            match = domain in self.included_domains
+            if self.included_entities:
+                match = match or entity_id in self.included_entities
+        # filter if included and excluded domain is configured
+        elif self.excluded_domains and self.included_domains:
+            match = domain not in self.excluded_domains
+            if self.included_entities:
+                match = match and (domain in self.included_domains or
+                                   entity_id in self.included_entities)
+            else:
+                match = match and domain in self.included_domains
+        # no domain filter just included entities
+        elif not self.excluded_domains and not self.included_domains and \
+                self.included_entities:
+            match = entity_id in self.included_entities
+        # finally apply excluded entities filter if configured
+        return match and entity_id not in self.excluded_entities
+
 
 def _is_significant(state):
     """Test if state is significant for history charts.
@@ -19,7 +19,7 @@ from homeassistant.const import (
 from homeassistant.helpers import discovery
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import track_time_interval
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 
 REQUIREMENTS = ['pyhomematic==0.1.34']
 
@@ -299,8 +299,8 @@ def setup(hass, config):
             hass, homematic, hub_data[CONF_NAME], hub_data[CONF_VARIABLES]))
 
     # Register HomeMatic services
-    descriptions = load_yaml_config_file(
-        os.path.join(os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     def _hm_service_virtualkey(service):
         """Service to handle virtualkey servicecalls."""
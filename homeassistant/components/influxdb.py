@@ -4,14 +4,18 @@ A component which allows you to send data to an Influx database.
 For more details about this component, please refer to the documentation at
 https://home-assistant.io/components/influxdb/
 """
+from datetime import timedelta
 import logging
+import queue
 import re
+import threading
 
 import requests.exceptions
 import voluptuous as vol
 
 from homeassistant.const import (
-    EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN, CONF_HOST,
+    EVENT_STATE_CHANGED, EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE,
+    STATE_UNKNOWN, CONF_HOST,
     CONF_PORT, CONF_SSL, CONF_VERIFY_SSL, CONF_USERNAME, CONF_PASSWORD,
     CONF_EXCLUDE, CONF_INCLUDE, CONF_DOMAINS, CONF_ENTITIES)
 from homeassistant.helpers import state as state_helper
@@ -30,12 +34,24 @@ CONF_TAGS_ATTRIBUTES = 'tags_attributes'
 CONF_COMPONENT_CONFIG = 'component_config'
 CONF_COMPONENT_CONFIG_GLOB = 'component_config_glob'
 CONF_COMPONENT_CONFIG_DOMAIN = 'component_config_domain'
+CONF_MAX_BATCH_SIZE = 'max_batch_size'
+CONF_FLUSH_INTERVAL = 'flush_interval'
 
 DEFAULT_DATABASE = 'home_assistant'
 DEFAULT_VERIFY_SSL = True
+DEFAULT_MAX_BATCH_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = timedelta(seconds=1)
 DOMAIN = 'influxdb'
 TIMEOUT = 5
 
+# Points queued while InfluxDB is slow, later points are dropped
+QUEUE_MAX_SIZE = 10000
+# Failed writes are retried this often, waiting twice as long every time
+RETRY_COUNT = 3
+RETRY_DELAY = 1
+# Seconds to wait for the queued points to be written when stopping
+SHUTDOWN_TIMEOUT = 30
+
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema({
     vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
 })
@@ -71,6 +87,10 @@ CONFIG_SCHEMA = vol.Schema({
             vol.Schema({cv.string: COMPONENT_CONFIG_SCHEMA_ENTRY}),
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}):
             vol.Schema({cv.string: COMPONENT_CONFIG_SCHEMA_ENTRY}),
+        vol.Optional(CONF_MAX_BATCH_SIZE, default=DEFAULT_MAX_BATCH_SIZE):
+            cv.positive_int,
+        vol.Optional(CONF_FLUSH_INTERVAL, default=DEFAULT_FLUSH_INTERVAL):
+            cv.time_period,
     }),
 }, extra=vol.ALLOW_EXTRA)
 
@@ -131,6 +151,11 @@ def setup(hass, config):
                       "READ/WRITE.", exc)
         return False
 
+    writer = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, max(conf[CONF_MAX_BATCH_SIZE], 1),
+        conf[CONF_FLUSH_INTERVAL])
+    writer.start()
+
     def influx_event_listener(event):
         """Listen for new messages on the bus and sends them to Influx."""
         state = event.data.get('new_state')
@@ -213,11 +238,164 @@ def setup(hass, config):
 
         json_body[0]['tags'].update(tags)
 
-        try:
-            influx.write_points(json_body)
-        except exceptions.InfluxDBClientError:
-            _LOGGER.exception("Error saving event %s to InfluxDB", json_body)
+        writer.put(json_body[0])
 
     hass.bus.listen(EVENT_STATE_CHANGED, influx_event_listener)
 
     return True
+
+
+class InfluxThread(threading.Thread):
+    """Write the points to InfluxDB in batches.
+
+    Points are written as soon as the previous write is done, together with
+    the points that were queued in the meantime. After a batch that was not
+    full the thread waits flush_interval for more points to be queued.
+    """
+
+    def __init__(self, hass, influx, max_batch_size, flush_interval):
+        """Initialize the writer."""
+        threading.Thread.__init__(self, name='InfluxDB', daemon=True)
+        self.influx = influx
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval.total_seconds()
+        self.queue = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+        self.written = self.failed = self.dropped = 0
+        self._dropping = False
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, self.shutdown)
+
+    def put(self, point):
+        """Queue a point, or drop it when the queue is full."""
+        try:
+            self.queue.put_nowait(point)
+        except queue.Full:
+            self.dropped += 1
+            if not self._dropping:
+                self._dropping = True
+                _LOGGER.warning("InfluxDB queue is full, dropping points")
+
+    def shutdown(self, event):
+        """Write the queued points and stop the thread."""
+        self._stopping.set()
+        self._wake.set()
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            # The thread stops by itself once the queue is empty
+            pass
+        self.join(SHUTDOWN_TIMEOUT)
+        if self.is_alive():
+            _LOGGER.warning("InfluxDB writes did not finish within %ds",
+                            SHUTDOWN_TIMEOUT)
+
+    def block_till_done(self):
+        """Write the queued points now and block till they are written."""
+        self._wake.set()
+        self.queue.join()
+
+    def get_points(self):
+        """Return the queued points, the items taken and if to stop.
+
+        Blocks till at least one item is queued, unless stopping.
+        """
+        points = []
+        if self._stopping.is_set():
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return points, 0, True
+        else:
+            item = self.queue.get()
+        count = 1
+
+        while item is not None:
+            points.append(item)
+            if len(points) >= self.max_batch_size:
+                break
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+
+        return points, count, item is None
+
+    def write(self, points):
+        """Write points to InfluxDB, retrying when it is not reachable.
+
+        Returns False when the points could not be written.
+        """
+        from influxdb import exceptions
+
+        if not points:
+            return True
+
+        for retry in range(RETRY_COUNT + 1):
+            try:
+                self.influx.write_points(points)
+                self.written += len(points)
+                self._dropping = False
+                return True
+            except exceptions.InfluxDBServerError as err:
+                error = err
+            except exceptions.InfluxDBClientError:
+                # Retrying will not help when InfluxDB rejects the points
+                _LOGGER.exception("Error saving %d points to InfluxDB: %s",
+                                  len(points), points)
+                break
+            except requests.exceptions.RequestException as err:
+                error = err
+
+            if retry == RETRY_COUNT or self._stopping.is_set():
+                _LOGGER.error("Error saving %d points to InfluxDB: %s",
+                              len(points), error)
+                break
+
+            delay = RETRY_DELAY * 2 ** retry
+            _LOGGER.warning("Unable to write to InfluxDB, retrying in %ds: "
+                            "%s", delay, error)
+            self._stopping.wait(delay)
+
+        self.failed += len(points)
+        return False
+
+    def drop_queued(self):
+        """Discard the queued points, counting them as failed."""
+        count = 0
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.queue.task_done()
+            if item is not None:
+                count += 1
+
+        if count:
+            self.failed += count
+            _LOGGER.error("Discarded %d queued points for InfluxDB", count)
+
+    def run(self):
+        """Write the queued points till the thread is stopped."""
+        while True:
+            points, count, stop = self.get_points()
+            written = self.write(points)
+
+            for _ in range(count):
+                self.queue.task_done()
+
+            if stop:
+                return
+
+            if not written and self._stopping.is_set():
+                # Do not hold up the shutdown for an unreachable InfluxDB
+                self.drop_queued()
+                return
+
+            if len(points) < self.max_batch_size:
+                # Give more points the time to be queued
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
@@ -15,7 +15,7 @@ import voluptuous as vol
 from homeassistant.core import callback
 from homeassistant.loader import bind_hass
 from homeassistant.components import group
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.const import (
     STATE_ON, SERVICE_TURN_ON, SERVICE_TURN_OFF, SERVICE_TOGGLE,
     ATTR_ENTITY_ID)
@@ -265,26 +265,19 @@ def async_setup(hass, config):
 
         preprocess_turn_on_alternatives(params)
 
-        update_tasks = []
-        for light in target_lights:
-            if service.service == SERVICE_TURN_ON:
-                yield from light.async_turn_on(**params)
-            elif service.service == SERVICE_TURN_OFF:
-                yield from light.async_turn_off(**params)
-            else:
-                yield from light.async_toggle(**params)
+        if service.service == SERVICE_TURN_ON:
+            method = 'async_turn_on'
+        elif service.service == SERVICE_TURN_OFF:
+            method = 'async_turn_off'
+        else:
+            method = 'async_toggle'
 
-            if not light.should_poll:
-                continue
-            update_tasks.append(light.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_lights, lambda light: getattr(light, method)(**params))
 
     # Listen for light on and light off service calls.
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(
         DOMAIN, SERVICE_TURN_ON, async_handle_light_service,
@@ -13,7 +13,7 @@ import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.lock import (DOMAIN, LockDevice, PLATFORM_SCHEMA)
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.const import (
     ATTR_ENTITY_ID, CONF_HOST, CONF_PORT, CONF_TOKEN)
 from homeassistant.helpers.service import extract_entity_ids
@@ -75,8 +75,8 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
             elif service.service == SERVICE_UNLATCH:
                 lock.unlatch()
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
 
     hass.services.register(
         DOMAIN, SERVICE_LOCK_N_GO, service_handler,
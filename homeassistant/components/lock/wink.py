@@ -14,7 +14,7 @@ from homeassistant.components.lock import LockDevice
 from homeassistant.components.wink import WinkDevice, DOMAIN
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import ATTR_ENTITY_ID, STATE_UNKNOWN, ATTR_CODE
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 
 DEPENDENCIES = ['wink']
 
@@ -99,8 +99,8 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
                 code = service.data.get(ATTR_CODE)
                 lock.add_new_key(code, name)
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
 
     hass.services.register(DOMAIN, SERVICE_SET_VACATION_MODE,
                            service_handle,
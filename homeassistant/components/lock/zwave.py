@@ -14,7 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components.lock import DOMAIN, LockDevice
 from homeassistant.components import zwave
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 import homeassistant.helpers.config_validation as cv
 
 _LOGGER = logging.getLogger(__name__)
@@ -126,8 +126,8 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
     yield from zwave.async_setup_platform(
         hass, config, async_add_devices, discovery_info)
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
     network = hass.data[zwave.const.DATA_NETWORK]
 
     def set_usercode(service):
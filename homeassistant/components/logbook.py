@@ -51,6 +51,14 @@ GROUP_BY_MINUTES = 15
 
 CONTINUOUS_DOMAINS = ['proximity', 'sensor']
 
+# Event types that can show up in the logbook
+LOGBOOK_EVENT_TYPES = [
+    EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED,
+    EVENT_LOGBOOK_ENTRY]
+
+# Number of events read from the database at once
+YIELD_PER = 1000
+
 ATTR_NAME = 'name'
 ATTR_MESSAGE = 'message'
 ATTR_DOMAIN = 'domain'
@@ -134,10 +142,9 @@ class LogbookView(HomeAssistantView):
         end_day = start_day + timedelta(days=1)
         hass = request.app['hass']
 
-        events = yield from hass.async_add_job(
-            _get_events, hass, start_day, end_day)
-        events = _exclude_events(events, self.config)
-        return self.json(humanify(events))
+        entries = yield from hass.async_add_job(
+            _get_entries, hass, self.config, start_day, end_day)
+        return self.json(entries)
 
 
 class Entry(object):
@@ -274,22 +281,104 @@ def humanify(events):
                     entity_id)
 
 
-def _get_events(hass, start_day, end_day):
-    """Get events for a period of time."""
-    from homeassistant.components.recorder.models import Events
-    from homeassistant.components.recorder.util import (
-        execute, session_scope)
+def _get_entries(hass, config, start_day, end_day):
+    """Get the logbook entries for a period of time."""
+    events = _get_events(hass, config, start_day, end_day)
+    return list(humanify(_exclude_events(events, config)))
+
+
+def _get_events(hass, config, start_day, end_day):
+    """Yield the events of a period of time that may show up in the logbook.
+
+    Event types, attribute changes and the included and excluded entities
+    are filtered in the query, _exclude_events does the remaining filtering.
+    """
+    from homeassistant.components.recorder.const import DATA_INSTANCE
+    from homeassistant.components.recorder.models import Events, States
+    from homeassistant.components.recorder.util import session_scope
+    from sqlalchemy.orm import contains_eager
+
+    events = hass.data[DATA_INSTANCE].cache.events_during(start_day, end_day)
+    if events is not None:
+        yield from events
+        return
 
     with session_scope(hass=hass) as session:
-        query = session.query(Events).order_by(
-            Events.time_fired).filter(
+        query = session.query(Events).outerjoin(
+            States, Events.event_id == States.event_id).filter(
                 (Events.time_fired > start_day) &
-                (Events.time_fired < end_day))
-        return execute(query)
+                (Events.time_fired < end_day) &
+                Events.event_type.in_(LOGBOOK_EVENT_TYPES))
+
+        query = query.filter(
+            (Events.event_type != EVENT_STATE_CHANGED) |
+            _states_filter(config))
+
+        query = query.order_by(Events.time_fired).options(
+            contains_eager(Events.state))
+
+        for row in query.yield_per(YIELD_PER):
+            event = row.to_native()
+            if event is not None:
+                yield event
+
+
+def _states_filter(config):
+    """Return the query filter for the states worth a logbook entry.
+
+    Mirrors _exclude_events and humanify for what is known without loading
+    the state attributes. Attribute changes of continuous domains are kept
+    as humanify only reports the last state of those per period.
+    """
+    from homeassistant.components.recorder.models import States
+
+    excluded_entities = []
+    excluded_domains = []
+    included_entities = []
+    included_domains = []
+    exclude = config.get(CONF_EXCLUDE)
+    if exclude:
+        excluded_entities = exclude[CONF_ENTITIES]
+        excluded_domains = exclude[CONF_DOMAINS]
+    include = config.get(CONF_INCLUDE)
+    if include:
+        included_entities = include[CONF_ENTITIES]
+        included_domains = include[CONF_DOMAINS]
+
+    filter_query = (
+        (States.last_changed == States.last_updated) |
+        States.domain.in_(CONTINUOUS_DOMAINS))
+
+    # filter if only excluded domains are configured
+    if excluded_domains and not included_domains:
+        domain_query = ~States.domain.in_(excluded_domains)
+        if included_entities:
+            domain_query |= States.entity_id.in_(included_entities)
+        filter_query &= domain_query
+    # filter if only included domains are configured
+    elif not excluded_domains and included_domains:
+        domain_query = States.domain.in_(included_domains)
+        if included_entities:
+            domain_query |= States.entity_id.in_(included_entities)
+        filter_query &= domain_query
+    # filter if included and excluded domains are configured
+    elif excluded_domains and included_domains:
+        domain_query = States.domain.in_(included_domains)
+        if included_entities:
+            domain_query |= States.entity_id.in_(included_entities)
+        filter_query &= ~States.domain.in_(excluded_domains) & domain_query
+    # filter if only included entities are configured
+    elif included_entities:
+        filter_query &= States.entity_id.in_(included_entities)
+
+    if excluded_entities:
+        filter_query &= ~States.entity_id.in_(excluded_entities)
+
+    return filter_query
 
 
 def _exclude_events(events, config):
-    """Get lists of excluded entities and platforms."""
+    """Yield the events that are not excluded from the logbook."""
     excluded_entities = []
     excluded_domains = []
     included_entities = []
@@ -303,7 +392,6 @@ def _exclude_events(events, config):
         included_entities = include[CONF_ENTITIES]
         included_domains = include[CONF_DOMAINS]
 
-    filtered_events = []
     for event in events:
         domain, entity_id = None, None
 
@@ -356,8 +444,7 @@ def _exclude_events(events, config):
             # check if logbook entry is excluded for this entity
             if entity_id in excluded_entities:
                 continue
-        filtered_events.append(event)
-    return filtered_events
+        yield event
 
 
 # pylint: disable=too-many-return-statements
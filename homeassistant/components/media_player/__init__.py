@@ -19,7 +19,7 @@ import async_timeout
 import voluptuous as vol
 
 from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.const import (
     STATE_OFF, STATE_IDLE, STATE_PLAYING, STATE_UNKNOWN, ATTR_ENTITY_ID,
     SERVICE_TOGGLE, SERVICE_TURN_ON, SERVICE_TURN_OFF, SERVICE_VOLUME_UP,
@@ -372,9 +372,8 @@ def async_setup(hass, config):
 
     yield from component.async_setup(config)
 
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     @asyncio.coroutine
     def async_service_handler(service):
@@ -403,15 +402,9 @@ def async_setup(hass, config):
                 service.data.get(ATTR_MEDIA_SHUFFLE)
         target_players = component.async_extract_from_service(service)
 
-        update_tasks = []
-        for player in target_players:
-            yield from getattr(player, method['method'])(**params)
-            if not player.should_poll:
-                continue
-            update_tasks.append(player.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entities(
+            target_players,
+            lambda player: getattr(player, method['method'])(**params))
 
     for service in SERVICE_TO_METHOD:
         schema = SERVICE_TO_METHOD[service].get(
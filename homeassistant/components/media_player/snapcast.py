@@ -18,7 +18,7 @@ from homeassistant.const import (
     STATE_ON, STATE_OFF, STATE_IDLE, STATE_PLAYING, STATE_UNKNOWN, CONF_HOST,
     CONF_PORT, ATTR_ENTITY_ID)
 import homeassistant.helpers.config_validation as cv
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 
 REQUIREMENTS = ['snapcast==2.0.8']
 
@@ -69,8 +69,8 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
             elif service.service == SERVICE_RESTORE:
                 yield from device.async_restore()
 
-    descriptions = load_yaml_config_file(
-        path.join(path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
     hass.services.async_register(
         DOMAIN, SERVICE_SNAPSHOT, _handle_service,
         descriptions.get(SERVICE_SNAPSHOT), schema=SERVICE_SCHEMA)
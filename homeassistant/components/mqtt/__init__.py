@@ -10,14 +10,13 @@ import os
 import socket
 import time
 import ssl
-import re
 import requests.certs
 
 import voluptuous as vol
 
 from homeassistant.core import callback
 from homeassistant.setup import async_prepare_setup_platform
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.helpers import template, config_validation as cv
@@ -37,6 +36,7 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = 'mqtt'
 
 DATA_MQTT = 'mqtt'
+DATA_MQTT_ROUTER = 'mqtt_router'
 
 SERVICE_PUBLISH = 'publish'
 SIGNAL_MQTT_MESSAGE_RECEIVED = 'mqtt_message_received'
@@ -210,29 +210,11 @@ def publish_template(hass, topic, payload_template, qos=None, retain=None):
 def async_subscribe(hass, topic, msg_callback, qos=DEFAULT_QOS,
                     encoding='utf-8'):
     """Subscribe to an MQTT topic."""
-    @callback
-    def async_mqtt_topic_subscriber(dp_topic, dp_payload, dp_qos):
-        """Match subscribed MQTT topic."""
-        if not _match_topic(topic, dp_topic):
-            return
-
-        if encoding is not None:
-            try:
-                payload = dp_payload.decode(encoding)
-                _LOGGER.debug("Received message on %s: %s", dp_topic, payload)
-            except (AttributeError, UnicodeDecodeError):
-                _LOGGER.error("Illegal payload encoding %s from "
-                              "MQTT topic: %s, Payload: %s",
-                              encoding, dp_topic, dp_payload)
-                return
-        else:
-            _LOGGER.debug("Received binary message on %s", dp_topic)
-            payload = dp_payload
-
-        hass.async_run_job(msg_callback, dp_topic, payload, dp_qos)
+    router = hass.data.get(DATA_MQTT_ROUTER)
+    if router is None:
+        router = hass.data[DATA_MQTT_ROUTER] = MQTTRouter(hass)
 
-    async_remove = async_dispatcher_connect(
-        hass, SIGNAL_MQTT_MESSAGE_RECEIVED, async_mqtt_topic_subscriber)
+    async_remove = router.async_add(topic, msg_callback, encoding)
 
     yield from hass.data[DATA_MQTT].async_subscribe(topic, qos)
     return async_remove
@@ -410,9 +392,8 @@ def async_setup(hass, config):
         yield from hass.data[DATA_MQTT].async_publish(
             msg_topic, payload, qos, retain)
 
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(
         DOMAIN, SERVICE_PUBLISH, async_publish_service,
@@ -625,6 +606,128 @@ class MQTT(object):
             tries += 1
 
 
+class _TopicNode(object):
+    """A level of the subscribed topics."""
+
+    __slots__ = ['children', 'subscribers']
+
+    def __init__(self):
+        """Initialize the node."""
+        self.children = {}
+        self.subscribers = []
+
+
+class MQTTRouter(object):
+    """Route received MQTT messages to the subscribers of their topic.
+
+    Subscriptions are kept in a trie with a node per topic level, so a
+    message only visits the nodes matching its topic, including the ``+`` and
+    ``#`` wildcard nodes.
+    """
+
+    def __init__(self, hass):
+        """Initialize the router."""
+        self.hass = hass
+        self._root = _TopicNode()
+        async_dispatcher_connect(
+            hass, SIGNAL_MQTT_MESSAGE_RECEIVED, self.async_route)
+
+    @callback
+    def async_add(self, topic, msg_callback, encoding):
+        """Add a subscriber to a topic.
+
+        Returns a function to remove the subscriber again.
+        """
+        path = [self._root]
+        for level in topic.split('/'):
+            path.append(path[-1].children.setdefault(level, _TopicNode()))
+
+        subscriber = (msg_callback, encoding)
+        path[-1].subscribers.append(subscriber)
+
+        @callback
+        def async_remove():
+            """Remove the subscriber."""
+            try:
+                path[-1].subscribers.remove(subscriber)
+            except ValueError:
+                _LOGGER.warning("Unable to remove unknown subscriber %s",
+                                msg_callback)
+                return
+
+            # Prune the levels nobody subscribes to anymore
+            for parent, level, node in zip(
+                    reversed(path[:-1]), reversed(topic.split('/')),
+                    reversed(path)):
+                if node.subscribers or node.children:
+                    break
+                if parent.children.get(level) is node:
+                    del parent.children[level]
+
+        return async_remove
+
+    def match(self, topic):
+        """Return the subscribers of a topic."""
+        subscribers = []
+        nodes = [self._root]
+
+        for level in topic.split('/'):
+            matching = []
+            for node in nodes:
+                wildcard = node.children.get('#')
+                if wildcard is not None:
+                    subscribers.extend(wildcard.subscribers)
+                for key in (level, '+'):
+                    child = node.children.get(key)
+                    if child is not None:
+                        matching.append(child)
+            nodes = matching
+            if not nodes:
+                return subscribers
+
+        for node in nodes:
+            subscribers.extend(node.subscribers)
+            # A # wildcard also matches the level above it
+            wildcard = node.children.get('#')
+            if wildcard is not None:
+                subscribers.extend(wildcard.subscribers)
+
+        return subscribers
+
+    @callback
+    def async_route(self, topic, payload, qos):
+        """Pass a received message to the subscribers of its topic.
+
+        The payload is decoded once for every encoding subscribers use.
+        """
+        decoded = {}
+
+        for msg_callback, encoding in self.match(topic):
+            if encoding not in decoded:
+                decoded[encoding] = self._decode(topic, payload, encoding)
+
+            if decoded[encoding] is not None:
+                self.hass.async_run_job(
+                    msg_callback, topic, decoded[encoding], qos)
+
+    @staticmethod
+    def _decode(topic, payload, encoding):
+        """Decode a payload, returns None if it is not valid."""
+        if encoding is None:
+            _LOGGER.debug("Received binary message on %s", topic)
+            return payload
+
+        try:
+            decoded = payload.decode(encoding)
+            _LOGGER.debug("Received message on %s: %s", topic, decoded)
+            return decoded
+        except (AttributeError, UnicodeDecodeError):
+            _LOGGER.error("Illegal payload encoding %s from "
+                          "MQTT topic: %s, Payload: %s",
+                          encoding, topic, payload)
+            return None
+
+
 def _raise_on_error(result):
     """Raise error if error result."""
     if result != 0:
@@ -632,24 +735,3 @@ def _raise_on_error(result):
 
         raise HomeAssistantError(
             'Error talking to MQTT: {}'.format(mqtt.error_string(result)))
-
-
-def _match_topic(subscription, topic):
-    """Test if topic matches subscription."""
-    reg_ex_parts = []
-    suffix = ""
-    if subscription.endswith('#'):
-        subscription = subscription[:-2]
-        suffix = "(.*)"
-    sub_parts = subscription.split('/')
-    for sub_part in sub_parts:
-        if sub_part == "+":
-            reg_ex_parts.append(r"([^\/]+)")
-        else:
-            reg_ex_parts.append(re.escape(sub_part))
-
-    reg_ex = "^" + (r'\/'.join(reg_ex_parts)) + suffix + "$"
-
-    reg = re.compile(reg_ex)
-
-    return reg.match(topic) is not None
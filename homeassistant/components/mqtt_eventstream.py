@@ -18,7 +18,6 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL)
 from homeassistant.core import EventOrigin, State
 import homeassistant.helpers.config_validation as cv
-from homeassistant.remote import JSONEncoder
 
 DOMAIN = 'mqtt_eventstream'
 DEPENDENCIES = ['mqtt']
@@ -73,8 +72,8 @@ def async_setup(hass, config):
         if event.event_type == EVENT_SERVICE_EXECUTED:
             return
 
-        event_info = {'event_type': event.event_type, 'event_data': event.data}
-        msg = json.dumps(event_info, cls=JSONEncoder)
+        msg = '{{"event_data": {}, "event_type": {}}}'.format(
+            event.data_as_json(), json.dumps(event.event_type))
         mqtt.async_publish(hass, pub_topic, msg)
 
     # Only listen for local events if you are going to publish them.
@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant.helpers.event import track_state_change
 from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.components.notify import (
     ATTR_TARGET, ATTR_DATA, BaseNotificationService, DOMAIN)
 from homeassistant.const import CONF_NAME, CONF_PLATFORM
@@ -45,8 +46,8 @@ REGISTER_SERVICE_SCHEMA = vol.Schema({
 
 def get_service(hass, config, discovery_info=None):
     """Return push service."""
-    descriptions = load_yaml_config_file(
-        os.path.join(os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     name = config.get(CONF_NAME)
     cert_file = config.get(CONF_CERTFILE)
@@ -14,7 +14,7 @@ from os import path
 import queue
 import threading
 import time
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 
@@ -30,9 +30,10 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
-from homeassistant import config as conf_util
+from homeassistant.helpers.service import lazy_descriptions
 
 from . import purge, migration
+from .cache import DEFAULT_MAX_AGE, RecentCache
 from .const import DATA_INSTANCE
 from .util import session_scope
 
@@ -58,9 +59,16 @@ CONF_DB_URL = 'db_url'
 CONF_PURGE_KEEP_DAYS = 'purge_keep_days'
 CONF_PURGE_INTERVAL = 'purge_interval'
 CONF_EVENT_TYPES = 'event_types'
+CONF_COMMIT_INTERVAL = 'commit_interval'
 
 CONNECT_RETRY_WAIT = 3
 
+DEFAULT_COMMIT_INTERVAL = 1
+MAX_BATCH_SIZE = 1000
+
+# Number of attribute ids kept in memory to deduplicate state attributes
+ATTRIBUTES_CACHE_SIZE = 2048
+
 FILTER_SCHEMA = vol.Schema({
     vol.Optional(CONF_EXCLUDE, default={}): vol.Schema({
         vol.Optional(CONF_ENTITIES, default=[]): cv.entity_ids,
@@ -83,6 +91,8 @@ CONFIG_SCHEMA = vol.Schema({
         vol.Inclusive(CONF_PURGE_INTERVAL, 'purge'):
             vol.All(vol.Coerce(int), vol.Range(min=1)),
         vol.Optional(CONF_DB_URL): cv.string,
+        vol.Optional(CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL):
+            vol.All(vol.Coerce(int), vol.Range(min=0)),
     })
 }, extra=vol.ALLOW_EXTRA)
 
@@ -117,12 +127,30 @@ def run_information(hass, point_in_time: Optional[datetime]=None):
         return res
 
 
+@callback
+def async_recorder_stats(hass):
+    """Return the queue depth and commit latency of the recorder.
+
+    This method must be run in the event loop.
+    """
+    instance = hass.data.get(DATA_INSTANCE)
+    if instance is None:
+        return None
+
+    return {
+        'queue_depth': instance.queue_depth,
+        'commit_latency': instance.commit_latency,
+        'events_dropped': instance.events_dropped,
+    }
+
+
 @asyncio.coroutine
 def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the recorder."""
     conf = config.get(DOMAIN, {})
     keep_days = conf.get(CONF_PURGE_KEEP_DAYS)
     purge_interval = conf.get(CONF_PURGE_INTERVAL)
+    commit_interval = conf.get(CONF_COMMIT_INTERVAL, DEFAULT_COMMIT_INTERVAL)
 
     db_url = conf.get(CONF_DB_URL, None)
     if not db_url:
@@ -133,7 +161,8 @@ def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     exclude = conf.get(CONF_EXCLUDE, {})
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass, keep_days=keep_days, purge_interval=purge_interval,
-        uri=db_url, include=include, exclude=exclude)
+        uri=db_url, include=include, exclude=exclude,
+        commit_interval=commit_interval)
     instance.async_initialize()
     instance.start()
 
@@ -142,9 +171,8 @@ def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         """Handle calls to the purge service."""
         instance.do_adhoc_purge(service.data[ATTR_KEEP_DAYS])
 
-    descriptions = yield from hass.async_add_job(
-        conf_util.load_yaml_config_file, path.join(
-            path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(path.join(
+        path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(DOMAIN, SERVICE_PURGE,
                                  async_handle_purge_service,
@@ -156,19 +184,26 @@ def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 PurgeTask = namedtuple('PurgeTask', ['keep_days'])
 
+# Marks that no queue item was read ahead while collecting a batch
+_NO_ITEM = object()
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
     def __init__(self, hass: HomeAssistant, keep_days: int,
                  purge_interval: int, uri: str,
-                 include: Dict, exclude: Dict) -> None:
+                 include: Dict, exclude: Dict,
+                 commit_interval: int=DEFAULT_COMMIT_INTERVAL) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name='Recorder')
 
         self.hass = hass
         self.keep_days = keep_days
         self.purge_interval = purge_interval
+        self.commit_interval = commit_interval
+        self.commit_latency = None  # type: Optional[float]
+        self.events_dropped = 0
         self.queue = queue.Queue()  # type: Any
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -180,13 +215,30 @@ class Recorder(threading.Thread):
                                              include.get(CONF_ENTITIES, []),
                                              exclude.get(CONF_DOMAINS, []),
                                              exclude.get(CONF_ENTITIES, []))
-        self.exclude_t = exclude.get(CONF_EVENT_TYPES, [])
+        self.exclude_t = set(exclude.get(CONF_EVENT_TYPES, []))
+        max_age = DEFAULT_MAX_AGE
+        if keep_days is not None:
+            # Never answer from the cache what was purged from the database
+            max_age = min(max_age, timedelta(days=keep_days))
+        self.cache = RecentCache(max_age)
 
         self.get_session = None
 
+        # Ids of the latest stored state per entity and of stored attributes
+        self._state_ids = {}
+        self._attributes_ids = OrderedDict()
+
+    @property
+    def queue_depth(self):
+        """Return the number of items waiting to be processed."""
+        return self.queue.qsize()
+
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
+        self.cache.seed(
+            state for state in self.hass.states.async_all()
+            if self.entity_filter(state.entity_id))
         self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
 
     def do_adhoc_purge(self, keep_days):
@@ -196,9 +248,8 @@ class Recorder(threading.Thread):
 
     def run(self):
         """Start processing events to save."""
-        from .models import States, Events
+        from .models import Events
         from homeassistant.components import persistent_notification
-        from sqlalchemy import exc
 
         tries = 1
         connected = False
@@ -287,8 +338,13 @@ class Recorder(threading.Thread):
         if result is shutdown_task:
             return
 
+        next_item = _NO_ITEM
+
         while True:
-            event = self.queue.get()
+            if next_item is _NO_ITEM:
+                event = self.queue.get()
+            else:
+                event, next_item = next_item, _NO_ITEM
 
             if event is None:
                 self._close_run()
@@ -296,54 +352,199 @@ class Recorder(threading.Thread):
                 self.queue.task_done()
                 return
             elif isinstance(event, PurgeTask):
-                purge.purge_old_data(self, event.keep_days)
-                self.queue.task_done()
-                continue
-            elif event.event_type == EVENT_TIME_CHANGED:
-                self.queue.task_done()
-                continue
-            elif event.event_type in self.exclude_t:
+                # Purge in batches, continue after the queued events
+                if not purge.purge_old_data(self, event.keep_days):
+                    self.queue.put(event)
                 self.queue.task_done()
                 continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
-
-            tries = 1
-            updated = False
-            while not updated and tries <= 10:
-                if tries != 1:
-                    time.sleep(CONNECT_RETRY_WAIT)
+            # Collect events until the commit interval passed, the queue ran
+            # dry or the batch is full, then write them in one transaction.
+            batch = [event]
+            deadline = time.monotonic() + self.commit_interval
+
+            while len(batch) < MAX_BATCH_SIZE:
+                wait = deadline - time.monotonic()
                 try:
-                    with session_scope(session=self.get_session()) as session:
-                        dbevent = Events.from_event(event)
-                        session.add(dbevent)
+                    if wait > 0:
+                        item = self.queue.get(timeout=wait)
+                    else:
+                        item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if item is None or isinstance(item, PurgeTask):
+                    next_item = item
+                    break
 
+                batch.append(item)
+
+            self._commit_events(batch)
+
+            for _ in batch:
+                self.queue.task_done()
+
+    def _commit_events(self, events):
+        """Write events and their states in a single transaction."""
+        from .models import Events
+        from sqlalchemy import exc
+
+        tries = 1
+        updated = False
+        start = time.perf_counter()
+
+        while not updated and tries <= 10:
+            if tries != 1:
+                time.sleep(CONNECT_RETRY_WAIT)
+            # Ids assigned in this transaction, only cached after commit
+            state_ids = {}
+            attributes_ids = {}
+
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    for event in events:
                         if event.event_type == EVENT_STATE_CHANGED:
-                            dbstate = States.from_event(event)
-                            dbstate.event_id = dbevent.event_id
-                            session.add(dbstate)
-                    updated = True
+                            self._add_state_changed(
+                                session, event, state_ids, attributes_ids)
+                        else:
+                            session.add(Events.from_event(event))
+                updated = True
+
+            except exc.OperationalError as err:
+                _LOGGER.error("Error in database connectivity: %s. "
+                              "(retrying in %s seconds)", err,
+                              CONNECT_RETRY_WAIT)
+                tries += 1
+
+            except Exception as err:  # pylint: disable=broad-except
+                if len(events) == 1:
+                    _LOGGER.error("Error saving event %s: %s",
+                                  events[0], err)
+                    self.events_dropped += 1
+                    return
+
+                # Only lose the events that cannot be saved
+                _LOGGER.error("Error saving %d events: %s. Saving them "
+                              "one by one", len(events), err)
+                for event in events:
+                    self._commit_events([event])
+                return
+
+        if not updated:
+            _LOGGER.error("Error in database update. Could not save "
+                          "after %d tries. Giving up", tries)
+            self.events_dropped += len(events)
+            return
+
+        for entity_id, state_id in state_ids.items():
+            if state_id is None:
+                self._state_ids.pop(entity_id, None)
+            else:
+                self._state_ids[entity_id] = state_id
 
-                except exc.OperationalError as err:
-                    _LOGGER.error("Error in database connectivity: %s. "
-                                  "(retrying in %s seconds)", err,
-                                  CONNECT_RETRY_WAIT)
-                    tries += 1
+        self._attributes_ids.update(attributes_ids)
+        while len(self._attributes_ids) > ATTRIBUTES_CACHE_SIZE:
+            self._attributes_ids.popitem(last=False)
 
-            if not updated:
-                _LOGGER.error("Error in database update. Could not save "
-                              "after %d tries. Giving up", tries)
+        # Only committed events are cached, the cache mirrors the database
+        for event in events:
+            self.cache.add(event)
 
-            self.queue.task_done()
+        self.commit_latency = time.perf_counter() - start
+        _LOGGER.debug("Committed %d events in %.3fs, %d items queued",
+                      len(events), self.commit_latency, self.queue_depth)
+
+    def _add_state_changed(self, session, event, state_ids, attributes_ids):
+        """Add a state changed event, its state and attributes to session.
+
+        The event only references the stored state, which references the
+        stored old state and the shared attributes.
+        """
+        from .models import States, Events
+
+        entity_id = event.data['entity_id']
+        old_state_id = None
+
+        if event.data.get('old_state') is not None:
+            old_state_id = state_ids.get(
+                entity_id, self._state_ids.get(entity_id))
+
+        dbevent = Events.from_state_changed_event(
+            event, old_state_id is not None)
+        session.add(dbevent)
+        # Flush to get the event_id assigned
+        session.flush()
+
+        dbstate = States.from_event(event)
+        dbstate.event_id = dbevent.event_id
+        dbstate.old_state_id = old_state_id
+        dbstate.attributes_id = self._get_attributes_id(
+            session, dbstate.attributes, attributes_ids)
+        dbstate.attributes = None
+        session.add(dbstate)
+        session.flush()
+
+        if event.data.get('new_state') is None:
+            state_ids[entity_id] = None
+        else:
+            state_ids[entity_id] = dbstate.state_id
+
+    def _get_attributes_id(self, session, shared_attrs, attributes_ids):
+        """Return the id of the stored attributes, storing them if new."""
+        from .models import StateAttributes
+
+        attributes_id = attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            return attributes_id
+
+        attributes_id = self._attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        for row in session.query(
+                StateAttributes.attributes_id,
+                StateAttributes.shared_attrs).filter(
+                    StateAttributes.hash == attr_hash):
+            if row.shared_attrs == shared_attrs:
+                attributes_id = row.attributes_id
+                break
+        else:
+            dbattributes = StateAttributes(
+                hash=attr_hash, shared_attrs=shared_attrs)
+            session.add(dbattributes)
+            session.flush()
+            attributes_id = dbattributes.attributes_id
+
+        attributes_ids[shared_attrs] = attributes_id
+        return attributes_id
+
+    def clear_caches(self):
+        """Forget the ids of stored rows, e.g. after they got purged."""
+        self._state_ids.clear()
+        self._attributes_ids.clear()
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
-        self.queue.put(event)
+        """Listen for new events and put them in the process queue.
+
+        Events that will not be written are dropped here, in the event loop,
+        so they never cross over to the recorder thread.
+        """
+        if self._keep_event(event):
+            self.queue.put(event)
+
+    @callback
+    def _keep_event(self, event):
+        """Return if an event should be written to the database."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+        elif event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
 
     def block_till_done(self):
         """Block till all events processed."""
@@ -364,11 +565,13 @@ class Recorder(threading.Thread):
         # pylint: disable=unused-variable
         @event.listens_for(Engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set sqlite's WAL mode."""
+            """Set sqlite's WAL and auto vacuum mode."""
             if isinstance(dbapi_connection, Connection):
                 old_isolation = dbapi_connection.isolation_level
                 dbapi_connection.isolation_level = None
                 cursor = dbapi_connection.cursor()
+                # Only applies to new databases or after a full VACUUM
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
                 cursor.execute("PRAGMA journal_mode=WAL")
                 cursor.close()
                 dbapi_connection.isolation_level = old_isolation
@@ -0,0 +1,204 @@
+"""In-memory cache of recently recorded events and states."""
+from collections import deque
+from datetime import timedelta
+import threading
+
+import homeassistant.util.dt as dt_util
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+# Events and states older than this are dropped from the cache
+DEFAULT_MAX_AGE = timedelta(hours=25)
+# Maximum number of events kept
+DEFAULT_MAX_EVENTS = 100000
+# Maximum number of states kept for all entities together
+DEFAULT_MAX_STATES = 200000
+# How far the age limit has to move before old states are pruned again
+PRUNE_INTERVAL = timedelta(minutes=1)
+
+
+class RecentCache(object):
+    """Keep the recently recorded events and states in memory.
+
+    The cache is fed with the events the recorder writes, so it holds the
+    same data as the database for the periods since
+    ``events_complete_since`` and ``states_complete_since``. Queries starting
+    before that return None and have to go to the database.
+
+    Events are kept in the order they were fired, states per entity in the
+    order they were set. The first state of every entity is the state it had
+    when the cache became complete.
+
+    Old data is evicted by time, for all entities at once, so an entity that
+    changes often does not make the cache incomplete for the others. When
+    more than max_states states are kept the oldest tenth are evicted.
+
+    Events are added by the recorder thread after they were committed, while
+    queries run in executor threads.
+    """
+
+    def __init__(self, max_age=DEFAULT_MAX_AGE, max_events=DEFAULT_MAX_EVENTS,
+                 max_states=DEFAULT_MAX_STATES):
+        """Initialize the cache."""
+        self.max_age = max_age
+        self.max_events = max_events
+        self.max_states = max_states
+        self.events_complete_since = self.states_complete_since = \
+            dt_util.utcnow()
+        self.hits = 0
+        self.misses = 0
+        self._events = deque()
+        self._states = {}
+        # Number of states in _states and the times of the added states
+        self._state_count = 0
+        self._state_times = deque()
+        self._lock = threading.Lock()
+
+    def seed(self, states):
+        """Add the current states that were set before the cache started."""
+        with self._lock:
+            for state in states:
+                if state.entity_id not in self._states:
+                    self._states[state.entity_id] = deque([state])
+                    self._state_count += 1
+
+    def add(self, event):
+        """Add a recorded event."""
+        with self._lock:
+            self._events.append(event)
+
+            if len(self._events) > self.max_events:
+                self._events.popleft()
+                self.events_complete_since = self._events[0].time_fired
+
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._add_state(event)
+
+            self._prune(event.time_fired - self.max_age)
+
+    def _add_state(self, event):
+        """Add the new state of a state changed event."""
+        entity_id = event.data.get('entity_id')
+        new_state = event.data.get('new_state')
+
+        if new_state is None:
+            # Removals are recorded as an empty state
+            new_state = State(entity_id, '', {}, event.time_fired,
+                              event.time_fired)
+
+        states = self._states.get(entity_id)
+        if states is None:
+            self._states[entity_id] = deque([new_state])
+        else:
+            states.append(new_state)
+
+        self._state_count += 1
+        self._state_times.append(new_state.last_updated)
+
+        if self._state_count > self.max_states:
+            # Evict the oldest tenth at once instead of one state per add
+            times = self._state_times
+            for _ in range(self._state_count - self.max_states +
+                           self.max_states // 10):
+                if len(times) < 2:
+                    break
+                times.popleft()
+            self._prune_states(times[0])
+
+    def _prune(self, cutoff):
+        """Drop events and states from before cutoff."""
+        events = self._events
+        if events and events[0].time_fired < cutoff:
+            while events and events[0].time_fired < cutoff:
+                events.popleft()
+            self.events_complete_since = max(
+                self.events_complete_since, cutoff)
+
+        if cutoff >= self.states_complete_since + PRUNE_INTERVAL:
+            self._prune_states(cutoff)
+
+    def _prune_states(self, cutoff):
+        """Drop the states from before cutoff."""
+        # The last state before the cutoff is kept as state at the cutoff
+        for states in self._states.values():
+            while len(states) > 1 and states[1].last_updated <= cutoff:
+                states.popleft()
+                self._state_count -= 1
+
+        times = self._state_times
+        while times and times[0] < cutoff:
+            times.popleft()
+
+        self.states_complete_since = max(self.states_complete_since, cutoff)
+
+    def events_during(self, start_time, end_time):
+        """Return the events fired between start_time and end_time.
+
+        States in the event data are converted to the dicts they are read
+        back as from the database. Returns None if the cache does
+        not hold all events of the period.
+        """
+        with self._lock:
+            if start_time < self.events_complete_since:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            events = [event for event in self._events
+                      if start_time < event.time_fired < end_time]
+
+        return [_event_as_stored(event) for event in events]
+
+    def states_during(self, start_time, end_time=None, entity_ids=None):
+        """Return the state at start_time and the states set afterwards.
+
+        Returns a tuple with a dict of the state per entity at start_time and
+        a list of the states set between start_time and end_time, ordered by
+        last_updated. Returns None if the cache does not hold all states of
+        the period.
+        """
+        with self._lock:
+            if start_time < self.states_complete_since:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            if entity_ids is None:
+                entity_ids = list(self._states)
+
+            start_states = {}
+            states = []
+
+            for entity_id in entity_ids:
+                for state in self._states.get(entity_id, ()):
+                    if state.last_updated < start_time:
+                        start_states[entity_id] = state
+                    elif end_time is None or state.last_updated < end_time:
+                        if state.last_updated > start_time:
+                            states.append(state)
+                    else:
+                        break
+
+        states.sort(key=lambda state: state.last_updated)
+        return start_states, states
+
+
+def _event_as_stored(event):
+    """Return the event the way it is read back from the database."""
+    if event.event_type != EVENT_STATE_CHANGED:
+        return event
+
+    data = dict(event.data)
+    for key in ('old_state', 'new_state'):
+        state = data.get(key)
+        if isinstance(state, State):
+            data[key] = {
+                'entity_id': state.entity_id,
+                'state': state.state,
+                'attributes': dict(state.attributes),
+                'last_changed': state.last_changed.isoformat(),
+                'last_updated': state.last_updated.isoformat(),
+            }
+
+    return Event(event.event_type, data, event.origin, event.time_fired)
@@ -114,6 +114,37 @@ def _drop_index(engine, table_name, index_name):
                         "critical operation.", index_name, table_name)
 
 
+def _add_columns(engine, table_name, columns_def):
+    """Add columns to a table.
+
+    WARNING: The query string here is generated from the method parameters
+    without sanitizing. DO NOT USE THIS FUNCTION IN ANY OPERATION THAT TAKES
+    USER INPUT.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError, ProgrammingError
+
+    _LOGGER.info("Adding columns %s to table %s. Note: this can take several "
+                 "minutes on large databases and slow computers. Please "
+                 "be patient!", ', '.join(column.split(' ')[0]
+                                          for column in columns_def),
+                 table_name)
+
+    for column_def in columns_def:
+        try:
+            engine.execute(text("ALTER TABLE {table} ADD {column}".format(
+                table=table_name, column=column_def)))
+        except (OperationalError, ProgrammingError) as err:
+            # The column was already added, e.g. by an interrupted upgrade.
+            # SQLite and MySQL report a duplicate column, PostgreSQL raises
+            # a ProgrammingError that it already exists.
+            message = str(err).lower()
+            if 'duplicate' not in message and 'already exists' not in message:
+                raise
+            _LOGGER.warning("Column %s already exists on %s, continuing",
+                            column_def.split(' ')[0], table_name)
+
+
 def _apply_update(engine, new_version, old_version):
     """Perform operations to bring schema up to date."""
     if new_version == 1:
@@ -143,6 +174,17 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id_created")
 
         _create_index(engine, "states", "ix_states_entity_id_last_updated")
+    elif new_version == 5:
+        # Attributes are stored once in the state_attributes table, which is
+        # created together with the other missing tables. Existing rows keep
+        # their inline attributes.
+        _add_columns(engine, "states", [
+            "attributes_id INTEGER",
+            "old_state_id INTEGER",
+        ])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 6:
+        _create_index(engine, "states", "ix_states_event_id")
     else:
         raise ValueError("No schema migration defined for version {}"
                          .format(new_version))
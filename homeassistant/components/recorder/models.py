@@ -2,13 +2,16 @@
 import json
 from datetime import datetime
 import logging
+import zlib
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text,
-    distinct)
+    BigInteger, Boolean, Column, DateTime, ForeignKey, Index, Integer, String,
+    Text, distinct)
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 
 import homeassistant.util.dt as dt_util
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Event, EventOrigin, State, split_entity_id
 from homeassistant.remote import JSONEncoder
 
@@ -16,7 +19,7 @@ from homeassistant.remote import JSONEncoder
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 4
+SCHEMA_VERSION = 6
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,28 +35,89 @@ class Events(Base):  # type: ignore
     time_fired = Column(DateTime(timezone=True), index=True)
     created = Column(DateTime(timezone=True), default=datetime.utcnow)
 
+    # Loaded with the event, see also old_state below States
+    state = relationship('States', uselist=False, lazy='joined')
+
     @staticmethod
     def from_event(event):
         """Create an event database object from a native event."""
         return Events(event_type=event.event_type,
-                      event_data=json.dumps(event.data, cls=JSONEncoder),
+                      event_data=event.data_as_json(),
+                      origin=str(event.origin),
+                      time_fired=event.time_fired)
+
+    @staticmethod
+    def from_state_changed_event(event, old_state_linked):
+        """Create an event database object without the state payloads.
+
+        The states are stored in the states table and reconstructed from the
+        state linked to this event. The old state is only stored in the event
+        data if it is not linked as old state of that state.
+        """
+        data = {'entity_id': event.data['entity_id']}
+        old_state = event.data.get('old_state')
+
+        if event.data.get('new_state') is None:
+            data['new_state'] = None
+        if old_state is None:
+            data['old_state'] = None
+        elif not old_state_linked:
+            data['old_state'] = old_state
+
+        return Events(event_type=event.event_type,
+                      event_data=json.dumps(data, cls=JSONEncoder),
                       origin=str(event.origin),
                       time_fired=event.time_fired)
 
     def to_native(self):
         """Convert to a natve HA Event."""
         try:
-            return Event(
-                self.event_type,
-                json.loads(self.event_data),
-                EventOrigin(self.origin),
-                _process_timestamp(self.time_fired)
-            )
+            data = json.loads(self.event_data)
         except ValueError:
             # When json.loads fails
             _LOGGER.exception("Error converting to event: %s", self)
             return None
 
+        if self.event_type == EVENT_STATE_CHANGED and \
+                self.state is not None:
+            if 'new_state' not in data:
+                data['new_state'] = self.state.to_json_dict()
+            if 'old_state' not in data:
+                data['old_state'] = self.old_state.to_json_dict() \
+                    if self.old_state is not None else None
+
+        return Event(
+            self.event_type,
+            data,
+            EventOrigin(self.origin),
+            _process_timestamp(self.time_fired)
+        )
+
+    def unlink_old_state(self):
+        """Store the linked old state in the event data.
+
+        Used before the old state is purged, so the event keeps it.
+        """
+        data = json.loads(self.event_data)
+        data['old_state'] = self.old_state.to_json_dict() \
+            if self.old_state is not None else None
+        self.event_data = json.dumps(data, cls=JSONEncoder)
+        self.state.old_state_id = None
+
+
+class StateAttributes(Base):   # type: ignore
+    """State attributes shared between states."""
+
+    __tablename__ = 'state_attributes'
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash used to look up serialized attributes."""
+        return zlib.crc32(shared_attrs.encode('utf-8'))
+
 
 class States(Base):   # type: ignore
     """State change history."""
@@ -64,7 +128,11 @@ class States(Base):   # type: ignore
     entity_id = Column(String(255))
     state = Column(String(255))
     attributes = Column(Text)
-    event_id = Column(Integer, ForeignKey('events.event_id'))
+    attributes_id = Column(Integer,
+                           ForeignKey('state_attributes.attributes_id'),
+                           index=True)
+    event_id = Column(Integer, ForeignKey('events.event_id'), index=True)
+    old_state_id = Column(Integer)
     last_changed = Column(DateTime(timezone=True), default=datetime.utcnow)
     last_updated = Column(DateTime(timezone=True), default=datetime.utcnow,
                           index=True)
@@ -76,6 +144,8 @@ class States(Base):   # type: ignore
         Index(
             'ix_states_entity_id_last_updated', 'entity_id', 'last_updated'),)
 
+    state_attributes = relationship(StateAttributes, lazy='joined')
+
     @staticmethod
     def from_event(event):
         """Create object from a state_changed event."""
@@ -94,8 +164,7 @@ class States(Base):   # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes),
-                                            cls=JSONEncoder)
+            dbstate.attributes = state.attributes_as_json()
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -103,10 +172,17 @@ class States(Base):   # type: ignore
 
     def to_native(self):
         """Convert to an HA state object."""
+        if self.attributes is not None:
+            attributes = self.attributes
+        elif self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
+        else:
+            attributes = '{}'
+
         try:
             return State(
                 self.entity_id, self.state,
-                json.loads(self.attributes),
+                json.loads(attributes),
                 _process_timestamp(self.last_changed),
                 _process_timestamp(self.last_updated)
             )
@@ -115,6 +191,31 @@ class States(Base):   # type: ignore
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
+    def to_json_dict(self):
+        """Convert to the dict a state is serialized to in event data."""
+        state = self.to_native()
+
+        if state is None:
+            return None
+
+        return {
+            'entity_id': state.entity_id,
+            'state': state.state,
+            'attributes': dict(state.attributes),
+            'last_changed': state.last_changed.isoformat(),
+            'last_updated': state.last_updated.isoformat(),
+        }
+
+
+# The state replaced by the state of an event, joined through that state.
+# Loaded with the event, so events do not query their states one by one.
+_LINKED_STATES = States.__table__.alias('linked_states')
+Events.old_state = relationship(
+    States, secondary=_LINKED_STATES,
+    primaryjoin=Events.event_id == _LINKED_STATES.c.event_id,
+    secondaryjoin=_LINKED_STATES.c.old_state_id == States.state_id,
+    uselist=False, viewonly=True, lazy='joined')
+
 
 class RecorderRuns(Base):   # type: ignore
     """Representation of recorder run."""
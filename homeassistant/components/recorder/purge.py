@@ -1,6 +1,7 @@
 """Purge old data helper."""
 from datetime import timedelta
 import logging
+import time
 
 import homeassistant.util.dt as dt_util
 
@@ -8,30 +9,149 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of rows deleted per table in one recorder loop iteration,
+# the ids are bound parameters and SQLite before 3.32 allows at most 999
+PURGE_BATCH_SIZE = 999
 
-def purge_old_data(instance, purge_days):
-    """Purge events and states older than purge_days ago."""
+# Value of PRAGMA auto_vacuum for SQLite databases in incremental mode
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+
+
+def purge_old_data(instance, purge_days, batch_size=PURGE_BATCH_SIZE):
+    """Purge a batch of events and states older than purge_days ago.
+
+    Rows are deleted in batches so that the recorder can write new events in
+    between. Returns True when all old data has been purged or the purge
+    failed, which is retried at the next purge.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        return _purge_old_data(instance, purge_days, batch_size)
+    except SQLAlchemyError as err:
+        _LOGGER.error("Error purging history: %s", err)
+        return True
+
+
+def _purge_old_data(instance, purge_days, batch_size):
+    """Purge a batch of old data, see purge_old_data."""
     from .models import States, Events
+
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
 
+    # States reference events, so they have to go first
+    if _purge_batch(instance, States, States.state_id,
+                    States.last_updated < purge_before, batch_size,
+                    _unlink_old_states):
+        # Purged states can no longer be referenced by new states
+        instance.clear_caches()
+        return False
+
+    if _purge_batch(instance, Events, Events.event_id,
+                    Events.time_fired < purge_before, batch_size):
+        return False
+
+    if _purge_unused_attributes(instance, batch_size):
+        return False
+
+    _vacuum(instance)
+    return True
+
+
+def _purge_batch(instance, model, id_column, criterion, batch_size,
+                 before_delete=None):
+    """Delete up to batch_size rows matching criterion.
+
+    before_delete is called with the session and the ids to delete. Returns
+    True if there might be more rows to delete.
+    """
+    start = time.perf_counter()
+
     with session_scope(session=instance.get_session()) as session:
-        deleted_rows = session.query(States) \
-                              .filter((States.last_updated < purge_before)) \
-                              .delete(synchronize_session=False)
-        _LOGGER.debug("Deleted %s states", deleted_rows)
+        ids = [row[0] for row in session.query(id_column)
+               .filter(criterion).limit(batch_size)]
+
+        if not ids:
+            return False
+
+        if before_delete is not None:
+            before_delete(session, ids)
 
-        deleted_rows = session.query(Events) \
-                              .filter((Events.time_fired < purge_before)) \
+        deleted_rows = session.query(model) \
+                              .filter(id_column.in_(ids)) \
                               .delete(synchronize_session=False)
-        _LOGGER.debug("Deleted %s events", deleted_rows)
 
-    # Execute sqlite vacuum command to free up space on disk
+    elapsed = time.perf_counter() - start
+    _LOGGER.debug("Deleted %s %s in %.3fs (%.0f rows/s)",
+                  deleted_rows, model.__tablename__, elapsed,
+                  deleted_rows / elapsed if elapsed else deleted_rows)
+
+    return len(ids) == batch_size
+
+
+def _unlink_old_states(session, state_ids):
+    """Keep the old states of kept events that are about to be purged."""
+    from sqlalchemy.orm import contains_eager
+    from .models import States, Events
+
+    purged = set(state_ids)
+    query = session.query(Events).join(
+        States, Events.event_id == States.event_id).filter(
+            States.old_state_id.in_(state_ids)).options(
+                contains_eager(Events.state))
+
+    for event in query:
+        if event.state.state_id not in purged:
+            event.unlink_old_state()
+
+
+def _purge_unused_attributes(instance, batch_size):
+    """Delete a batch of attributes no longer referenced by a state.
+
+    Returns True if there might be more attributes to delete.
+    """
+    from sqlalchemy import exists
+    from .models import States, StateAttributes
+
+    unused = ~exists().where(
+        States.attributes_id == StateAttributes.attributes_id)
+    more = _purge_batch(instance, StateAttributes,
+                        StateAttributes.attributes_id, unused, batch_size)
+
+    # Cached attribute ids might have been deleted
+    instance.clear_caches()
+    return more
+
+
+def _vacuum(instance):
+    """Free up space on disk after purging on SQLite.
+
+    Databases in incremental auto vacuum mode only release free pages. Others
+    get a full VACUUM, which also switches them to incremental mode as that
+    is requested when connecting.
+    """
     _LOGGER.debug("DB engine driver: %s", instance.engine.driver)
-    if instance.engine.driver == 'pysqlite':
-        from sqlalchemy import exc
+    if instance.engine.driver != 'pysqlite':
+        return
+
+    import sqlite3
+    from sqlalchemy import exc
+
+    try:
+        auto_vacuum = instance.engine.execute(
+            "PRAGMA auto_vacuum").scalar()
 
-        _LOGGER.info("Vacuuming SQLite to free space")
-        try:
+        if auto_vacuum == SQLITE_AUTO_VACUUM_INCREMENTAL:
+            _LOGGER.debug("Releasing free SQLite pages")
+            # A script runs the pragma to completion, a plain execute only
+            # releases a single page.
+            connection = instance.engine.raw_connection()
+            try:
+                connection.executescript("PRAGMA incremental_vacuum")
+            finally:
+                connection.close()
+        else:
+            _LOGGER.info("Vacuuming SQLite to free space")
             instance.engine.execute("VACUUM")
-        except exc.OperationalError as err:
-            _LOGGER.error("Error vacuuming SQLite: %s.", err)
+    except (exc.OperationalError, sqlite3.OperationalError) as err:
+        _LOGGER.error("Error vacuuming SQLite: %s.", err)
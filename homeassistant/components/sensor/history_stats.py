@@ -7,6 +7,8 @@ https://home-assistant.io/components/sensor.history_stats/
 import datetime
 import logging
 import math
+import threading
+from collections import deque
 
 import voluptuous as vol
 
@@ -115,15 +117,34 @@ class HistoryStatsSensor(Entity):
         self.value = 0
         self.count = 0
 
+        # Changes of the tracked entity as (timestamp, in state) tuples,
+        # starting with its state at the start of the period
+        self._changes = deque()
+        # Timestamp from which _changes holds all changes
+        self._history_start = None
+        # Seconds in state and times the state was entered between the
+        # first and the last change
+        self._elapsed = 0
+        self._entered = 0
+        self._lock = threading.Lock()
+
         def force_refresh(*args):
             """Force the component to refresh."""
             self.schedule_update_ha_state(True)
 
+        def state_changed(entity, old_state, new_state):
+            """Record the change of the tracked entity and refresh."""
+            if new_state is not None:
+                with self._lock:
+                    self._add_change(new_state.last_changed.timestamp(),
+                                     new_state.state == self._entity_state)
+            force_refresh()
+
         # Update value when home assistant starts
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, force_refresh)
 
         # Update value when tracked entity changes its state
-        track_state_change(hass, entity_id, force_refresh)
+        track_state_change(hass, entity_id, state_changed)
 
     @property
     def name(self):
@@ -166,10 +187,12 @@ class HistoryStatsSensor(Entity):
         return ICON
 
     def update(self):
-        """Get the latest data and updates the states."""
-        # Get previous values of start and end
-        p_start, p_end = self._period
+        """Get the latest data and updates the states.
 
+        The history of the period is loaded once, after that the changes of
+        the tracked entity are recorded as they happen. The history is only
+        loaded again when the start of the period moves back.
+        """
         # Parse templates
         self.update_period()
         start, end = self._period
@@ -177,62 +200,109 @@ class HistoryStatsSensor(Entity):
         # Convert times to UTC
         start = dt_util.as_utc(start)
         end = dt_util.as_utc(end)
-        p_start = dt_util.as_utc(p_start)
-        p_end = dt_util.as_utc(p_end)
         now = datetime.datetime.now()
 
-        # Compute integer timestamps
+        # Compute timestamps, changes are measured until the exact end
         start_timestamp = math.floor(dt_util.as_timestamp(start))
-        end_timestamp = math.floor(dt_util.as_timestamp(end))
-        p_start_timestamp = math.floor(dt_util.as_timestamp(p_start))
-        p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
-        now_timestamp = math.floor(dt_util.as_timestamp(now))
-
-        # If period has not changed and current time after the period end...
-        if start_timestamp == p_start_timestamp and \
-            end_timestamp == p_end_timestamp and \
-                end_timestamp <= now_timestamp:
-            # Don't compute anything as the value cannot have changed
-            return
+        end_timestamp = dt_util.as_timestamp(end)
+        now_timestamp = dt_util.as_timestamp(now)
+
+        with self._lock:
+            if self._history_start is None or \
+                    start_timestamp < self._history_start:
+                self._load_history(start, end, start_timestamp)
+            else:
+                self._remove_changes_before(start_timestamp)
+
+            elapsed, count = self._measure(min(end_timestamp, now_timestamp))
+
+        # Save value in hours
+        self.value = elapsed / 3600
+
+        # Save counter
+        self.count = count
 
+    def _load_history(self, start, end, start_timestamp):
+        """Load the changes of the tracked entity since start."""
         # Get history between start and end
         history_list = history.state_changes_during_period(
             self.hass, start, end, str(self._entity_id))
 
-        if self._entity_id not in history_list.keys():
-            return
-
         # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = (last_state is not None and
-                      last_state == self._entity_state)
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
-
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
-
+        first_state = history.get_state(self.hass, start, self._entity_id)
+
+        recorded = [change for change in self._changes
+                    if change[0] > start_timestamp]
+        self._changes.clear()
+        self._elapsed = self._entered = 0
+        self._changes.append((start_timestamp, (
+            first_state is not None and
+            first_state.state == self._entity_state)))
+
+        for item in history_list.get(self._entity_id, ()):
+            self._add_change(item.last_changed.timestamp(),
+                             item.state == self._entity_state)
+
+        # Add the changes that happened while the history was recorded
+        for change in recorded:
+            self._add_change(*change)
+
+        self._history_start = start_timestamp
+
+    def _add_change(self, timestamp, in_state):
+        """Add a change of the tracked entity."""
+        if self._changes:
+            last_time, last_state = self._changes[-1]
+            if timestamp < last_time or in_state == last_state:
+                return
             if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
-
-            last_state = current_state
-            last_time = current_time
-
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
+                self._elapsed += timestamp - last_time
+            elif in_state:
+                self._entered += 1
+
+        self._changes.append((timestamp, in_state))
+
+    def _remove_changes_before(self, start_timestamp):
+        """Remove the changes before the new start of the period."""
+        changes = self._changes
+
+        while len(changes) > 1 and changes[1][0] <= start_timestamp:
+            first_time, first_state = changes.popleft()
+            if first_state:
+                self._elapsed -= changes[0][0] - first_time
+            elif changes[0][1]:
+                self._entered -= 1
+
+        first_time, first_state = changes[0]
+        if first_time < start_timestamp:
+            if first_state and len(changes) > 1:
+                self._elapsed -= start_timestamp - first_time
+            changes[0] = (start_timestamp, first_state)
+
+        self._history_start = start_timestamp
+
+    def _measure(self, measure_end):
+        """Return the seconds in state and times entered until measure_end."""
+        changes = self._changes
+        elapsed = self._elapsed
+        count = self._entered
+
+        # Leave out the changes after the end of the measure
+        index = len(changes) - 1
+        while index > 0 and changes[index][0] > measure_end:
+            last_time, last_state = changes[index - 1]
+            if last_state:
+                elapsed -= changes[index][0] - last_time
+            elif changes[index][1]:
+                count -= 1
+            index -= 1
+
+        # Count time elapsed between last change and end of measure
+        last_time, last_state = changes[index]
+        if last_state and measure_end > last_time:
             elapsed += measure_end - last_time
 
-        # Save value in hours
-        self.value = elapsed / 3600
-
-        # Save counter
-        self.count = count
+        return elapsed, count
 
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
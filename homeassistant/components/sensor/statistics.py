@@ -5,8 +5,9 @@ For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/sensor.statistics/
 """
 import asyncio
+import heapq
 import logging
-import statistics
+import math
 from collections import deque
 
 import voluptuous as vol
@@ -65,6 +66,173 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
     return True
 
 
+class RunningStatistics(object):
+    """Statistics of a window of values that are updated incrementally.
+
+    Values are added at the end and removed from the start of the window.
+    The mean and variance are kept with Welford's algorithm and the minimum
+    and maximum with monotonic queues, which take constant time per value.
+    The median is kept with two heaps, a max heap of the lower half and a
+    min heap of the upper half, which take logarithmic time per value.
+    Removed values stay in the heaps until they reach the top, the heaps are
+    rebuilt from the window once per window length.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self.values = deque()
+        self.total = 0.0
+        # The lower half is stored negated, heapq only has min heaps
+        self._low = []
+        self._high = []
+        self._low_size = 0
+        self._high_size = 0
+        self._delayed = {}
+        self._min = deque()
+        self._max = deque()
+        self._added = 0
+        self._removed = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed_since_sync = 0
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return len(self.values)
+
+    def append(self, value):
+        """Add a value at the end of the window."""
+        index = self._added
+        self._added += 1
+        self.values.append(value)
+
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._balance()
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._m2 += delta * (value - self._mean)
+        self.total += value
+
+    def popleft(self):
+        """Remove and return the value at the start of the window."""
+        value = self.values.popleft()
+        index = self._removed
+        self._removed += 1
+
+        # Values equal to the top of the lower half count as in that half
+        self._delayed[value] = self._delayed.get(value, 0) + 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            self._prune(self._high, 1)
+        self._balance()
+
+        if self._min[0][0] == index:
+            self._min.popleft()
+        if self._max[0][0] == index:
+            self._max.popleft()
+
+        count = len(self.values)
+        self._removed_since_sync += 1
+        if count == 0 or self._removed_since_sync >= count:
+            # Removing values accumulates rounding errors, so the sums are
+            # computed again once per window length
+            self._sync()
+        else:
+            delta = value - self._mean
+            self._mean -= delta / count
+            self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+            self.total -= value
+
+        return value
+
+    def _prune(self, heap, sign):
+        """Drop removed values from the top of a median heap."""
+        while heap and self._delayed.get(sign * heap[0]):
+            value = sign * heapq.heappop(heap)
+            self._delayed[value] -= 1
+            if not self._delayed[value]:
+                del self._delayed[value]
+
+    def _balance(self):
+        """Keep the lower half as large as the upper half or one larger."""
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, 1)
+
+    def _rebuild_median(self):
+        """Build the median heaps from the values without removed ones."""
+        ordered = sorted(self.values)
+        middle = (len(ordered) + 1) // 2
+        # Sorted lists are valid heaps
+        self._low = [-value for value in reversed(ordered[:middle])]
+        self._high = ordered[middle:]
+        self._low_size = len(self._low)
+        self._high_size = len(self._high)
+        self._delayed = {}
+
+    def _sync(self):
+        """Compute the running sums from the values."""
+        self._removed_since_sync = 0
+        self._rebuild_median()
+        self.total = math.fsum(self.values)
+        if not self.values:
+            self._mean = self._m2 = 0.0
+            return
+        self._mean = self.total / len(self.values)
+        self._m2 = math.fsum((value - self._mean) ** 2
+                             for value in self.values)
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._max[0][1]
+
+    @property
+    def mean(self):
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance of the values."""
+        return self._m2 / (len(self.values) - 1)
+
+
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
@@ -81,17 +249,21 @@ class StatisticsSensor(Entity):
         self._sampling_size = sampling_size
         self._max_age = max_age
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        self.states = RunningStatistics()
         if self._max_age is not None:
-            self.ages = deque(maxlen=self._sampling_size)
+            self.ages = deque()
 
         self.median = self.mean = self.variance = self.stdev = 0
         self.min = self.max = self.total = self.count = 0
         self.average_change = self.change = 0
 
-        if 'recorder' in self._hass.config.components:
+    @asyncio.coroutine
+    def async_added_to_hass(self):
+        """Load the stored states and track the changes of the entity."""
+        if 'recorder' in self.hass.config.components:
             # only use the database if it's configured
-            hass.async_add_job(self._initzialize_from_database)
+            yield from self._initzialize_from_database()
+            yield from self.async_update()
 
         @callback
         # pylint: disable=invalid-name
@@ -102,20 +274,26 @@ class StatisticsSensor(Entity):
 
             self._add_state_to_queue(new_state)
 
-            hass.async_add_job(self.async_update_ha_state, True)
+            self.hass.async_add_job(self.async_update_ha_state, True)
 
         async_track_state_change(
-            hass, entity_id, async_stats_sensor_state_listener)
+            self.hass, self._entity_id, async_stats_sensor_state_listener)
 
-    def _add_state_to_queue(self, new_state):
+    def _add_state_to_queue(self, new_state, age=None):
+        self.count = self.count + 1
         try:
-            self.states.append(float(new_state.state))
-            if self._max_age is not None:
-                now = dt_util.utcnow()
-                self.ages.append(now)
-            self.count = self.count + 1
+            value = float(new_state.state)
         except ValueError:
-            self.count = self.count + 1
+            return
+
+        if len(self.states) >= self._sampling_size:
+            self.states.popleft()
+            if self._max_age is not None:
+                self.ages.popleft()
+
+        self.states.append(value)
+        if self._max_age is not None:
+            self.ages.append(age or dt_util.utcnow())
 
     @property
     def name(self):
@@ -175,47 +353,63 @@ class StatisticsSensor(Entity):
             self._purge_old()
 
         if not self.is_binary:
-            try:
-                self.mean = round(statistics.mean(self.states), 2)
-                self.median = round(statistics.median(self.states), 2)
-                self.stdev = round(statistics.stdev(self.states), 2)
-                self.variance = round(statistics.variance(self.states), 2)
-            except statistics.StatisticsError as err:
-                _LOGGER.error(err)
+            count = len(self.states)
+            if count > 1:
+                variance = self.states.variance
+                self.mean = round(self.states.mean, 2)
+                self.median = round(self.states.median, 2)
+                self.stdev = round(math.sqrt(variance), 2)
+                self.variance = round(variance, 2)
+            else:
+                _LOGGER.error("Statistics of %s require at least two data "
+                              "points", self._entity_id)
                 self.mean = self.median = STATE_UNKNOWN
                 self.stdev = self.variance = STATE_UNKNOWN
-            if self.states:
-                self.total = round(sum(self.states), 2)
-                self.min = min(self.states)
-                self.max = max(self.states)
-                self.change = self.states[-1] - self.states[0]
+            if count:
+                values = self.states.values
+                self.total = round(self.states.total, 2)
+                self.min = self.states.min
+                self.max = self.states.max
+                self.change = values[-1] - values[0]
                 self.average_change = self.change
-                if len(self.states) > 1:
-                    self.average_change /= len(self.states) - 1
+                if count > 1:
+                    self.average_change /= count - 1
             else:
                 self.min = self.max = self.total = STATE_UNKNOWN
                 self.average_change = self.change = STATE_UNKNOWN
 
     @asyncio.coroutine
     def _initzialize_from_database(self):
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-        """
-        from homeassistant.components.recorder.models import States
+        """Initialize the list of states from the database."""
+        from homeassistant.components.recorder.models import (
+            _process_timestamp)
         _LOGGER.debug("initializing values for %s from the database",
                       self.entity_id)
 
-        with session_scope(hass=self._hass) as session:
-            query = session.query(States)\
-                .filter(States.entity_id == self._entity_id.lower())\
-                .order_by(States.last_updated.desc())\
-                .limit(self._sampling_size)
-            states = execute(query)
+        states = yield from self.hass.async_add_job(self._load_states)
 
         for state in reversed(states):
-            self._add_state_to_queue(state)
+            # Ages have to be aware to compare them with utcnow
+            self._add_state_to_queue(
+                state, _process_timestamp(state.last_updated))
 
         _LOGGER.debug("initializing from database completed")
+
+    def _load_states(self):
+        """Load the last states from the database.
+
+        The query will get the list of states in DESCENDING order so that we
+        can limit the result to self._sample_size, and skips states older
+        than self._max_age.
+        """
+        from homeassistant.components.recorder.models import States
+
+        with session_scope(hass=self.hass) as session:
+            query = session.query(States)\
+                .filter(States.entity_id == self._entity_id.lower())
+            if self._max_age is not None:
+                query = query.filter(
+                    States.last_updated > dt_util.utcnow() - self._max_age)
+            query = query.order_by(States.last_updated.desc())\
+                .limit(self._sampling_size)
+            return execute(query)
@@ -18,7 +18,8 @@ from homeassistant.const import (
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import (
+    async_track_state_change, async_track_template_result)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,8 +48,7 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
         icon_template = device_config.get(CONF_ICON_TEMPLATE)
         entity_picture_template = device_config.get(
             CONF_ENTITY_PICTURE_TEMPLATE)
-        entity_ids = (device_config.get(ATTR_ENTITY_ID) or
-                      state_template.extract_entities())
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
         friendly_name = device_config.get(ATTR_FRIENDLY_NAME, device)
         unit_of_measurement = device_config.get(ATTR_UNIT_OF_MEASUREMENT)
 
@@ -107,11 +107,31 @@ class SensorTemplate(Entity):
             """Handle device state changes."""
             self.async_schedule_update_ha_state(True)
 
+        last_event = None
+
+        @callback
+        def template_sensor_result_listener(event, info):
+            """Handle state changes a template result depends on."""
+            nonlocal last_event
+            # Templates reading the same state share one update
+            if event is not last_event:
+                last_event = event
+                self.async_schedule_update_ha_state(True)
+
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            async_track_state_change(
-                self.hass, self._entities, template_sensor_state_listener)
+            if self._entities is None:
+                # Follow the states all templates of the sensor read
+                for template in (self._template, self._icon_template,
+                                 self._entity_picture_template):
+                    if template is not None:
+                        async_track_template_result(
+                            self.hass, template,
+                            template_sensor_result_listener)
+            else:
+                async_track_state_change(
+                    self.hass, self._entities, template_sensor_state_listener)
 
             self.async_schedule_update_ha_state(True)
 
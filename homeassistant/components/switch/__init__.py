@@ -12,7 +12,7 @@ import os
 import voluptuous as vol
 
 from homeassistant.core import callback
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity import ToggleEntity
@@ -107,25 +107,18 @@ def async_setup(hass, config):
         """Handle calls to the switch services."""
         target_switches = component.async_extract_from_service(service)
 
-        update_tasks = []
-        for switch in target_switches:
-            if service.service == SERVICE_TURN_ON:
-                yield from switch.async_turn_on()
-            elif service.service == SERVICE_TOGGLE:
-                yield from switch.async_toggle()
-            else:
-                yield from switch.async_turn_off()
-
-            if not switch.should_poll:
-                continue
-            update_tasks.append(switch.async_update_ha_state(True))
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
-
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+        if service.service == SERVICE_TURN_ON:
+            method = 'async_turn_on'
+        elif service.service == SERVICE_TOGGLE:
+            method = 'async_toggle'
+        else:
+            method = 'async_turn_off'
+
+        yield from component.async_call_entities(
+            target_switches, lambda switch: getattr(switch, method)())
+
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(
         DOMAIN, SERVICE_TURN_OFF, async_handle_switch_service,
@@ -14,7 +14,7 @@ from collections import deque
 
 import voluptuous as vol
 
-from homeassistant.config import load_yaml_config_file
+from homeassistant.helpers.service import lazy_descriptions
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.http import HomeAssistantView
 
@@ -76,9 +76,8 @@ def async_setup(hass, config):
         # Only one service so far
         handler.records.clear()
 
-    descriptions = yield from hass.async_add_job(
-        load_yaml_config_file, os.path.join(
-            os.path.dirname(__file__), 'services.yaml'))
+    descriptions = lazy_descriptions(os.path.join(
+        os.path.dirname(__file__), 'services.yaml'))
 
     hass.services.async_register(
         DOMAIN, SERVICE_CLEAR, async_service_handler,
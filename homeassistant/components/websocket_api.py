@@ -5,6 +5,7 @@ For more details about this component, please refer to the documentation at
 https://home-assistant.io/developers/websocket_api/
 """
 import asyncio
+from collections import OrderedDict
 from contextlib import suppress
 from functools import partial
 import json
@@ -16,11 +17,12 @@ from voluptuous.humanize import humanize_error
 
 from homeassistant.const import (
     MATCH_ALL, EVENT_TIME_CHANGED, EVENT_HOMEASSISTANT_STOP,
-    __version__)
+    EVENT_STATE_CHANGED, __version__)
 from homeassistant.components import frontend
-from homeassistant.core import callback
+from homeassistant.core import callback, split_entity_id
 from homeassistant.remote import JSONEncoder
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.state import state_changed_delta
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.http.auth import validate_password
 from homeassistant.components.http.const import KEY_AUTHENTICATED
@@ -31,7 +33,13 @@ DOMAIN = 'websocket_api'
 URL = '/api/websocket'
 DEPENDENCIES = ('http',)
 
+DATA_EVENT_HUB = 'websocket_api_event_hub'
+
 MAX_PENDING_MSG = 512
+# Pending messages from which on state changes are coalesced per entity
+COALESCE_PENDING_MSG = 128
+# Direct messages sent before a held back state change, when both wait
+COALESCE_INTERLEAVE = 8
 
 ERR_ID_REUSE = 1
 ERR_INVALID_FORMAT = 2
@@ -66,6 +74,9 @@ SUBSCRIBE_EVENTS_MESSAGE_SCHEMA = vol.Schema({
     vol.Required('id'): cv.positive_int,
     vol.Required('type'): TYPE_SUBSCRIBE_EVENTS,
     vol.Optional('event_type', default=MATCH_ALL): str,
+    vol.Optional('entity_ids'): cv.entity_ids,
+    vol.Optional('domains'): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional('delta', default=False): cv.boolean,
 })
 
 UNSUBSCRIBE_EVENTS_MESSAGE_SCHEMA = vol.Schema({
@@ -145,11 +156,28 @@ def auth_invalid_message(message):
 
 
 def event_message(iden, event):
-    """Return an event message."""
+    """Return an event message encoded as JSON.
+
+    The event itself is encoded once for all connections.
+    """
+    return '{"event": %s, "id": %d, "type": "%s"}' % (
+        event.as_json(), iden, TYPE_EVENT)
+
+
+def delta_event_message(iden, event, last_states):
+    """Return an event message with the state change as delta.
+
+    The diff is relative to the state last sent from last_states.
+    """
     return {
         'id': iden,
         'type': TYPE_EVENT,
-        'event': event.as_dict(),
+        'event': {
+            'event_type': event.event_type,
+            'data': state_changed_delta(event, last_states),
+            'origin': str(event.origin),
+            'time_fired': event.time_fired,
+        },
     }
 
 
@@ -184,6 +212,12 @@ def result_message(iden, result=None):
     }
 
 
+def states_result_message(iden, states):
+    """Return a success result message with states, encoded as JSON."""
+    return '{"id": %d, "result": [%s], "success": true, "type": "%s"}' % (
+        iden, ', '.join(state.as_json() for state in states), TYPE_RESULT)
+
+
 @asyncio.coroutine
 def async_setup(hass, config):
     """Initialize the websocket API."""
@@ -191,6 +225,90 @@ def async_setup(hass, config):
     return True
 
 
+class EventHub(object):
+    """Forward events to the websocket connections subscribed to them.
+
+    The hub listens once per event type on the bus, no matter how many
+    connections subscribed to it.
+    """
+
+    def __init__(self, hass):
+        """Initialize the hub."""
+        self.hass = hass
+        self._subscriptions = {}
+        self._unsub_listeners = {}
+
+    @callback
+    def async_subscribe(self, connection, iden, event_type, entity_ids=None,
+                        domains=None):
+        """Subscribe a connection to an event type.
+
+        If entity_ids or domains are given, only state changes of those
+        entities are forwarded. Returns a function to unsubscribe.
+        """
+        subscription = (connection, iden,
+                        set(entity_ids or ()), set(domains or ()))
+        subscriptions = self._subscriptions.get(event_type)
+
+        if subscriptions is None:
+            subscriptions = self._subscriptions[event_type] = []
+
+            @callback
+            def forward_events(event):
+                """Forward events to the subscribed connections."""
+                self._async_forward(subscriptions, event)
+
+            self._unsub_listeners[event_type] = self.hass.bus.async_listen(
+                event_type, forward_events)
+
+        subscriptions.append(subscription)
+
+        @callback
+        def async_unsubscribe():
+            """Unsubscribe the connection."""
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                del self._subscriptions[event_type]
+                self._unsub_listeners.pop(event_type)()
+
+        return async_unsubscribe
+
+    @callback
+    def _async_forward(self, subscriptions, event):
+        """Forward an event to the matching subscriptions."""
+        # pylint: disable=no-self-use
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        entity_id = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            entity_id = event.data.get('entity_id')
+
+        for connection, iden, entity_ids, domains in list(subscriptions):
+            if entity_id is not None and \
+                    not _entity_matches(entity_id, entity_ids, domains):
+                continue
+
+            connection.send_event_outside(iden, event)
+
+
+def _entity_matches(entity_id, entity_ids, domains):
+    """Return if an entity passes a subscription's entity filter."""
+    if not entity_ids and not domains:
+        return True
+    return entity_id in entity_ids or \
+        split_entity_id(entity_id)[0] in domains
+
+
+@callback
+def _async_get_event_hub(hass):
+    """Return the event hub, set it up if needed."""
+    hub = hass.data.get(DATA_EVENT_HUB)
+    if hub is None:
+        hub = hass.data[DATA_EVENT_HUB] = EventHub(hass)
+    return hub
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -215,6 +333,13 @@ class ActiveConnection:
         self.wsock = None
         self.event_listeners = {}
         self.to_write = asyncio.Queue(maxsize=MAX_PENDING_MSG, loop=hass.loop)
+        # State changes waiting for a congested connection, per entity,
+        # with the number of messages queued before the first of them
+        self._coalesced = OrderedDict()
+        # Number of messages taken from to_write
+        self._dequeued = 0
+        # Last state sent per entity, per delta subscription
+        self._delta_states = {}
         self._handle_task = None
         self._writer_task = None
 
@@ -226,17 +351,45 @@ class ActiveConnection:
         """Print an error message."""
         _LOGGER.error("WS %s: %s %s", id(self.wsock), message1, message2)
 
+    def _coalesced_due(self):
+        """Return if the first held back state change can be sent.
+
+        It is not sent before the messages queued before it, which can hold
+        an older state change of the same entity.
+        """
+        queued_before, _ = next(iter(self._coalesced.values()))
+        return queued_before <= self._dequeued
+
     @asyncio.coroutine
     def _writer(self):
         """Write outgoing messages."""
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, asyncio.CancelledError):
+            direct = 0
             while not self.wsock.closed:
-                message = yield from self.to_write.get()
+                # Held back state changes are interleaved so that they are
+                # not delayed for as long as the queue does not run empty
+                if self._coalesced and \
+                        (self.to_write.empty() or
+                         direct >= COALESCE_INTERLEAVE) and \
+                        self._coalesced_due():
+                    _, (_, message) = self._coalesced.popitem(last=False)
+                    direct = 0
+                else:
+                    message = yield from self.to_write.get()
+                    self._dequeued += 1
+                    direct += 1
                 if message is None:
                     break
+                if callable(message):
+                    # Built when sent, like deltas to the last sent state
+                    message = message()
                 self.debug("Sending", message)
-                yield from self.wsock.send_json(message, dumps=JSON_DUMP)
+                if isinstance(message, str):
+                    # Already encoded
+                    yield from self.wsock.send_str(message)
+                else:
+                    yield from self.wsock.send_json(message, dumps=JSON_DUMP)
 
     @callback
     def send_message_outside(self, message):
@@ -253,6 +406,36 @@ class ActiveConnection:
                            MAX_PENDING_MSG)
             self.cancel()
 
+    @callback
+    def send_event_outside(self, iden, event):
+        """Send an event to the client outside of the main task.
+
+        When the client falls behind, state changes are held back and only
+        the latest state change of each entity is sent.
+
+        Async friendly.
+        """
+        if event.event_type == EVENT_STATE_CHANGED and \
+                iden in self._delta_states:
+            message = partial(delta_event_message, iden, event,
+                              self._delta_states[iden])
+        else:
+            message = event_message(iden, event)
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            key = (iden, event.data.get('entity_id'))
+            # Pending state changes of the entity are replaced, this also
+            # keeps them from being sent after this one
+            if key in self._coalesced:
+                self._coalesced[key] = (self._coalesced[key][0], message)
+                return
+            if self.to_write.qsize() >= COALESCE_PENDING_MSG:
+                self._coalesced[key] = (
+                    self._dequeued + self.to_write.qsize(), message)
+                return
+
+        self.send_message_outside(message)
+
     @callback
     def cancel(self):
         """Cancel the connection."""
@@ -402,19 +585,27 @@ class ActiveConnection:
         Async friendly.
         """
         msg = SUBSCRIBE_EVENTS_MESSAGE_SCHEMA(msg)
+        iden = msg['id']
+        entity_ids = msg.get('entity_ids')
+        domains = msg.get('domains')
 
-        @asyncio.coroutine
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+        self.event_listeners[iden] = _async_get_event_hub(
+            self.hass).async_subscribe(
+                self, iden, msg['event_type'], entity_ids, domains)
 
-            self.send_message_outside(event_message(msg['id'], event))
+        if not msg['delta']:
+            self.to_write.put_nowait(result_message(iden))
+            return
 
-        self.event_listeners[msg['id']] = self.hass.bus.async_listen(
-            msg['event_type'], forward_events)
+        # State changes are sent as diff to the states of the result
+        entity_ids = set(entity_ids or ())
+        domains = set(domains or ())
+        states = [state for state in self.hass.states.async_all()
+                  if _entity_matches(state.entity_id, entity_ids, domains)]
+        self._delta_states[iden] = {
+            state.entity_id: state for state in states}
 
-        self.to_write.put_nowait(result_message(msg['id']))
+        self.to_write.put_nowait(states_result_message(iden, states))
 
     def handle_unsubscribe_events(self, msg):
         """Handle unsubscribe events command.
@@ -427,6 +618,7 @@ class ActiveConnection:
 
         if subscription in self.event_listeners:
             self.event_listeners.pop(subscription)()
+            self._delta_states.pop(subscription, None)
             self.to_write.put_nowait(result_message(msg['id']))
         else:
             self.to_write.put_nowait(error_message(
@@ -456,7 +648,7 @@ class ActiveConnection:
         """
         msg = GET_STATES_MESSAGE_SCHEMA(msg)
 
-        self.to_write.put_nowait(result_message(
+        self.to_write.put_nowait(states_result_message(
             msg['id'], self.hass.states.async_all()))
 
     def handle_get_services(self, msg):
@@ -466,8 +658,14 @@ class ActiveConnection:
         """
         msg = GET_SERVICES_MESSAGE_SCHEMA(msg)
 
-        self.to_write.put_nowait(result_message(
-            msg['id'], self.hass.services.async_services()))
+        @asyncio.coroutine
+        def get_services_helper(msg):
+            """Load the service descriptions and send the services."""
+            yield from self.hass.services.async_load_descriptions()
+            self.send_message_outside(result_message(
+                msg['id'], self.hass.services.async_services()))
+
+        self.hass.async_add_job(get_services_helper(msg))
 
     def handle_get_config(self, msg):
         """Handle get config command.
@@ -387,6 +387,9 @@ URL_API_COMPONENTS = '/api/components'
 URL_API_ERROR_LOG = '/api/error_log'
 URL_API_LOG_OUT = '/api/log_out'
 URL_API_TEMPLATE = '/api/template'
+URL_API_POLLING = '/api/polling'
+URL_API_RECORDER = '/api/recorder'
+URL_API_TIMELINE = '/api/timeline'
 
 HTTP_OK = 200
 HTTP_CREATED = 201
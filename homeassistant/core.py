@@ -8,6 +8,9 @@ of entities and react to changes.
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import enum
+import heapq
+import itertools
+import json
 import logging
 import os
 import pathlib
@@ -131,6 +134,7 @@ class HomeAssistant(object):
         self._pending_tasks = []
         self._track_task = True
         self.bus = EventBus(self)
+        self.scheduler = Scheduler(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
         self.config = Config()  # type: Config
@@ -314,7 +318,8 @@ class EventOrigin(enum.Enum):
 class Event(object):
     """Representation of an event within the bus."""
 
-    __slots__ = ['event_type', 'data', 'origin', 'time_fired']
+    __slots__ = ['event_type', 'data', 'origin', 'time_fired', '_data_json',
+                 '_as_json']
 
     def __init__(self, event_type, data=None, origin=EventOrigin.local,
                  time_fired=None):
@@ -323,6 +328,8 @@ class Event(object):
         self.data = data or {}
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
+        self._data_json = None
+        self._as_json = None
 
     def as_dict(self):
         """Create a dict representation of this Event.
@@ -336,6 +343,44 @@ class Event(object):
             'time_fired': self.time_fired,
         }
 
+    def data_as_json(self):
+        """Return the event data encoded as JSON.
+
+        The data is encoded once and shared by everything sending the event,
+        so it should not be changed after the event is fired.
+
+        Async friendly.
+        """
+        if self._data_json is None:
+            data = self.data
+            if self.event_type == EVENT_STATE_CHANGED and \
+                    set(data) == _STATE_CHANGED_KEYS:
+                # Reuse the encoded states, the new state of this event is
+                # the old state of the next one.
+                self._data_json = (
+                    '{{"entity_id": {}, "new_state": {}, '
+                    '"old_state": {}}}').format(
+                        json.dumps(data['entity_id']),
+                        _state_as_json(data['new_state']),
+                        _state_as_json(data['old_state']))
+            else:
+                self._data_json = _json_dumps(data)
+        return self._data_json
+
+    def as_json(self):
+        """Return the event encoded as JSON, like as_dict with sorted keys.
+
+        Async friendly.
+        """
+        if self._as_json is None:
+            self._as_json = (
+                '{{"data": {}, "event_type": {}, "origin": {}, '
+                '"time_fired": {}}}').format(
+                    self.data_as_json(), json.dumps(self.event_type),
+                    json.dumps(str(self.origin)),
+                    json.dumps(self.time_fired.isoformat()))
+        return self._as_json
+
     def __repr__(self):
         """Return the representation."""
         # pylint: disable=maybe-no-member
@@ -356,12 +401,33 @@ class Event(object):
                 self.time_fired == other.time_fired)
 
 
+_STATE_CHANGED_KEYS = {'entity_id', 'old_state', 'new_state'}
+
+
+def _state_as_json(state):
+    """Return a state of a state changed event encoded as JSON."""
+    if state is None:
+        return 'null'
+    if isinstance(state, State):
+        return state.as_json()
+    return _json_dumps(state)
+
+
+def _json_dumps(obj):
+    """Encode an object as JSON, including Home Assistant objects."""
+    # Imported here because remote depends on this module
+    from homeassistant.remote import JSONEncoder
+
+    return json.dumps(obj, cls=JSONEncoder)
+
+
 class EventBus(object):
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners = {}
+        self._entity_listeners = {}
         self._hass = hass
 
     @callback
@@ -370,8 +436,16 @@ class EventBus(object):
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key])
-                for key in self._listeners}
+        listeners = {key: len(self._listeners[key])
+                     for key in self._listeners}
+
+        if self._entity_listeners:
+            count = len(set(itertools.chain.from_iterable(
+                self._entity_listeners.values())))
+            listeners[EVENT_STATE_CHANGED] = \
+                listeners.get(EVENT_STATE_CHANGED, 0) + count
+
+        return listeners
 
     @property
     def listeners(self):
@@ -400,6 +474,12 @@ class EventBus(object):
                 event_type != EVENT_HOMEASSISTANT_CLOSE):
             listeners = match_all_listeners + listeners
 
+        if event_type == EVENT_STATE_CHANGED and self._entity_listeners:
+            entity_listeners = self._entity_listeners.get(
+                (event_data or {}).get('entity_id'))
+            if entity_listeners:
+                listeners = listeners + entity_listeners
+
         event = Event(event_type, event_data, origin)
 
         if event_type != EVENT_TIME_CHANGED:
@@ -447,6 +527,30 @@ class EventBus(object):
 
         return remove_listener
 
+    @callback
+    def async_listen_entity(self, entity_ids, listener):
+        """Listen for state changed events of specific entities.
+
+        Listeners are indexed by entity id so that a state change only
+        schedules the listeners of that entity. entity_ids is an iterable
+        of lowercase entity ids.
+
+        This method must be run in the event loop.
+        """
+        entity_ids = tuple(set(entity_ids))
+
+        for entity_id in entity_ids:
+            if entity_id in self._entity_listeners:
+                self._entity_listeners[entity_id].append(listener)
+            else:
+                self._entity_listeners[entity_id] = [listener]
+
+        def remove_listener():
+            """Remove the listener."""
+            self._async_remove_entity_listener(entity_ids, listener)
+
+        return remove_listener
+
     def listen_once(self, event_type, listener):
         """Listen once for event of a specific type.
 
@@ -510,6 +614,167 @@ class EventBus(object):
             # ValueError if listener did not exist within event_type
             _LOGGER.warning("Unable to remove unknown listener %s", listener)
 
+    @callback
+    def _async_remove_entity_listener(self, entity_ids, listener):
+        """Remove a listener of specific entity ids.
+
+        This method must be run in the event loop.
+        """
+        for entity_id in entity_ids:
+            try:
+                self._entity_listeners[entity_id].remove(listener)
+
+                # delete entity_id list if empty
+                if not self._entity_listeners[entity_id]:
+                    self._entity_listeners.pop(entity_id)
+            except (KeyError, ValueError):
+                _LOGGER.warning("Unable to remove unknown listener %s",
+                                listener)
+                return
+
+
+class Scheduler(object):
+    """Run actions at a point in UTC time without polling every listener.
+
+    Pending actions are kept in a heap ordered by their point in time. A
+    single ``loop.call_at`` handle is armed for the earliest action once the
+    core timer is running, and one EVENT_TIME_CHANGED listener catches up
+    with wall clock jumps and with time events fired by tests.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap = []
+        self._counter = itertools.count()
+        self._pending = 0
+        self._handle = None
+        self._timer_running = False
+        self._unsub_time_changed = None
+
+    @property
+    def pending(self):
+        """Return the number of scheduled actions that did not run yet."""
+        return self._pending
+
+    @callback
+    def async_schedule(self, point_in_time, action):
+        """Run action with the current UTC time once point_in_time passed.
+
+        Returns a function that cancels the scheduled action.
+
+        This method must be run in the event loop.
+        """
+        entry = [dt_util.as_utc(point_in_time), next(self._counter), action]
+        is_first = not self._heap or entry[0] < self._heap[0][0]
+        heapq.heappush(self._heap, entry)
+        self._pending += 1
+
+        if self._unsub_time_changed is None:
+            self._unsub_time_changed = self._hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed)
+
+        if is_first:
+            self._async_arm()
+
+        @callback
+        def cancel():
+            """Cancel the scheduled action."""
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._pending -= 1
+            self._async_discard()
+
+        return cancel
+
+    @callback
+    def async_start_timer(self):
+        """Start arming the event loop timer for the next due action."""
+        self._timer_running = True
+        self._async_arm()
+
+    @callback
+    def async_stop_timer(self):
+        """Stop arming the event loop timer."""
+        self._timer_running = False
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def async_run_due(self, now):
+        """Run all actions scheduled at or before now.
+
+        Actions scheduled while running the due actions are only considered
+        on the next run, just like listeners added during an event.
+
+        This method must be run in the event loop.
+        """
+        heap = self._heap
+        due = []
+
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if entry[2] is not None:
+                due.append(entry[2])
+                entry[2] = None
+                self._pending -= 1
+
+        self._async_discard()
+
+        for action in due:
+            self._hass.async_run_job(action, now)
+
+    @callback
+    def _async_time_changed(self, event):
+        """Run due actions on a time changed event."""
+        self.async_run_due(event.data[ATTR_NOW])
+
+    @callback
+    def _async_timer_fired(self):
+        """Run due actions when the event loop timer fires."""
+        self._handle = None
+        self.async_run_due(dt_util.utcnow())
+
+    @callback
+    def _async_discard(self):
+        """Drop cancelled entries and re-arm the timer if needed."""
+        heap = self._heap
+        head = heap[0] if heap else None
+
+        if not self._pending:
+            heap.clear()
+            if self._unsub_time_changed is not None:
+                self._unsub_time_changed()
+                self._unsub_time_changed = None
+
+        elif len(heap) > 2 * self._pending + 64:
+            # Too many cancelled entries lingering, rebuild the heap.
+            heap[:] = [entry for entry in heap if entry[2] is not None]
+            heapq.heapify(heap)
+
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+
+        if (heap[0] if heap else None) is not head or self._handle is None:
+            self._async_arm()
+
+    @callback
+    def _async_arm(self):
+        """Arm the event loop timer for the earliest scheduled action."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._timer_running or not self._heap:
+            return
+
+        delay = (self._heap[0][0] - dt_util.utcnow()).total_seconds()
+        loop = self._hass.loop
+        self._handle = loop.call_at(
+            loop.time() + max(delay, 0), self._async_timer_fired)
+
 
 class State(object):
     """Object to represent a state within the state machine.
@@ -522,7 +787,8 @@ class State(object):
     """
 
     __slots__ = ['entity_id', 'state', 'attributes',
-                 'last_changed', 'last_updated']
+                 'last_changed', 'last_updated', '_attributes_json',
+                 '_as_json']
 
     def __init__(self, entity_id, state, attributes=None, last_changed=None,
                  last_updated=None):
@@ -544,6 +810,8 @@ class State(object):
         self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
+        self._attributes_json = None
+        self._as_json = None
 
     @property
     def domain(self):
@@ -576,6 +844,32 @@ class State(object):
                 'last_changed': self.last_changed,
                 'last_updated': self.last_updated}
 
+    def attributes_as_json(self):
+        """Return the attributes encoded as JSON.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = _json_dumps(dict(self.attributes))
+        return self._attributes_json
+
+    def as_json(self):
+        """Return the state encoded as JSON, like as_dict with sorted keys.
+
+        States are encoded once and shared by everything sending them.
+
+        Async friendly.
+        """
+        if self._as_json is None:
+            self._as_json = (
+                '{{"attributes": {}, "entity_id": {}, "last_changed": {}, '
+                '"last_updated": {}, "state": {}}}').format(
+                    self.attributes_as_json(), json.dumps(self.entity_id),
+                    json.dumps(self.last_changed.isoformat()),
+                    json.dumps(self.last_updated.isoformat()),
+                    json.dumps(self.state))
+        return self._as_json
+
     @classmethod
     def from_dict(cls, json_dict):
         """Initialize a state from a dict.
@@ -624,6 +918,8 @@ class StateMachine(object):
     def __init__(self, bus, loop):
         """Initialize state machine."""
         self._states = {}
+        # Entity ids and states per domain
+        self._domains = {}
         self._bus = bus
         self._loop = loop
 
@@ -643,22 +939,23 @@ class StateMachine(object):
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
-
-        return [state.entity_id for state in self._states.values()
-                if state.domain == domain_filter]
+        return list(self._domains.get(domain_filter.lower(), ()))
 
-    def all(self):
+    def all(self, domain_filter=None):
         """Create a list of all states."""
-        return run_callback_threadsafe(self._loop, self.async_all).result()
+        return run_callback_threadsafe(
+            self._loop, self.async_all, domain_filter).result()
 
     @callback
-    def async_all(self):
-        """Create a list of all states.
+    def async_all(self, domain_filter=None):
+        """Create a list of all states, or the states of a domain.
 
         This method must be run in the event loop.
         """
-        return list(self._states.values())
+        if domain_filter is None:
+            return list(self._states.values())
+
+        return list(self._domains.get(domain_filter.lower(), {}).values())
 
     def get(self, entity_id):
         """Retrieve state of entity_id or None if not found.
@@ -697,6 +994,11 @@ class StateMachine(object):
         if old_state is None:
             return False
 
+        domain_states = self._domains[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domains[old_state.domain]
+
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
@@ -744,6 +1046,7 @@ class StateMachine(object):
         last_changed = old_state.last_changed if same_state else None
         state = State(entity_id, new_state, attributes, last_changed)
         self._states[entity_id] = state
+        self._domains.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
@@ -754,18 +1057,41 @@ class StateMachine(object):
 class Service(object):
     """Representation of a callable service."""
 
-    __slots__ = ['func', 'description', 'fields', 'schema',
-                 'is_callback', 'is_coroutinefunction']
+    __slots__ = ['func', '_description', '_fields', 'load_description',
+                 'schema', 'is_callback', 'is_coroutinefunction']
 
-    def __init__(self, func, description, fields, schema):
+    def __init__(self, func, description, fields, schema,
+                 load_description=None):
         """Initialize a service."""
         self.func = func
-        self.description = description or ''
-        self.fields = fields or {}
+        self._description = description or ''
+        self._fields = fields or {}
+        self.load_description = load_description
         self.schema = schema
         self.is_callback = is_callback(func)
         self.is_coroutinefunction = asyncio.iscoroutinefunction(func)
 
+    @property
+    def description(self):
+        """Return the description of the service.
+
+        Lazy descriptions are empty till loaded by async_load_descriptions,
+        so reading them never does I/O in the event loop.
+        """
+        return self._description
+
+    @property
+    def fields(self):
+        """Return the description of the fields of the service."""
+        return self._fields
+
+    def set_description(self, description):
+        """Set the description dict loaded for the service."""
+        description = description or {}
+        self._description = description.get('description') or ''
+        self._fields = description.get('fields') or {}
+        self.load_description = None
+
     def as_dict(self):
         """Return dictionary representation of this service."""
         return {
@@ -830,6 +1156,32 @@ class ServiceRegistry(object):
                          in self._services[domain].items()}
                 for domain in self._services}
 
+    @asyncio.coroutine
+    def async_load_descriptions(self):
+        """Load the lazy service descriptions that were not loaded yet.
+
+        The descriptions are loaded in the executor so that a following
+        call to async_services does not have to do I/O.
+
+        This method is a coroutine.
+        """
+        pending = [service for services in self._services.values()
+                   for service in services.values()
+                   if service.load_description is not None]
+
+        if not pending:
+            return
+
+        loaders = [service.load_description for service in pending]
+        descriptions = yield from self._hass.async_add_job(
+            lambda: [load() for load in loaders])
+
+        for service, load, description in zip(
+                pending, loaders, descriptions):
+            # Skip services that were registered again meanwhile
+            if service.load_description is load:
+                service.set_description(description)
+
     def has_service(self, domain, service):
         """Test if specified service exists.
 
@@ -844,6 +1196,8 @@ class ServiceRegistry(object):
 
         Description is a dict containing key 'description' to describe
         the service and a key 'fields' to describe the fields.
+        It can also be a callable returning that dict, which is called when
+        the description is first requested.
 
         Schema is called to coerce and validate the service data.
         """
@@ -861,6 +1215,8 @@ class ServiceRegistry(object):
 
         Description is a dict containing key 'description' to describe
         the service and a key 'fields' to describe the fields.
+        It can also be a callable returning that dict, which is called when
+        the description is first requested.
 
         Schema is called to coerce and validate the service data.
 
@@ -868,9 +1224,14 @@ class ServiceRegistry(object):
         """
         domain = domain.lower()
         service = service.lower()
-        description = description or {}
-        service_obj = Service(service_func, description.get('description'),
-                              description.get('fields', {}), schema)
+        if callable(description):
+            service_obj = Service(service_func, None, None, schema,
+                                  load_description=description)
+        else:
+            description = description or {}
+            service_obj = Service(service_func,
+                                  description.get('description'),
+                                  description.get('fields', {}), schema)
 
         if domain in self._services:
             self._services[domain][service] = service_obj
@@ -1149,8 +1510,10 @@ def _async_create_timer(hass):
         """Stop the timer."""
         if handle is not None:
             handle.cancel()
+        hass.scheduler.async_stop_timer()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
     fire_time_event(monotonic())
+    hass.scheduler.async_start_timer()
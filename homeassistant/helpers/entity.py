@@ -21,6 +21,10 @@ from homeassistant.util.async import (
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 
+DATA_SYNC_UPDATES = 'entity_sync_updates'
+# Maximum number of sync updates running in the executor at the same time
+MAX_SYNC_UPDATES = 8
+
 
 def generate_entity_id(entity_id_format: str, name: Optional[str],
                        current_ids: Optional[List[str]]=None,
@@ -50,7 +54,9 @@ def async_generate_entity_id(entity_id_format: str, name: Optional[str],
         if hass is None:
             raise ValueError("Missing required parameter currentids or hass")
 
-        current_ids = hass.states.async_entity_ids()
+        # Only entity ids of the same domain can clash
+        current_ids = hass.states.async_entity_ids(
+            entity_id_format.split('.')[0])
     name = (name or DEVICE_DEFAULT_NAME).lower()
 
     return ensure_unique_string(
@@ -303,7 +309,10 @@ class Entity(object):
                 # pylint: disable=no-member
                 yield from self.async_update()
             else:
-                yield from self.hass.async_add_job(self.update)
+                # Leave executor threads for other jobs
+                sync_updates = _async_get_sync_updates(self.hass)
+                with (yield from sync_updates):
+                    yield from self.hass.async_add_job(self.update)
         finally:
             self._update_staged = False
             if warning:
@@ -350,6 +359,16 @@ class Entity(object):
         return "<Entity {}: {}>".format(self.name, self.state)
 
 
+@callback
+def _async_get_sync_updates(hass):
+    """Return the semaphore bounding the sync updates of all entities."""
+    sync_updates = hass.data.get(DATA_SYNC_UPDATES)
+    if sync_updates is None:
+        sync_updates = hass.data[DATA_SYNC_UPDATES] = asyncio.Semaphore(
+            MAX_SYNC_UPDATES, loop=hass.loop)
+    return sync_updates
+
+
 class ToggleEntity(Entity):
     """An abstract class for entities that can be turned on and off."""
 
@@ -1,9 +1,14 @@
 """Helpers for components that manage entities."""
 import asyncio
 from datetime import timedelta
+from timeit import default_timer as timer
+import zlib
+
+import async_timeout
 
 from homeassistant import config as conf_util
-from homeassistant.setup import async_prepare_setup_platform
+from homeassistant.setup import (
+    async_get_timeline, async_prepare_setup_platform)
 from homeassistant.const import (
     ATTR_ENTITY_ID, CONF_SCAN_INTERVAL, CONF_ENTITY_NAMESPACE,
     DEVICE_DEFAULT_NAME)
@@ -13,7 +18,7 @@ from homeassistant.loader import get_component
 from homeassistant.helpers import config_per_platform, discovery
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.event import (
-    async_track_time_interval, async_track_point_in_time)
+    async_track_point_in_time, async_track_point_in_utc_time)
 from homeassistant.helpers.service import extract_entity_ids
 from homeassistant.util import slugify
 from homeassistant.util.async import (
@@ -25,6 +30,12 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 PLATFORM_NOT_READY_RETRIES = 10
 
+DATA_POLLING_PLATFORMS = 'entity_polling_platforms'
+# Service calls to entities running at the same time
+ENTITY_SERVICE_PARALLEL = 10
+# Seconds a service call to a single entity may take
+ENTITY_SERVICE_TIMEOUT = 60
+
 
 class EntityComponent(object):
     """Helper class that will help a component manage its entities."""
@@ -115,6 +126,60 @@ class EntityComponent(object):
                 if entity_id in self.entities and
                 self.entities[entity_id].available]
 
+    @asyncio.coroutine
+    def async_call_entities(self, entities, call,
+                            parallel=ENTITY_SERVICE_PARALLEL,
+                            timeout=ENTITY_SERVICE_TIMEOUT):
+        """Call a service method on entities concurrently.
+
+        call is called with each entity and returns the coroutine to run.
+        At most parallel calls run at the same time and a call is given up
+        after timeout seconds. Entities of platforms that limit their
+        parallel updates, like all sync platforms, are called one at a time
+        as their updates are. The polling entities update their state
+        together once all calls are done. The first error raised by a call
+        is raised again afterwards.
+
+        This method must be run in the event loop.
+        """
+        if not entities:
+            return
+
+        semaphore = asyncio.Semaphore(parallel, loop=self.hass.loop)
+        errors = []
+
+        @asyncio.coroutine
+        def async_call_entity(entity):
+            """Run the service method of an entity."""
+            with (yield from semaphore):
+                if entity.parallel_updates:
+                    yield from entity.parallel_updates.acquire()
+
+                try:
+                    with async_timeout.timeout(timeout, loop=self.hass.loop):
+                        yield from call(entity)
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        "Service call to %s took longer than %s seconds",
+                        entity.entity_id, timeout)
+                except Exception as err:  # pylint: disable=broad-except
+                    errors.append(err)
+                finally:
+                    if entity.parallel_updates:
+                        entity.parallel_updates.release()
+
+        yield from asyncio.wait(
+            [async_call_entity(entity) for entity in entities],
+            loop=self.hass.loop)
+
+        update_tasks = [entity.async_update_ha_state(True)
+                        for entity in entities if entity.should_poll]
+        if update_tasks:
+            yield from asyncio.wait(update_tasks, loop=self.hass.loop)
+
+        if errors:
+            raise errors[0]
+
     @asyncio.coroutine
     def _async_setup_platform(self, platform_type, platform_config,
                               discovery_info=None, tries=0):
@@ -122,6 +187,14 @@ class EntityComponent(object):
 
         This method must be run in the event loop.
         """
+        platform_path = '{}.{}'.format(self.domain, platform_type)
+        timeline = async_get_timeline(self.hass)
+        start = timer()
+
+        # The component setup waits for the platforms it sets up
+        if self.domain not in self.hass.config.components:
+            timeline.add_dependencies(self.domain, [platform_path])
+
         platform = yield from async_prepare_setup_platform(
             self.hass, self.config, self.domain, platform_type)
 
@@ -152,6 +225,7 @@ class EntityComponent(object):
             SLOW_SETUP_WARNING, self.logger.warning,
             "Setup of platform %s is taking over %s seconds.", platform_type,
             SLOW_SETUP_WARNING)
+        setup_start = timer()
 
         try:
             if getattr(platform, 'async_setup_platform', None):
@@ -170,8 +244,7 @@ class EntityComponent(object):
                 asyncio.shield(task, loop=self.hass.loop),
                 SLOW_SETUP_MAX_WAIT, loop=self.hass.loop)
             yield from entity_platform.async_block_entities_done()
-            self.hass.config.components.add(
-                '{}.{}'.format(self.domain, platform_type))
+            self.hass.config.components.add(platform_path)
         except PlatformNotReady:
             tries += 1
             wait_time = min(tries, 6) * 30
@@ -192,6 +265,8 @@ class EntityComponent(object):
                 "Error while setting up platform %s", platform_type)
         finally:
             warn_task.cancel()
+            timeline.add(platform_path, 'setup', setup_start)
+            timeline.add(platform_path, 'platform', start)
 
     def add_entity(self, entity, platform=None, update_before_add=False):
         """Add entity to component."""
@@ -334,9 +409,15 @@ class EntityPlatform(object):
         self.parallel_updates = None
         self.entity_namespace = entity_namespace
         self.platform_entities = []
+        self.poll_count = 0
+        self.poll_overruns = 0
+        self.poll_duration = 0
+        self.poll_duration_max = 0
         self._tasks = []
-        self._async_unsub_polling = None
-        self._process_updates = asyncio.Lock(loop=component.hass.loop)
+        # Function to cancel the next poll, per entity id
+        self._async_unsub_polls = {}
+        # Entity ids of the polls in progress
+        self._polling = set()
 
         if parallel_updates:
             self.parallel_updates = asyncio.Semaphore(
@@ -400,21 +481,14 @@ class EntityPlatform(object):
             )
             if ret:
                 self.platform_entities.append(new_entity)
+                if new_entity.should_poll:
+                    self._async_schedule_poll(new_entity)
 
         tasks = [async_process_entity(entity) for entity in new_entities]
 
         yield from asyncio.wait(tasks, loop=self.component.hass.loop)
         self.component.async_update_group()
 
-        if self._async_unsub_polling is not None or \
-           not any(entity.should_poll for entity
-                   in self.platform_entities):
-            return
-
-        self._async_unsub_polling = async_track_time_interval(
-            self.component.hass, self._update_entity_states, self.scan_interval
-        )
-
     @asyncio.coroutine
     def async_reset(self):
         """Remove all entities and reset data.
@@ -428,32 +502,97 @@ class EntityPlatform(object):
 
         yield from asyncio.wait(tasks, loop=self.component.hass.loop)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        for unsub in self._async_unsub_polls.values():
+            unsub()
+        self._async_unsub_polls.clear()
+        self.component.hass.data.get(DATA_POLLING_PLATFORMS, set()).discard(
+            self)
 
-    @asyncio.coroutine
-    def _update_entity_states(self, now):
-        """Update the states of all the polling entities.
+    @callback
+    def _async_schedule_poll(self, entity, point_in_time=None):
+        """Schedule the next poll of an entity.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        The polls of an entity are spread over the scan interval by a fixed
+        offset derived from its entity id, so the entities of all platforms
+        with the same interval do not update at the same time.
 
         This method must be run in the event loop.
         """
-        if self._process_updates.locked():
-            self.component.logger.warning(
-                "Updating %s %s took longer than the scheduled update "
-                "interval %s", self.platform, self.component.domain,
-                self.scan_interval)
-            return
+        hass = self.component.hass
+
+        if point_in_time is None:
+            interval = self.scan_interval.total_seconds()
+            offset = zlib.crc32(entity.entity_id.encode()) / 2**32 * interval
+            now = dt_util.utcnow()
+            point_in_time = now + timedelta(seconds=interval - (
+                (now.timestamp() - offset) % interval))
+            hass.data.setdefault(DATA_POLLING_PLATFORMS, set()).add(self)
+
+        @callback
+        def async_poll(now):
+            """Poll the entity and schedule the next poll."""
+            next_point = point_in_time + self.scan_interval
+            while next_point <= now:
+                next_point += self.scan_interval
+            self._async_schedule_poll(entity, next_point)
+
+            if not entity.should_poll:
+                return
+
+            if entity.entity_id in self._polling:
+                self.poll_overruns += 1
+                self.component.logger.warning(
+                    "Updating %s took longer than the scheduled update "
+                    "interval %s", entity.entity_id, self.scan_interval)
+                return
+
+            hass.async_add_job(self._async_poll(entity))
+
+        self._async_unsub_polls[entity.entity_id] = \
+            async_track_point_in_utc_time(hass, async_poll, point_in_time)
+
+    @asyncio.coroutine
+    def _async_poll(self, entity):
+        """Update the state of a polling entity and record the duration.
+
+        This method must be run in the event loop.
+        """
+        self._polling.add(entity.entity_id)
+        start = timer()
+
+        try:
+            yield from entity.async_update_ha_state(True)
+        finally:
+            self._polling.discard(entity.entity_id)
+
+        duration = timer() - start
+        self.poll_count += 1
+        self.poll_duration += duration
+        self.poll_duration_max = max(self.poll_duration_max, duration)
+
+    @callback
+    def async_polling_stats(self):
+        """Return the polling statistics of the platform."""
+        return {
+            'domain': self.component.domain,
+            'platform': self.platform,
+            'scan_interval': self.scan_interval.total_seconds(),
+            'entities': len(self._async_unsub_polls),
+            'polls': self.poll_count,
+            'overruns': self.poll_overruns,
+            'duration_mean': (self.poll_duration / self.poll_count
+                              if self.poll_count else None),
+            'duration_max': self.poll_duration_max,
+        }
+
 
-        with (yield from self._process_updates):
-            tasks = []
-            for entity in self.platform_entities:
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+@callback
+def async_polling_stats(hass):
+    """Return the polling statistics of all platforms.
 
-            if tasks:
-                yield from asyncio.wait(tasks, loop=self.component.hass.loop)
+    This method must be run in the event loop.
+    """
+    return sorted(
+        (platform.async_polling_stats() for platform
+         in hass.data.get(DATA_POLLING_PLATFORMS, ())),
+        key=lambda stats: (stats['domain'], stats['platform']))
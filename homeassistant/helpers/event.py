@@ -1,5 +1,6 @@
 """Helpers for listening to events."""
 import functools as ft
+import logging
 
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.sun import get_astral_event_next
@@ -9,6 +10,8 @@ from ..const import (
 from ..util import dt as dt_util
 from ..util.async import run_callback_threadsafe
 
+_LOGGER = logging.getLogger(__name__)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -62,10 +65,6 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
     @callback
     def state_change_listener(event):
         """Handle specific state changes."""
-        if entity_ids != MATCH_ALL and \
-           event.data.get('entity_id') not in entity_ids:
-            return
-
         old_state = event.data.get('old_state')
         if old_state is not None:
             old_state = old_state.state
@@ -79,37 +78,103 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
                                event.data.get('old_state'),
                                event.data.get('new_state'))
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    if entity_ids == MATCH_ALL:
+        return hass.bus.async_listen(
+            EVENT_STATE_CHANGED, state_change_listener)
+
+    return hass.bus.async_listen_entity(entity_ids, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+@callback
+@bind_hass
+def async_track_template_result(hass, template, action, variables=None):
+    """Add a listener that renders a template when its result can change.
+
+    The template is rendered right away to find the entities and domains it
+    reads. It is rendered again on every state change of those, and action
+    is called with the state changed event and the RenderInfo of the render.
+    What is listened to follows what the last render read.
+
+    Returns a function that can be called to remove the listener.
+
+    Must be run within the event loop.
+    """
+    info = None
+    listening = None
+    remove_listener = None
+
+    @callback
+    def state_changed_listener(event):
+        """Render the template if the state change can change the result."""
+        if info.filter(event.data.get('entity_id')):
+            async_render(event)
+
+    @callback
+    def async_render(event=None):
+        """Render the template and listen to what it read."""
+        nonlocal info, listening, remove_listener
+        info = template.async_render_to_info(variables)
+
+        wanted = (info.all_states, info.domains, info.entities)
+        if wanted != listening:
+            if remove_listener is not None:
+                remove_listener()
+            if info.all_states or info.domains:
+                remove_listener = hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, state_changed_listener)
+            else:
+                remove_listener = hass.bus.async_listen_entity(
+                    info.entities, state_changed_listener)
+            listening = wanted
+
+        if event is not None:
+            hass.async_run_job(action, event, info)
+
+    async_render()
+
+    @callback
+    def async_remove():
+        """Remove the listener."""
+        remove_listener()
+
+    return async_remove
+
+
+track_template_result = threaded_listener_factory(async_track_template_result)
+
+
 @callback
 @bind_hass
 def async_track_template(hass, template, action, variables=None):
     """Add a listener that track state changes with template condition."""
-    from . import condition
-
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id, from_s, to_s):
+    def template_condition_listener(event, info):
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        if info.exception is not None:
+            _LOGGER.error("Error during template condition: %s",
+                          info.exception)
+            template_result = False
+        else:
+            template_result = info.result.lower() == 'true'
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(action, event.data.get('entity_id'),
+                               event.data.get('old_state'),
+                               event.data.get('new_state'))
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables),
-        template_condition_listener)
+    return async_track_template_result(
+        hass, template, template_condition_listener, variables)
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -191,28 +256,7 @@ def async_track_point_in_utc_time(hass, action, point_in_time):
     # Ensure point_in_time is UTC
     point_in_time = dt_util.as_utc(point_in_time)
 
-    @callback
-    def point_in_time_listener(event):
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, 'run'):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        point_in_time_listener.run = True
-        async_unsub()
-
-        hass.async_run_job(action, now)
-
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED,
-                                        point_in_time_listener)
-
-    return async_unsub
+    return hass.scheduler.async_schedule(point_in_time, action)
 
 
 track_point_in_utc_time = threaded_listener_factory(
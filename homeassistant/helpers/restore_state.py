@@ -1,4 +1,8 @@
-"""Support for restoring entity states on startup."""
+"""Support for restoring entity states on startup.
+
+The states are restored from the state snapshot, see state_snapshot.
+Without a snapshot they are restored from the last recorder run.
+"""
 import asyncio
 import logging
 from datetime import timedelta
@@ -11,6 +15,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.components.history import get_states, last_recorder_run
 from homeassistant.components.recorder import (
     wait_connection_ready, DOMAIN as _RECORDER)
+from homeassistant.helpers.state_snapshot import SNAPSHOT_FILE, load_snapshot
 import homeassistant.util.dt as dt_util
 
 RECORDER_TIMEOUT = 10
@@ -19,15 +24,19 @@ _LOCK = 'restore_lock'
 _LOGGER = logging.getLogger(__name__)
 
 
-def _load_restore_cache(hass: HomeAssistant):
-    """Load the restore cache to be used by other components."""
+@callback
+def _async_remove_cache_on_start(hass: HomeAssistant):
+    """Remove the restore cache once Home Assistant has started."""
     @callback
     def remove_cache(event):
         """Remove the states cache."""
         hass.data.pop(DATA_RESTORE_CACHE, None)
 
-    hass.bus.listen_once(EVENT_HOMEASSISTANT_START, remove_cache)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, remove_cache)
+
 
+def _load_restore_cache(hass: HomeAssistant):
+    """Load the restore cache from the last recorder run."""
     last_run = last_recorder_run(hass)
 
     if last_run is None or last_run.end is None:
@@ -56,34 +65,49 @@ def async_get_last_state(hass, entity_id: str):
     if DATA_RESTORE_CACHE in hass.data:
         return hass.data[DATA_RESTORE_CACHE].get(entity_id)
 
-    if _RECORDER not in hass.config.components:
-        return None
-
     if hass.state not in (CoreState.starting, CoreState.not_running):
         _LOGGER.debug("Cache for %s can only be loaded during startup, not %s",
                       entity_id, hass.state)
         return None
 
-    try:
-        with async_timeout.timeout(RECORDER_TIMEOUT, loop=hass.loop):
-            connected = yield from wait_connection_ready(hass)
-    except asyncio.TimeoutError:
-        return None
-
-    if not connected:
-        return None
-
     if _LOCK not in hass.data:
         hass.data[_LOCK] = asyncio.Lock(loop=hass.loop)
 
     with (yield from hass.data[_LOCK]):
         if DATA_RESTORE_CACHE not in hass.data:
-            yield from hass.async_add_job(
-                _load_restore_cache, hass)
+            yield from _async_load_restore_cache(hass)
 
     return hass.data.get(DATA_RESTORE_CACHE, {}).get(entity_id)
 
 
+@asyncio.coroutine
+def _async_load_restore_cache(hass: HomeAssistant):
+    """Load the restore cache from the snapshot or the recorder."""
+    states = yield from hass.async_add_job(
+        load_snapshot, hass.config.path(SNAPSHOT_FILE))
+
+    if states is not None:
+        _LOGGER.debug("Created cache from snapshot with %s", list(states))
+        hass.data[DATA_RESTORE_CACHE] = states
+        _async_remove_cache_on_start(hass)
+        return
+
+    if _RECORDER not in hass.config.components:
+        return
+
+    try:
+        with async_timeout.timeout(RECORDER_TIMEOUT, loop=hass.loop):
+            connected = yield from wait_connection_ready(hass)
+    except asyncio.TimeoutError:
+        return
+
+    if not connected:
+        return
+
+    _async_remove_cache_on_start(hass)
+    yield from hass.async_add_job(_load_restore_cache, hass)
+
+
 @asyncio.coroutine
 def async_restore_state(entity, extract_info):
     """Call entity.async_restore_state with cached info."""
@@ -1,5 +1,6 @@
 """Service calling related helpers."""
 import asyncio
+from functools import lru_cache
 import logging
 # pylint: disable=unused-import
 from typing import Optional  # NOQA
@@ -8,7 +9,7 @@ import voluptuous as vol
 
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant  # NOQA
-from homeassistant.exceptions import TemplateError
+from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.loader import get_component, bind_hass
 import homeassistant.helpers.config_validation as cv
 from homeassistant.util.async import run_coroutine_threadsafe
@@ -112,3 +113,70 @@ def extract_entity_ids(hass, service_call, expand_group=True):
             return [service_ent_id]
 
         return service_ent_id
+
+
+class LazyDescriptions(object):
+    """Service descriptions of a services.yaml file that load on demand.
+
+    Indexing returns the descriptions further down in the file, calling
+    returns the dict at that position. The file is only read the first time
+    a description is requested, which is done by ServiceRegistry.
+    """
+
+    def __init__(self, path, keys=(), default=None):
+        """Initialize the lazy descriptions."""
+        self.path = path
+        self.keys = keys
+        self.default = default
+
+    def __getitem__(self, key):
+        """Return the lazy descriptions under key."""
+        return LazyDescriptions(self.path, self.keys + (key,))
+
+    def get(self, key, default=None):
+        """Return the lazy descriptions under key.
+
+        default is returned when loaded if the file does not contain key.
+        """
+        return LazyDescriptions(self.path, self.keys + (key,), default)
+
+    def __call__(self):
+        """Load and return the descriptions.
+
+        This method needs to run in an executor.
+        """
+        descriptions = _load_services_file(self.path)
+        for key in self.keys:
+            if not isinstance(descriptions, dict) or key not in descriptions:
+                return {} if self.default is None else self.default
+            descriptions = descriptions[key] or {}
+        return descriptions
+
+    def __repr__(self):
+        """Return the representation of the lazy descriptions."""
+        return '<LazyDescriptions {} {}>'.format(
+            self.path, '/'.join(str(key) for key in self.keys))
+
+
+def lazy_descriptions(path):
+    """Return the service descriptions of a services.yaml file lazily.
+
+    The result can be indexed like the loaded file and the items passed as
+    description to hass.services.async_register.
+
+    Async friendly.
+    """
+    return LazyDescriptions(path)
+
+
+@lru_cache(maxsize=None)
+def _load_services_file(path):
+    """Load a services.yaml file once."""
+    # pylint: disable=cyclic-import
+    from homeassistant.config import load_yaml_config_file
+
+    try:
+        return load_yaml_config_file(path)
+    except HomeAssistantError as err:
+        _LOGGER.error("Unable to load service descriptions: %s", err)
+        return {}
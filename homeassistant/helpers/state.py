@@ -121,6 +121,61 @@ def get_changed_since(states, utc_point_in_time):
             if state.last_updated >= utc_point_in_time]
 
 
+def state_diff(old_state, new_state):
+    """Return the fields of new_state that differ from old_state.
+
+    Without an old state the full state is returned. Otherwise last_updated
+    is always included, state and last_changed only if they changed.
+    Changed and added attributes are under attributes and the names of
+    removed ones under removed_attributes.
+    """
+    if old_state is None:
+        return new_state.as_dict()
+
+    diff = {'last_updated': new_state.last_updated}
+
+    if new_state.state != old_state.state:
+        diff['state'] = new_state.state
+
+    if new_state.last_changed != old_state.last_changed:
+        diff['last_changed'] = new_state.last_changed
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+
+    if new_attributes is not old_attributes:
+        changed = {key: value for key, value in new_attributes.items()
+                   if key not in old_attributes or
+                   old_attributes[key] != value}
+        removed = [key for key in old_attributes
+                   if key not in new_attributes]
+        if changed:
+            diff['attributes'] = changed
+        if removed:
+            diff['removed_attributes'] = removed
+
+    return diff
+
+
+def state_changed_delta(event, last_states):
+    """Return the data of a state changed event as a delta.
+
+    The new state is described by its diff to the state in last_states,
+    which is the last state sent for the entity and is updated. Removed
+    entities have a new_state of None.
+    """
+    entity_id = event.data['entity_id']
+    new_state = event.data.get('new_state')
+
+    if new_state is None:
+        last_states.pop(entity_id, None)
+        return {'entity_id': entity_id, 'new_state': None}
+
+    old_state = last_states.get(entity_id)
+    last_states[entity_id] = new_state
+    return {'entity_id': entity_id, 'diff': state_diff(old_state, new_state)}
+
+
 @bind_hass
 def reproduce_state(hass, states, blocking=False):
     """Reproduce given state."""
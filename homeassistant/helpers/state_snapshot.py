@@ -0,0 +1,87 @@
+"""Write a snapshot of the state machine to restore states from.
+
+The snapshot is written at shutdown and periodically while running. This
+module is loaded by bootstrap, so it does not depend on any component.
+"""
+import json
+import logging
+import os
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP)
+from homeassistant.loader import bind_hass
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.remote import JSONEncoder
+
+SNAPSHOT_FILE = '.state_snapshot.json'
+SNAPSHOT_INTERVAL = timedelta(minutes=15)
+_LOGGER = logging.getLogger(__name__)
+
+
+def save_snapshot(path: str, states) -> None:
+    """Write the states to the snapshot file.
+
+    The file is replaced at once so a crash never leaves half a snapshot.
+    """
+    data = json.dumps([state.as_dict() for state in states],
+                      cls=JSONEncoder, separators=(',', ':'))
+    tmp_path = path + '.tmp'
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as fil:
+            fil.write(data)
+        os.replace(tmp_path, path)
+    except OSError as err:
+        _LOGGER.error("Unable to write state snapshot %s: %s", path, err)
+
+
+def load_snapshot(path: str):
+    """Load the states of the snapshot file.
+
+    Returns None if there is no usable snapshot.
+    """
+    try:
+        with open(path, encoding='utf-8') as fil:
+            data = json.loads(fil.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        _LOGGER.error("Unable to read state snapshot %s: %s", path, err)
+        return None
+
+    if not isinstance(data, list):
+        return None
+
+    states = (State.from_dict(item) for item in data)
+    return {state.entity_id: state for state in states if state is not None}
+
+
+@callback
+@bind_hass
+def async_setup_snapshot(hass: HomeAssistant) -> None:
+    """Write a snapshot of the states at shutdown and periodically.
+
+    Snapshots are only written once Home Assistant has started, so a
+    snapshot never misses the entities that were not set up yet.
+    """
+    path = hass.config.path(SNAPSHOT_FILE)
+    started = False
+
+    @callback
+    def async_save_snapshot(*_):
+        """Save the current states to the snapshot."""
+        if started:
+            hass.async_add_job(save_snapshot, path, hass.states.async_all())
+
+    @callback
+    def async_start(event):
+        """Start writing snapshots."""
+        nonlocal started
+        started = True
+        async_track_time_interval(
+            hass, async_save_snapshot, SNAPSHOT_INTERVAL)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_start)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_save_snapshot)
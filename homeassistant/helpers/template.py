@@ -6,13 +6,13 @@ import random
 import re
 
 import jinja2
-from jinja2 import contextfilter
+from jinja2 import contextfilter, contextfunction
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 
 from homeassistant.const import (
     STATE_UNKNOWN, ATTR_LATITUDE, ATTR_LONGITUDE, MATCH_ALL,
     ATTR_UNIT_OF_MEASUREMENT)
-from homeassistant.core import State
+from homeassistant.core import State, split_entity_id
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import location as loc_helper
 from homeassistant.loader import get_component, bind_hass
@@ -23,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Key in hass.data of the RenderInfo of the template being rendered
+_RENDER_INFO = 'template.render_info'
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:states\.|(?:is_state|is_state_attr|states)"
@@ -67,6 +70,53 @@ def extract_entities(template, variables=None):
     return MATCH_ALL
 
 
+class RenderInfo(object):
+    """Result of a template render and the states it read."""
+
+    def __init__(self, template):
+        """Initialize the render info."""
+        self.template = template
+        self.result = None
+        self.exception = None
+        self.all_states = False
+        self.domains = set()
+        self.entities = set()
+        self.time = False
+
+    def filter(self, entity_id):
+        """Return if a change of the entity can change the result."""
+        return (self.all_states or entity_id in self.entities or
+                split_entity_id(entity_id)[0] in self.domains)
+
+
+def _collect_state(hass, entity_id):
+    """Record that the template being rendered read a state."""
+    info = hass.data.get(_RENDER_INFO)
+    if info is not None:
+        info.entities.add(entity_id.lower())
+
+
+def _collect_domain(hass, domain):
+    """Record that the template being rendered read a domain."""
+    info = hass.data.get(_RENDER_INFO)
+    if info is not None:
+        info.domains.add(domain.lower())
+
+
+def _collect_time(hass):
+    """Record that the template being rendered read the time."""
+    info = hass.data.get(_RENDER_INFO)
+    if info is not None:
+        info.time = True
+
+
+def _collect_all(hass):
+    """Record that the template being rendered depends on all states."""
+    info = hass.data.get(_RENDER_INFO)
+    if info is not None:
+        info.all_states = True
+
+
 class Template(object):
     """Class to hold a template and manage caching and rendering."""
 
@@ -118,6 +168,37 @@ class Template(object):
         except jinja2.TemplateError as err:
             raise TemplateError(err)
 
+    def async_render_to_info(self, variables=None, **kwargs):
+        """Render the template and record which states it read.
+
+        Returns a RenderInfo with the result or the TemplateError raised.
+        A failed render depends on all states, as the part after the error
+        was not rendered. So does a template reading no state at all, like
+        one only reading the time, as it was always rendered on every state
+        change.
+
+        This method must be run in the event loop.
+        """
+        if self._compiled is None:
+            self._ensure_compiled()
+
+        info = RenderInfo(self)
+        previous = self.hass.data.get(_RENDER_INFO)
+        self.hass.data[_RENDER_INFO] = info
+
+        try:
+            info.result = self.async_render(variables, **kwargs)
+        except TemplateError as ex:
+            info.exception = ex
+            info.all_states = True
+        finally:
+            self.hass.data[_RENDER_INFO] = previous
+
+        if not info.entities and not info.domains:
+            info.all_states = True
+
+        return info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -165,7 +246,7 @@ class Template(object):
         global_vars = ENV.make_globals({
             'closest': template_methods.closest,
             'distance': template_methods.distance,
-            'is_state': self.hass.states.is_state,
+            'is_state': template_methods.is_state,
             'is_state_attr': template_methods.is_state_attr,
             'states': AllStates(self.hass),
         })
@@ -195,6 +276,7 @@ class AllStates(object):
 
     def __iter__(self):
         """Return all states."""
+        _collect_all(self._hass)
         return iter(
             _wrap_state(state) for state in
             sorted(self._hass.states.async_all(),
@@ -202,10 +284,12 @@ class AllStates(object):
 
     def __len__(self):
         """Return number of states."""
+        _collect_all(self._hass)
         return len(self._hass.states.async_entity_ids())
 
     def __call__(self, entity_id):
         """Return the states."""
+        _collect_state(self._hass, entity_id)
         state = self._hass.states.get(entity_id)
         return STATE_UNKNOWN if state is None else state.state
 
@@ -220,18 +304,21 @@ class DomainStates(object):
 
     def __getattr__(self, name):
         """Return the states."""
-        return _wrap_state(
-            self._hass.states.get('{}.{}'.format(self._domain, name)))
+        entity_id = '{}.{}'.format(self._domain, name)
+        _collect_state(self._hass, entity_id)
+        return _wrap_state(self._hass.states.get(entity_id))
 
     def __iter__(self):
         """Return the iteration over all the states."""
+        _collect_domain(self._hass, self._domain)
         return iter(sorted(
-            (_wrap_state(state) for state in self._hass.states.async_all()
-             if state.domain == self._domain),
+            (_wrap_state(state) for state
+             in self._hass.states.async_all(self._domain)),
             key=lambda state: state.entity_id))
 
     def __len__(self):
         """Return number of states."""
+        _collect_domain(self._hass, self._domain)
         return len(self._hass.states.async_entity_ids(self._domain))
 
 
@@ -336,8 +423,12 @@ class TemplateMethods(object):
 
             group = get_component('group')
 
-            states = [self._hass.states.get(entity_id) for entity_id
-                      in group.expand_entity_ids(self._hass, [gr_entity_id])]
+            _collect_state(self._hass, gr_entity_id)
+            states = []
+            for entity_id in group.expand_entity_ids(
+                    self._hass, [gr_entity_id]):
+                _collect_state(self._hass, entity_id)
+                states.append(self._hass.states.get(entity_id))
 
         return _wrap_state(loc_helper.closest(latitude, longitude, states))
 
@@ -389,8 +480,14 @@ class TemplateMethods(object):
         return self._hass.config.units.length(
             loc_util.distance(*locations[0] + locations[1]), 'm')
 
+    def is_state(self, entity_id, state):
+        """Test if a state is a specific value."""
+        _collect_state(self._hass, entity_id)
+        return self._hass.states.is_state(entity_id, state)
+
     def is_state_attr(self, entity_id, name, value):
         """Test if a state is a specific attribute."""
+        _collect_state(self._hass, entity_id)
         state_obj = self._hass.states.get(entity_id)
         return state_obj is not None and \
             state_obj.attributes.get(name) == value
@@ -400,6 +497,7 @@ class TemplateMethods(object):
         if isinstance(entity_id_or_state, State):
             return entity_id_or_state
         elif isinstance(entity_id_or_state, str):
+            _collect_state(self._hass, entity_id_or_state)
             return self._hass.states.get(entity_id_or_state)
         return None
 
@@ -505,6 +603,20 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         return isinstance(obj, AllStates) or super().is_safe_callable(obj)
 
 
+def _time_function(func):
+    """Wrap a time function to record that the template read the time."""
+    @contextfunction
+    def time_function(context):
+        """Return the time."""
+        states = context.get('states')
+        if isinstance(states, AllStates):
+            # pylint: disable=protected-access
+            _collect_time(states._hass)
+        return func()
+
+    return time_function
+
+
 ENV = TemplateEnvironment()
 ENV.filters['round'] = forgiving_round
 ENV.filters['multiply'] = multiply
@@ -516,8 +628,8 @@ ENV.filters['max'] = max
 ENV.filters['min'] = min
 ENV.filters['random'] = random_every_time
 ENV.globals['float'] = forgiving_float
-ENV.globals['now'] = dt_util.now
-ENV.globals['utcnow'] = dt_util.utcnow
+ENV.globals['now'] = _time_function(dt_util.now)
+ENV.globals['utcnow'] = _time_function(dt_util.utcnow)
 ENV.globals['as_timestamp'] = forgiving_as_timestamp
 ENV.globals['relative_time'] = dt_util.get_age
 ENV.globals['strptime'] = strptime
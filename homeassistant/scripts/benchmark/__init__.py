@@ -2,7 +2,7 @@
 import asyncio
 import argparse
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from timeit import default_timer as timer
 
@@ -110,11 +110,86 @@ def async_million_time_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+@asyncio.coroutine
+# pylint: disable=invalid-name
+def async_10000_pending_timers(hass):
+    """Fire time changed events with 10,000 timers pending."""
+    count = 0
+    event = asyncio.Event(loop=hass.loop)
+    point_in_time = dt_util.utcnow() + timedelta(hours=1)
+
+    @core.callback
+    def timer_listener(_):
+        """Handle a timer that should never be due."""
+        raise AssertionError('Timer should not have fired')
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10**5:
+            event.set()
+
+    for _ in range(10**4):
+        hass.helpers.event.async_track_point_in_utc_time(
+            timer_listener, point_in_time)
+
+    hass.bus.async_listen(EVENT_TIME_CHANGED, listener)
+    event_data = {ATTR_NOW: dt_util.utcnow()}
+
+    for _ in range(10**5):
+        hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+
+    start = timer()
+
+    yield from event.wait()
+
+    return timer() - start
+
+
+@benchmark
+@asyncio.coroutine
+# pylint: disable=invalid-name
+def async_10000_due_timers(hass):
+    """Schedule and run 10,000 timers."""
+    count = 0
+    event = asyncio.Event(loop=hass.loop)
+    now = dt_util.utcnow()
+
+    @core.callback
+    def listener(_):
+        """Handle timer."""
+        nonlocal count
+        count += 1
+
+        if count == 10**4:
+            event.set()
+
+    start = timer()
+
+    for idx in range(10**4):
+        hass.helpers.event.async_track_point_in_utc_time(
+            listener, now + timedelta(microseconds=idx))
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED,
+                        {ATTR_NOW: now + timedelta(seconds=1)})
+
+    yield from event.wait()
+
+    return timer() - start
+
+
 @benchmark
 @asyncio.coroutine
 # pylint: disable=invalid-name
 def async_million_state_changed_helper(hass):
-    """Run a million events through state changed helper."""
+    """Run a million events through state changed helper.
+
+    Next to the measured tracker, 1,000 trackers listen to other entities.
+    """
     count = 0
     entity_id = 'light.kitchen'
     event = asyncio.Event(loop=hass.loop)
@@ -128,6 +203,15 @@ def async_million_state_changed_helper(hass):
         if count == 10**6:
             event.set()
 
+    @core.callback
+    def other_listener(*args):
+        """Handle event of another entity."""
+        raise AssertionError('Tracker of other entity should not run')
+
+    for idx in range(1000):
+        hass.helpers.event.async_track_state_change(
+            'light.other_{}'.format(idx), other_listener)
+
     hass.helpers.event.async_track_state_change(
         entity_id, listener, 'off', 'on')
     event_data = {
@@ -144,3 +228,89 @@ def async_million_state_changed_helper(hass):
     yield from event.wait()
 
     return timer() - start
+
+
+@benchmark
+@asyncio.coroutine
+# pylint: disable=invalid-name
+def async_10000_state_changed_json(hass):
+    """Encode 10,000 state changed events for a growing number of clients.
+
+    Prints the cost per event for each number of websocket connections.
+    """
+    from homeassistant.components.websocket_api import event_message
+
+    entity_id = 'light.kitchen'
+    attributes = {
+        'friendly_name': 'Kitchen',
+        'brightness': 180,
+        'rgb_color': [255, 180, 120],
+        'supported_features': 61,
+    }
+    start = timer()
+
+    for subscribers in (1, 10, 100):
+        events = []
+        old_state = None
+        for idx in range(10000):
+            new_state = core.State(
+                entity_id, 'on', dict(attributes, brightness=idx % 255))
+            events.append(core.Event(EVENT_STATE_CHANGED, {
+                'entity_id': entity_id,
+                'old_state': old_state,
+                'new_state': new_state,
+            }))
+            old_state = new_state
+
+        encode_start = timer()
+
+        for event in events:
+            for iden in range(subscribers):
+                event_message(iden, event)
+
+        print('{} subscribers: {:.1f}us per event'.format(
+            subscribers, (timer() - encode_start) * 100))
+
+    return timer() - start
+
+
+@benchmark
+@asyncio.coroutine
+# pylint: disable=invalid-name
+def async_10000_domain_lookups(hass):
+    """Look up the states of a domain 10,000 times among 5,000 entities.
+
+    Prints the cost of a scan over all states next to the domain index.
+    """
+    from homeassistant.helpers.template import Template
+
+    domains = ['domain_{}'.format(idx) for idx in range(30)]
+
+    for idx in range(5000):
+        hass.states.async_set('{}.entity_{}'.format(
+            domains[idx % len(domains)], idx), 'on')
+
+    template = Template('{{ states.domain_0 | list | count }}', hass)
+    start = timer()
+
+    lookup_start = timer()
+    for idx in range(10000):
+        domain = domains[idx % len(domains)]
+        _ = [state for state in hass.states.async_all()
+             if state.domain == domain]
+    print('Scan: {:.1f}us per lookup'.format(
+        (timer() - lookup_start) * 100))
+
+    lookup_start = timer()
+    for idx in range(10000):
+        hass.states.async_all(domains[idx % len(domains)])
+    print('Index: {:.1f}us per lookup'.format(
+        (timer() - lookup_start) * 100))
+
+    lookup_start = timer()
+    for _ in range(10000):
+        template.async_render()
+    print('Template: {:.1f}us per render'.format(
+        (timer() - lookup_start) * 100))
+
+    return timer() - start
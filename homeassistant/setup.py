@@ -2,6 +2,8 @@
 import asyncio
 import logging.handlers
 import os
+import sys
+import sysconfig
 from timeit import default_timer as timer
 
 from types import ModuleType
@@ -15,6 +17,7 @@ from homeassistant.config import async_notify_setup_error
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED, PLATFORM_FORMAT, CONSTRAINT_FILE)
 from homeassistant.util.async import run_coroutine_threadsafe
+from homeassistant.util.timeline import Timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,9 +25,14 @@ ATTR_COMPONENT = 'component'
 
 DATA_SETUP = 'setup_tasks'
 DATA_PIP_LOCK = 'pip_lock'
+DATA_REQUIREMENTS = 'satisfied_requirements'
+DATA_TIMELINE = 'setup_timeline'
 
 SLOW_SETUP_WARNING = 10
 
+# Requirements satisfied at an earlier start, relative to the config dir
+REQUIREMENTS_MANIFEST = '.requirements_manifest.json'
+
 
 def setup_component(hass: core.HomeAssistant, domain: str,
                     config: Optional[Dict]=None) -> bool:
@@ -33,6 +41,20 @@ def setup_component(hass: core.HomeAssistant, domain: str,
         async_setup_component(hass, domain, config), loop=hass.loop).result()
 
 
+@core.callback
+def async_get_timeline(hass: core.HomeAssistant) -> Timeline:
+    """Return the timeline of setting up components and platforms.
+
+    This method must be run in the event loop.
+    """
+    timeline = hass.data.get(DATA_TIMELINE)
+
+    if timeline is None:
+        timeline = hass.data[DATA_TIMELINE] = Timeline()
+
+    return timeline
+
+
 @asyncio.coroutine
 def async_setup_component(hass: core.HomeAssistant, domain: str,
                           config: Optional[Dict]=None) -> bool:
@@ -57,6 +79,63 @@ def async_setup_component(hass: core.HomeAssistant, domain: str,
     task = setup_tasks[domain] = hass.async_add_job(
         _async_setup_component(hass, domain, config))
 
+    timeline = async_get_timeline(hass)
+    start = timer()
+    task.add_done_callback(
+        lambda _: timeline.add(domain, 'component', start))
+
+    return (yield from task)
+
+
+def _requirements_key(hass: core.HomeAssistant) -> str:
+    """Return the key of the environment requirements are installed in.
+
+    The key contains the modification time of the package directory, so the
+    manifest is not trusted after packages were added or removed by others.
+    """
+    if pkg_util.running_under_virtualenv():
+        target = sysconfig.get_path('purelib')
+    else:
+        target = sysconfig.get_path(
+            'purelib', '{}_user'.format(os.name),
+            {'userbase': hass.config.path('deps')})
+
+    try:
+        mtime = os.path.getmtime(target)
+    except OSError:
+        mtime = None
+
+    return '{} {} {}'.format(
+        '.'.join(str(part) for part in sys.version_info[:3]), target, mtime)
+
+
+def _load_satisfied_requirements(hass: core.HomeAssistant):
+    """Load the requirements satisfied in the current environment."""
+    return pkg_util.load_satisfied_requirements(
+        hass.config.path(REQUIREMENTS_MANIFEST), _requirements_key(hass))
+
+
+def _save_satisfied_requirements(hass: core.HomeAssistant, requirements):
+    """Save the requirements satisfied in the current environment."""
+    pkg_util.save_satisfied_requirements(
+        hass.config.path(REQUIREMENTS_MANIFEST), _requirements_key(hass),
+        requirements)
+
+
+@asyncio.coroutine
+def _async_get_satisfied_requirements(hass: core.HomeAssistant):
+    """Return the set of requirements known to be satisfied.
+
+    The set is loaded once from the manifest and shared by all components.
+
+    This method is a coroutine.
+    """
+    task = hass.data.get(DATA_REQUIREMENTS)
+
+    if task is None:
+        task = hass.data[DATA_REQUIREMENTS] = hass.async_add_job(
+            _load_satisfied_requirements, hass)
+
     return (yield from task)
 
 
@@ -65,11 +144,24 @@ def _async_process_requirements(hass: core.HomeAssistant, name: str,
                                 requirements) -> bool:
     """Install the requirements for a component.
 
+    Requirements satisfied at an earlier start are skipped. The others are
+    checked concurrently and only missing ones are installed, one at a time.
+
     This method is a coroutine.
     """
     if hass.config.skip_pip:
         return True
 
+    satisfied = yield from _async_get_satisfied_requirements(hass)
+    requirements = [req for req in requirements if req not in satisfied]
+
+    if not requirements:
+        return True
+
+    exists = yield from asyncio.gather(*[
+        hass.async_add_job(pkg_util.check_package_exists, req)
+        for req in requirements], loop=hass.loop)
+
     pip_lock = hass.data.get(DATA_PIP_LOCK)
     if pip_lock is None:
         pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock(loop=hass.loop)
@@ -86,13 +178,23 @@ def _async_process_requirements(hass: core.HomeAssistant, name: str,
                 os.path.dirname(__file__), CONSTRAINT_FILE))
 
     with (yield from pip_lock):
-        for req in requirements:
-            ret = yield from hass.async_add_job(pip_install, req)
-            if not ret:
-                _LOGGER.error("Not initializing %s because could not install "
-                              "dependency %s", name, req)
-                async_notify_setup_error(hass, name)
-                return False
+        try:
+            for req, req_exists in zip(requirements, exists):
+                if req_exists or req in satisfied:
+                    satisfied.add(req)
+                    continue
+
+                ret = yield from hass.async_add_job(pip_install, req)
+                if not ret:
+                    _LOGGER.error("Not initializing %s because could not "
+                                  "install dependency %s", name, req)
+                    async_notify_setup_error(hass, name)
+                    return False
+
+                satisfied.add(req)
+        finally:
+            yield from hass.async_add_job(
+                _save_satisfied_requirements, hass, list(satisfied))
 
     return True
 
@@ -141,7 +243,10 @@ def _async_setup_component(hass: core.HomeAssistant,
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
-    component = loader.get_component(domain)
+    timeline = async_get_timeline(hass)
+
+    with timeline.span(domain, 'import'):
+        component = loader.get_component(domain)
 
     if not component:
         log_error("Component not found.", False)
@@ -155,23 +260,28 @@ def _async_setup_component(hass: core.HomeAssistant,
         log_error("Unable to resolve component or dependencies.")
         return False
 
-    processed_config = \
-        conf_util.async_process_component_config(hass, config, domain)
+    with timeline.span(domain, 'config'):
+        processed_config = \
+            conf_util.async_process_component_config(hass, config, domain)
 
     if processed_config is None:
         log_error("Invalid config.")
         return False
 
     if not hass.config.skip_pip and hasattr(component, 'REQUIREMENTS'):
-        req_success = yield from _async_process_requirements(
-            hass, domain, component.REQUIREMENTS)
+        with timeline.span(domain, 'requirements'):
+            req_success = yield from _async_process_requirements(
+                hass, domain, component.REQUIREMENTS)
         if not req_success:
             log_error("Could not install all requirements.")
             return False
 
+    timeline.add_dependencies(domain, getattr(component, 'DEPENDENCIES', []))
+
     if hasattr(component, 'DEPENDENCIES'):
-        dep_success = yield from _async_process_dependencies(
-            hass, config, domain, component.DEPENDENCIES)
+        with timeline.span(domain, 'dependencies'):
+            dep_success = yield from _async_process_dependencies(
+                hass, config, domain, component.DEPENDENCIES)
 
         if not dep_success:
             log_error("Could not setup all dependencies.")
@@ -198,6 +308,7 @@ def _async_setup_component(hass: core.HomeAssistant,
     finally:
         end = timer()
         warn_task.cancel()
+        timeline.add(domain, 'setup', start, end)
     _LOGGER.info("Setup of domain %s took %.1f seconds.", domain, end - start)
 
     if result is False:
@@ -238,7 +349,10 @@ def async_prepare_setup_platform(hass: core.HomeAssistant, config, domain: str,
                       platform_path, msg)
         async_notify_setup_error(hass, platform_path)
 
-    platform = loader.get_platform(domain, platform_name)
+    timeline = async_get_timeline(hass)
+
+    with timeline.span(platform_path, 'import'):
+        platform = loader.get_platform(domain, platform_name)
 
     # Not found
     if platform is None:
@@ -249,18 +363,23 @@ def async_prepare_setup_platform(hass: core.HomeAssistant, config, domain: str,
     elif platform_path in hass.config.components:
         return platform
 
+    timeline.add_dependencies(
+        platform_path, getattr(platform, 'DEPENDENCIES', []))
+
     # Load dependencies
     if hasattr(platform, 'DEPENDENCIES'):
-        dep_success = yield from _async_process_dependencies(
-            hass, config, platform_path, platform.DEPENDENCIES)
+        with timeline.span(platform_path, 'dependencies'):
+            dep_success = yield from _async_process_dependencies(
+                hass, config, platform_path, platform.DEPENDENCIES)
 
         if not dep_success:
             log_error("Could not setup all dependencies.")
             return None
 
     if not hass.config.skip_pip and hasattr(platform, 'REQUIREMENTS'):
-        req_success = yield from _async_process_requirements(
-            hass, platform_path, platform.REQUIREMENTS)
+        with timeline.span(platform_path, 'requirements'):
+            req_success = yield from _async_process_requirements(
+                hass, platform_path, platform.REQUIREMENTS)
 
         if not req_success:
             log_error("Could not install all requirements.")
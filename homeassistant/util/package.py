@@ -8,10 +8,13 @@ import threading
 from urllib.parse import urlparse
 
 from pip.locations import running_under_virtualenv
-from typing import Optional
+from typing import Iterable, Optional, Set
 
 import pkg_resources
 
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import load_json, save_json
+
 _LOGGER = logging.getLogger(__name__)
 
 INSTALL_LOCK = threading.Lock()
@@ -71,6 +74,35 @@ def check_package_exists(package: str) -> bool:
     return any(dist in req for dist in env[req.project_name])
 
 
+def load_satisfied_requirements(path: str, key: str) -> Set[str]:
+    """Load the requirements that were satisfied for the environment key.
+
+    Returns an empty set if the manifest at path is missing, unreadable or
+    belongs to another environment.
+    """
+    try:
+        manifest = load_json(path)
+    except HomeAssistantError:
+        return set()
+
+    if not isinstance(manifest, dict) or manifest.get('key') != key:
+        return set()
+
+    return set(manifest.get('requirements', []))
+
+
+def save_satisfied_requirements(path: str, key: str,
+                                requirements: Iterable[str]) -> None:
+    """Save the requirements that are satisfied for the environment key."""
+    try:
+        save_json(path, {
+            'key': key,
+            'requirements': sorted(requirements),
+        })
+    except HomeAssistantError:
+        _LOGGER.warning("Unable to save the requirements manifest %s", path)
+
+
 def _get_user_site(deps_dir: str) -> tuple:
     """Get arguments and environment for subprocess used in get_user_site."""
     env = os.environ.copy()
@@ -0,0 +1,165 @@
+"""Timeline of how long the stages of starting up took."""
+from contextlib import contextmanager
+from timeit import default_timer as timer
+
+# Spans added after this many are dropped
+MAX_SPANS = 10000
+
+CATEGORY = 'startup'
+CATEGORY_CRITICAL = 'critical_path'
+
+
+class Span(object):
+    """A stage that ran on a track of the timeline."""
+
+    __slots__ = ['track', 'name', 'start', 'end', 'args']
+
+    def __init__(self, track, name, start, end, args):
+        """Initialize a span."""
+        self.track = track
+        self.name = name
+        self.start = start
+        self.end = end
+        self.args = args
+
+
+class Timeline(object):
+    """Record the stages of setting up components and platforms.
+
+    Every span belongs to a track, usually the component or platform it
+    was run for. Tracks can have dependencies, the tracks they had to wait
+    for, which are used to find the critical path. Times are seconds as
+    returned by timeit.default_timer.
+    """
+
+    def __init__(self, max_spans=MAX_SPANS):
+        """Initialize the timeline."""
+        self.start = timer()
+        self.max_spans = max_spans
+        self.spans = []
+        self.dropped = 0
+        self._dependencies = {}
+
+    def add(self, track, name, start, end=None, **args):
+        """Add a span that ran from start till end or now."""
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return
+
+        if end is None:
+            end = timer()
+
+        self.spans.append(Span(track, name, start, end, args))
+
+    @contextmanager
+    def span(self, track, name, **args):
+        """Add a span for the time the with-block is running."""
+        start = timer()
+        try:
+            yield
+        finally:
+            self.add(track, name, start, **args)
+
+    def add_dependencies(self, track, dependencies):
+        """Record that track had to wait for the dependency tracks."""
+        track_dependencies = self._dependencies.setdefault(track, [])
+        for dependency in dependencies:
+            if dependency not in track_dependencies:
+                track_dependencies.append(dependency)
+
+    def tracks(self):
+        """Return the start and end of every track."""
+        tracks = {}
+        for span in self.spans:
+            if span.track not in tracks:
+                tracks[span.track] = [span.start, span.end]
+            else:
+                extent = tracks[span.track]
+                extent[0] = min(extent[0], span.start)
+                extent[1] = max(extent[1], span.end)
+        return tracks
+
+    def critical_path(self):
+        """Return the tracks that determined when the last track finished.
+
+        Starting from the track with dependencies that finished last, the
+        path follows the dependency that finished last as long as it was
+        still running when the track started. Returns a list of dicts with
+        track, start, end and duration in seconds since the start of the
+        timeline, ordered by start.
+        """
+        tracks = self.tracks()
+        candidates = [track for track in self._dependencies
+                      if track in tracks]
+
+        if not candidates:
+            return []
+
+        current = max(candidates, key=lambda track: tracks[track][1])
+        path = [current]
+
+        while True:
+            start = tracks[current][0]
+            waited = [dependency for dependency
+                      in self._dependencies.get(current, ())
+                      if dependency in tracks and
+                      dependency not in path and
+                      tracks[dependency][1] > start]
+            if not waited:
+                break
+            current = max(waited, key=lambda track: tracks[track][1])
+            path.append(current)
+
+        path.reverse()
+        return [{
+            'track': track,
+            'start': round(tracks[track][0] - self.start, 6),
+            'end': round(tracks[track][1] - self.start, 6),
+            'duration': round(tracks[track][1] - tracks[track][0], 6),
+        } for track in path]
+
+    def as_trace(self):
+        """Return the timeline in the Chrome trace event format.
+
+        Every track is shown as a thread. Spans of tracks on the critical
+        path have the critical_path category.
+        """
+        critical_path = self.critical_path()
+        critical = set(item['track'] for item in critical_path)
+        thread_ids = {}
+        events = []
+
+        for span in self.spans:
+            thread_id = thread_ids.get(span.track)
+            if thread_id is None:
+                thread_id = thread_ids[span.track] = len(thread_ids) + 1
+                events.append({
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': 1,
+                    'tid': thread_id,
+                    'args': {'name': span.track},
+                })
+
+            if span.track in critical:
+                category = CATEGORY_CRITICAL
+            else:
+                category = CATEGORY
+
+            events.append({
+                'name': span.name,
+                'cat': category,
+                'ph': 'X',
+                'ts': int((span.start - self.start) * 1000000),
+                'dur': int((span.end - span.start) * 1000000),
+                'pid': 1,
+                'tid': thread_id,
+                'args': dict(span.args, track=span.track),
+            })
+
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'criticalPath': critical_path,
+            'droppedSpans': self.dropped,
+        }
@@ -1,10 +1,12 @@
 """YAML utility functions."""
 import logging
 import os
+import pickle
 import sys
 import fnmatch
+import threading
 from collections import OrderedDict
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional
 
 import yaml
 try:
@@ -24,6 +26,18 @@ _SECRET_NAMESPACE = 'homeassistant'
 SECRET_YAML = 'secrets.yaml'
 __SECRET_CACHE = {}  # type: Dict
 
+# Bump when the format of the cached files changes
+_CACHE_VERSION = 1
+_CACHE = {
+    'root': None,
+    'file': None,
+    'loaded': False,
+    'dirty': False,
+    'entries': {},
+}  # type: Dict
+_CACHE_LOCK = threading.Lock()
+_TRACKING = threading.local()
+
 
 class NodeListClass(list):
     """Wrapper class to be able to add attributes on a list."""
@@ -61,8 +75,203 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+def enable_cache(root: str, cache_file: Optional[str]=None) -> None:
+    """Cache the parsed YAML files below the root directory.
+
+    A file is parsed again when it or any file, directory, secret or
+    environment variable it used changed. With cache_file the cache is also
+    stored on disk to be used after a restart.
+    """
+    with _CACHE_LOCK:
+        _CACHE['root'] = os.path.join(os.path.abspath(root), '')
+        _CACHE['file'] = cache_file
+        _CACHE['loaded'] = cache_file is None
+        _CACHE['dirty'] = False
+        _CACHE['entries'] = {}
+
+
+def disable_cache() -> None:
+    """Stop caching parsed YAML files."""
+    with _CACHE_LOCK:
+        _CACHE['root'] = None
+        _CACHE['file'] = None
+        _CACHE['entries'] = {}
+
+
+def _file_signature(fname: str):
+    """Return the modification time and size of a file or None."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dir_signature(directory: str):
+    """Return the modification time of a directory or None."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _current_value(kind: str, key: str):
+    """Return the current value of a dependency."""
+    if kind == 'file':
+        return _file_signature(key)
+    elif kind == 'dir':
+        return _dir_signature(key)
+    elif kind == 'env':
+        return os.environ.get(key)
+    elif kind == 'secret':
+        # Changed secrets are found by the secrets files they are read from
+        return None
+    # Dependencies that can not be checked, like secrets from keyring
+    return object()
+
+
+def _track(kind: str, key: str, value=None) -> None:
+    """Record a dependency of the YAML files that are being loaded."""
+    stack = getattr(_TRACKING, 'stack', None)
+    if not stack:
+        return
+    if kind in ('file', 'dir', 'env'):
+        value = _current_value(kind, key)
+    stack[-1][(kind, key)] = value
+
+
+def _load_disk_cache() -> None:
+    """Load the cache stored on disk once."""
+    _CACHE['loaded'] = True
+    try:
+        with open(_CACHE['file'], 'rb') as cache_file:
+            data = pickle.load(cache_file)
+    except FileNotFoundError:
+        return
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.warning("Unable to read YAML cache %s: %s",
+                        _CACHE['file'], err)
+        return
+
+    if isinstance(data, dict) and data.get('version') == _CACHE_VERSION:
+        _CACHE['entries'].update(data.get('entries', {}))
+
+
+def _persistable(fname: str, dependencies: Dict) -> bool:
+    """Return if a cached file holds no secrets or environment values."""
+    return os.path.basename(fname) != SECRET_YAML and not any(
+        kind in ('env', 'secret', 'external') for kind, _ in dependencies)
+
+
+def _save_disk_cache() -> None:
+    """Store the cache on disk, readable by the owner only.
+
+    Files using secrets or environment variables are only cached in memory,
+    so their resolved values are not written to disk.
+    """
+    _CACHE['dirty'] = False
+    tmp_file = _CACHE['file'] + '.tmp'
+    entries = {fname: entry for fname, entry in _CACHE['entries'].items()
+               if _persistable(fname, entry[0])}
+    try:
+        try:
+            os.remove(tmp_file)
+        except FileNotFoundError:
+            pass
+        with os.fdopen(os.open(tmp_file, os.O_WRONLY | os.O_CREAT, 0o600),
+                       'wb') as cache_file:
+            pickle.dump({'version': _CACHE_VERSION, 'entries': entries},
+                        cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, _CACHE['file'])
+    except OSError as err:
+        _LOGGER.warning("Unable to write YAML cache %s: %s",
+                        _CACHE['file'], err)
+
+
+def _cacheable(fname: str) -> bool:
+    """Return if the file is below the cached directory."""
+    root = _CACHE['root']
+    return root is not None and os.path.abspath(fname).startswith(root)
+
+
+def _cache_get(fname: str):
+    """Return the cached data of a file if all its dependencies match."""
+    with _CACHE_LOCK:
+        if not _CACHE['loaded']:
+            _load_disk_cache()
+        entry = _CACHE['entries'].get(os.path.abspath(fname))
+
+    if entry is None:
+        return None
+
+    dependencies, data = entry
+    for (kind, key), value in dependencies.items():
+        if _current_value(kind, key) != value:
+            return None
+
+    try:
+        result = pickle.loads(data)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    stack = getattr(_TRACKING, 'stack', None)
+    if stack:
+        stack[-1].update(dependencies)
+
+    return result
+
+
+def _cache_set(fname: str, dependencies: Dict, result) -> None:
+    """Cache the data of a file with the dependencies used to load it."""
+    try:
+        data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+
+    with _CACHE_LOCK:
+        _CACHE['entries'][os.path.abspath(fname)] = (dependencies, data)
+        _CACHE['dirty'] = _CACHE['file'] is not None
+
+
 def load_yaml(fname: str) -> Union[List, Dict]:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    When the cache is enabled for the file, a cached copy is returned if
+    nothing it was loaded from changed.
+    """
+    if not _cacheable(fname):
+        return _load_yaml(fname)
+
+    result = _cache_get(fname)
+    if result is not None:
+        return result
+
+    stack = getattr(_TRACKING, 'stack', None)
+    if stack is None:
+        stack = _TRACKING.stack = []
+
+    dependencies = {}  # type: Dict
+    stack.append(dependencies)
+    try:
+        _track('file', fname)
+        result = _load_yaml(fname)
+    finally:
+        stack.pop()
+
+    if stack:
+        stack[-1].update(dependencies)
+
+    _cache_set(fname, dependencies, result)
+
+    if not stack and _CACHE['dirty']:
+        with _CACHE_LOCK:
+            _save_disk_cache()
+
+    return result
+
+
+def _load_yaml(fname: str) -> Union[List, Dict]:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding='utf-8') as conf_file:
             # If configuration file is empty YAML returns None
@@ -109,8 +318,11 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str):
     """Recursively load files in a directory."""
+    _track('dir', directory)
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
+        for name in dirs:
+            _track('dir', os.path.join(root, name))
         for basename in files:
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
                 filename = os.path.join(root, basename)
@@ -205,6 +417,8 @@ def _env_var_yaml(loader: SafeLineLoader,
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
+    _track('env', args[0])
+
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], ' '.join(args[1:]))
@@ -244,11 +458,13 @@ def _secret_yaml(loader: SafeLineLoader,
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
+        _track('file', os.path.join(secret_path, SECRET_YAML))
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
             _LOGGER.debug("Secret %s retrieved from secrets.yaml in "
                           "folder %s", node.value, secret_path)
+            _track('secret', node.value)
             return secrets[node.value]
 
         if secret_path == os.path.dirname(sys.path[0]):
@@ -263,6 +479,7 @@ def _secret_yaml(loader: SafeLineLoader,
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
         if pwd:
             _LOGGER.debug("Secret %s retrieved from keyring", node.value)
+            _track('external', node.value)
             return pwd
 
     global credstash  # pylint: disable=invalid-name
@@ -272,6 +489,7 @@ def _secret_yaml(loader: SafeLineLoader,
             pwd = credstash.getSecret(node.value, table=_SECRET_NAMESPACE)
             if pwd:
                 _LOGGER.debug("Secret %s retrieved from credstash", node.value)
+                _track('external', node.value)
                 return pwd
         except credstash.ItemNotFound:
             pass
@@ -514,6 +514,7 @@ def init_recorder_component(hass, add_config=None):
     """Initialize the recorder."""
     config = dict(add_config) if add_config else {}
     config[recorder.CONF_DB_URL] = 'sqlite://'  # In memory DB
+    config.setdefault(recorder.CONF_COMMIT_INTERVAL, 0)
 
     with patch('homeassistant.components.recorder.migration.migrate_schema'):
         assert setup_component(hass, recorder.DOMAIN,
@@ -345,6 +345,8 @@ class TestComponentsDeviceTracker(unittest.TestCase):
                         CONF_PLATFORM: 'test',
                         device_tracker.CONF_CONSIDER_HOME: 59,
                     }})
+            # Let the initial scan finish
+            self.hass.block_till_done()
 
         self.assertEqual(STATE_HOME,
                          self.hass.states.get('device_tracker.dev1').state)
@@ -430,6 +432,8 @@ class TestComponentsDeviceTracker(unittest.TestCase):
         with assert_setup_component(1, device_tracker.DOMAIN):
             assert setup_component(self.hass, device_tracker.DOMAIN,
                                    TEST_PLATFORM)
+        # Let the initial scan finish
+        self.hass.block_till_done()
         params = {
             'dev_id': 'some_device',
             'host_name': 'example.com',
@@ -520,6 +524,8 @@ class TestComponentsDeviceTracker(unittest.TestCase):
         """Test device tracker see records state correctly."""
         self.assertTrue(setup_component(self.hass, device_tracker.DOMAIN,
                                         TEST_PLATFORM))
+        # Let the initial scan finish
+        self.hass.block_till_done()
 
         params = {
             'mac': 'AA:BB:CC:DD:EE:FF',
@@ -586,6 +592,8 @@ class TestComponentsDeviceTracker(unittest.TestCase):
                         CONF_PLATFORM: 'test',
                         device_tracker.CONF_CONSIDER_HOME: 59,
                     }})
+            # Let the initial scan finish
+            self.hass.block_till_done()
 
         state = self.hass.states.get('device_tracker.dev1')
         attrs = state.attributes
@@ -209,6 +209,39 @@ class TestMQTT(unittest.TestCase):
         self.hass.block_till_done()
         self.assertEqual(0, len(self.calls))
 
+    def test_subscribe_topic_subtree_wildcard_prefix_no_match(self):
+        """Test the subtree wildcard only matches complete levels."""
+        mqtt.subscribe(self.hass, 'test-topic/#', self.record_calls)
+
+        fire_mqtt_message(self.hass, 'test-topic-other', 'test-payload')
+
+        self.hass.block_till_done()
+        self.assertEqual(0, len(self.calls))
+
+    def test_subscribe_overlapping_topics(self):
+        """Test every matching subscription gets the message once."""
+        unsubs = [
+            mqtt.subscribe(self.hass, topic, self.record_calls)
+            for topic in ('test/+/on', 'test/#', '#', 'test/bier/on')]
+        mqtt.subscribe(self.hass, 'test/bier/off', self.record_calls)
+
+        fire_mqtt_message(self.hass, 'test/bier/on', 'test-payload')
+        self.hass.block_till_done()
+        self.assertEqual(4, len(self.calls))
+
+        for unsub in unsubs:
+            unsub()
+
+        fire_mqtt_message(self.hass, 'test/bier/on', 'test-payload')
+        self.hass.block_till_done()
+        self.assertEqual(4, len(self.calls))
+
+        router = self.hass.data[mqtt.DATA_MQTT_ROUTER]
+        self.assertEqual(['test'], list(router._root.children))
+        self.assertEqual(
+            ['off'],
+            list(router._root.children['test'].children['bier'].children))
+
     def test_subscribe_topic_level_wildcard_and_wildcard_root_topic(self):
         """Test the subscription of wildcard topics."""
         mqtt.subscribe(self.hass, '+/test-topic/#', self.record_calls)
@@ -0,0 +1,133 @@
+"""The tests for the recorder cache."""
+from datetime import datetime, timedelta
+
+import homeassistant.core as ha
+from homeassistant.components.recorder.cache import RecentCache
+from homeassistant.const import EVENT_STATE_CHANGED
+import homeassistant.util.dt as dt_util
+
+START = datetime(2017, 6, 1, tzinfo=dt_util.UTC)
+
+
+def _state_changed(entity_id, state, seconds, old_state=None):
+    """Return a state changed event fired seconds after START."""
+    point = START + timedelta(seconds=seconds)
+    new_state = None
+    if state is not None:
+        new_state = ha.State(entity_id, state, {}, point, point)
+    return ha.Event(EVENT_STATE_CHANGED, {
+        'entity_id': entity_id,
+        'old_state': old_state,
+        'new_state': new_state,
+    }, time_fired=point)
+
+
+def _cache(**kwargs):
+    """Return a cache complete since START."""
+    cache = RecentCache(**kwargs)
+    cache.events_complete_since = cache.states_complete_since = START
+    return cache
+
+
+def test_states_during():
+    """Test the cache returns the start states and later changes."""
+    cache = _cache()
+    cache.seed([ha.State('light.kitchen', 'off', {}, START, START)])
+    for seconds, state in enumerate(['on', 'off', 'on'], 1):
+        cache.add(_state_changed('light.kitchen', state, seconds))
+    cache.add(_state_changed('light.hall', 'on', 2))
+
+    start_states, states = cache.states_during(
+        START + timedelta(seconds=1.5), START + timedelta(seconds=3))
+
+    assert start_states['light.kitchen'].state == 'on'
+    assert 'light.hall' not in start_states
+    assert [(state.entity_id, state.state) for state in states] == [
+        ('light.kitchen', 'off'), ('light.hall', 'on')]
+
+    start_states, states = cache.states_during(
+        START + timedelta(seconds=1.5), entity_ids=['light.hall'])
+    assert start_states == {}
+    assert [state.state for state in states] == ['on']
+    assert cache.hits == 2
+
+
+def test_states_during_before_complete():
+    """Test a query before the cache is complete misses."""
+    cache = _cache()
+    assert cache.states_during(START - timedelta(seconds=1)) is None
+    assert cache.events_during(
+        START - timedelta(seconds=1), START) is None
+    assert cache.misses == 2
+
+
+def test_removed_state():
+    """Test removing an entity is cached as an empty state."""
+    cache = _cache()
+    cache.add(_state_changed('light.kitchen', 'on', 1))
+    cache.add(_state_changed('light.kitchen', None, 2))
+
+    start_states, states = cache.states_during(START)
+    assert [state.state for state in states] == ['on', '']
+
+
+def test_prune_keeps_last_state():
+    """Test old states are pruned but the state at the cutoff is kept."""
+    cache = _cache(max_age=timedelta(minutes=5))
+    cache.add(_state_changed('light.kitchen', 'on', 1))
+    cache.add(_state_changed('light.kitchen', 'off', 2))
+    cache.add(_state_changed('light.hall', 'on', 3600))
+
+    cutoff = START + timedelta(minutes=55)
+    assert cache.states_complete_since == cutoff
+    assert cache.events_complete_since == cutoff
+
+    start_states, states = cache.states_during(cutoff)
+    assert start_states['light.kitchen'].state == 'off'
+    assert [state.entity_id for state in states] == ['light.hall']
+
+
+def test_max_states():
+    """Test too many states evict the oldest states of all entities."""
+    cache = _cache(max_states=4)
+    for seconds in range(1, 4):
+        cache.add(_state_changed('light.kitchen', str(seconds), seconds))
+    for seconds in range(4, 6):
+        cache.add(_state_changed('light.hall', str(seconds), seconds))
+
+    assert cache.states_complete_since == START + timedelta(seconds=2)
+    assert cache.states_during(START + timedelta(seconds=1)) is None
+
+    start_states, states = cache.states_during(
+        START + timedelta(seconds=2.5))
+    assert start_states['light.kitchen'].state == '2'
+    assert [state.state for state in states] == ['3', '4', '5']
+
+
+def test_busy_entity():
+    """Test an entity changing often does not evict other entities."""
+    cache = _cache()
+    cache.add(_state_changed('light.hall', 'on', 1))
+    for seconds in range(2, 10002):
+        cache.add(_state_changed('sensor.power', str(seconds), seconds))
+
+    assert cache.states_complete_since == START
+    start_states, states = cache.states_during(
+        START, entity_ids=['light.hall'])
+    assert [state.state for state in states] == ['on']
+
+
+def test_events_during():
+    """Test events come back with states converted to dicts."""
+    cache = _cache(max_events=2)
+    cache.add(ha.Event('test_event', time_fired=START + timedelta(seconds=1)))
+    cache.add(_state_changed('light.kitchen', 'on', 2))
+
+    events = cache.events_during(START, START + timedelta(seconds=3))
+    assert [event.event_type for event in events] == [
+        'test_event', EVENT_STATE_CHANGED]
+    assert events[1].data['new_state']['state'] == 'on'
+
+    cache.add(_state_changed('light.kitchen', 'off', 3))
+    assert cache.events_complete_since == START + timedelta(seconds=2)
+    assert cache.events_during(START, START + timedelta(seconds=4)) is None
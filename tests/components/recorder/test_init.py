@@ -6,11 +6,14 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.core import callback
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import (
+    MATCH_ALL, EVENT_TIME_CHANGED, EVENT_STATE_CHANGED)
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.components.recorder.models import States, Events
+from homeassistant.components.recorder.models import (
+    States, Events, StateAttributes)
+import homeassistant.util.dt as dt_util
 
 from tests.common import get_test_home_assistant, init_recorder_component
 
@@ -151,6 +154,23 @@ def test_saving_event_exclude_event_type(hass_recorder):
     assert events[0].event_type == 'test2'
 
 
+def test_excluded_events_not_queued(hass_recorder):
+    """Test events that are not recorded never reach the queue."""
+    hass = hass_recorder({'exclude': {'event_types': 'test',
+                                      'entities': 'test.excluded'}})
+    instance = hass.data[DATA_INSTANCE]
+
+    with patch.object(instance.queue, 'put') as mock_put:
+        hass.bus.fire('test')
+        hass.bus.fire(EVENT_TIME_CHANGED)
+        hass.states.set('test.excluded', 'on')
+        hass.bus.fire('test2')
+        hass.block_till_done()
+
+    assert len(mock_put.mock_calls) == 1
+    assert mock_put.mock_calls[0][1][0].event_type == 'test2'
+
+
 def test_saving_state_exclude_domains(hass_recorder):
     """Test saving and restoring a state."""
     hass = hass_recorder({'exclude': {'domains': 'test'}})
@@ -188,6 +208,83 @@ def test_saving_state_include_domain_exclude_entity(hass_recorder):
     assert hass.states.get('test.ok').state == 'state2'
 
 
+def test_saving_states_batched(hass_recorder):
+    """Test saving many states written in a few transactions."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    for idx in range(50):
+        hass.states.set('test.recorder', 'state{}'.format(idx))
+    hass.block_till_done()
+    instance.block_till_done()
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 50
+        assert all(state.event_id is not None for state in db_states)
+
+    assert instance.queue_depth == 0
+    assert instance.commit_latency is not None
+
+
+def test_saving_state_deduplicates_attributes(hass_recorder):
+    """Test attributes are stored once and states are not duplicated."""
+    hass = hass_recorder()
+    attributes = {'test_attr': 5, 'test_attr_10': 'nice'}
+
+    hass.states.set('test.recorder', 'on', attributes)
+    hass.block_till_done()
+    hass.states.set('test.recorder', 'off', attributes)
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 1
+
+        db_states = list(session.query(States))
+        assert len(db_states) == 2
+        assert all(state.attributes is None for state in db_states)
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[1].to_native() == hass.states.get('test.recorder')
+
+        db_events = list(session.query(Events).filter_by(
+            event_type=EVENT_STATE_CHANGED).order_by(Events.event_id))
+        assert 'new_state' not in db_events[1].event_data
+        event = db_events[1].to_native()
+
+    assert event.data['old_state']['state'] == 'on'
+    assert event.data['new_state']['state'] == 'off'
+    assert event.data['new_state']['attributes'] == attributes
+
+
+def test_saving_events_one_by_one_on_error(hass_recorder):
+    """Test an event that cannot be saved does not lose its batch."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.bus.fire('test_good')
+    hass.bus.fire('test_bad', {'value': object()})
+    hass.bus.fire('test_good')
+    hass.block_till_done()
+    instance.block_till_done()
+
+    assert instance.is_alive()
+    assert instance.events_dropped == 1
+
+    # Only the saved events are cached
+    cached = instance.cache.events_during(
+        instance.cache.events_complete_since, dt_util.utcnow())
+    assert [event.event_type for event in cached
+            if event.event_type.startswith('test_')] == [
+                'test_good', 'test_good']
+
+    with session_scope(hass=hass) as session:
+        assert session.query(Events).filter_by(
+            event_type='test_good').count() == 2
+        assert session.query(Events).filter_by(
+            event_type='test_bad').count() == 0
+
+
 def test_recorder_setup_failure():
     """Test some exceptions."""
     hass = get_test_home_assistant()
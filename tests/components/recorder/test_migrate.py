@@ -5,6 +5,7 @@ from unittest.mock import patch, call
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components.recorder import wait_connection_ready, migration
@@ -65,3 +66,26 @@ def test_invalid_update():
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
         migration._apply_update(None, -1, 0)
+
+
+@pytest.mark.parametrize('error', [
+    OperationalError('ALTER TABLE', {}, 'duplicate column name: old_state_id'),
+    ProgrammingError('ALTER TABLE', {}, 'column "old_state_id" of '
+                     'relation "states" already exists'),
+])
+def test_add_existing_columns(error):
+    """Test adding columns that already exist continues the migration."""
+    engine = create_engine('sqlite://')
+    with patch.object(engine, 'execute', side_effect=error) as execute:
+        migration._add_columns(engine, 'states', [
+            'attributes_id INTEGER', 'old_state_id INTEGER'])
+    assert execute.call_count == 2
+
+
+def test_add_columns_error():
+    """Test other errors while adding columns are raised."""
+    engine = create_engine('sqlite://')
+    with patch.object(engine, 'execute', side_effect=ProgrammingError(
+            'ALTER TABLE', {}, 'permission denied for relation states')), \
+            pytest.raises(ProgrammingError):
+        migration._add_columns(engine, 'states', ['old_state_id INTEGER'])
@@ -1,4 +1,5 @@
 """The tests for the Recorder component."""
+import json
 import unittest
 from datetime import datetime
 
@@ -47,6 +48,24 @@ class TestEvents(unittest.TestCase):
         })
         assert event == Events.from_event(event).to_native()
 
+    # pylint: disable=no-self-use
+    def test_from_state_changed_event(self):
+        """Test state payloads are not stored in the event data."""
+        old_state = ha.State('sensor.temperature', '18')
+        event = ha.Event(EVENT_STATE_CHANGED, {
+            'entity_id': 'sensor.temperature',
+            'old_state': old_state,
+            'new_state': ha.State('sensor.temperature', '19'),
+        })
+
+        assert json.loads(
+            Events.from_state_changed_event(event, True).event_data) == {
+                'entity_id': 'sensor.temperature'}
+
+        data = json.loads(
+            Events.from_state_changed_event(event, False).event_data)
+        assert ha.State.from_dict(data['old_state']) == old_state
+
 
 class TestStates(unittest.TestCase):
     """Test States model."""
@@ -3,11 +3,16 @@ import json
 from datetime import datetime, timedelta
 from time import sleep
 import unittest
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
 
 from homeassistant.components import recorder
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.models import States, Events
+from homeassistant.components.recorder.models import (
+    States, Events, StateAttributes)
 from homeassistant.components.recorder.util import session_scope
 from tests.common import get_test_home_assistant, init_recorder_component
 
@@ -110,6 +115,87 @@ class TestRecorderPurge(unittest.TestCase):
             # now we should only have 3 events left
             self.assertEqual(events.count(), 3)
 
+    def test_purge_in_batches(self):
+        """Test purging old states and events in batches."""
+        self._add_test_states()
+        self._add_test_events()
+
+        with session_scope(hass=self.hass) as session:
+            states = session.query(States)
+            events = session.query(Events).filter(
+                Events.event_type.like("EVENT_TEST%"))
+
+            # 3 states in batches of 2, then 2 events
+            instance = self.hass.data[DATA_INSTANCE]
+            self.assertFalse(purge_old_data(instance, 4, batch_size=2))
+            self.assertEqual(states.count(), 3)
+            self.assertFalse(purge_old_data(instance, 4, batch_size=2))
+            self.assertEqual(states.count(), 2)
+            self.assertEqual(events.count(), 3)
+            self.assertTrue(purge_old_data(instance, 4, batch_size=2))
+
+    def test_purge_unused_attributes_in_batches(self):
+        """Test purging attributes no longer used by a state in batches."""
+        self.hass.states.set('test.recorder', 'on', {'test_attr': 5})
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+
+        with session_scope(hass=self.hass) as session:
+            for value in range(3):
+                session.add(StateAttributes(
+                    shared_attrs=json.dumps({'test_attr': value})))
+
+        with session_scope(hass=self.hass) as session:
+            attributes = session.query(StateAttributes)
+            self.assertEqual(attributes.count(), 4)
+
+            instance = self.hass.data[DATA_INSTANCE]
+            self.assertFalse(purge_old_data(instance, 4, batch_size=2))
+            self.assertEqual(attributes.count(), 2)
+            self.assertTrue(purge_old_data(instance, 4, batch_size=2))
+            self.assertEqual(attributes.count(), 1)
+            self.assertEqual(json.loads(attributes.one().shared_attrs),
+                             {'test_attr': 5})
+
+    def test_purge_error(self):
+        """Test a failed purge is logged and not raised."""
+        self._add_test_states()
+
+        with patch('homeassistant.components.recorder.purge._purge_batch',
+                   side_effect=OperationalError('fake', {}, None)):
+            self.assertTrue(
+                purge_old_data(self.hass.data[DATA_INSTANCE], 4))
+
+        with session_scope(hass=self.hass) as session:
+            self.assertEqual(session.query(States).count(), 5)
+
+    def test_purge_keeps_old_state(self):
+        """Test events keep the old state when it is purged."""
+        self.hass.states.set('test.recorder', 'on', {'test_attr': 5})
+        self.hass.block_till_done()
+        self.hass.states.set('test.recorder', 'off', {'test_attr': 5})
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+
+        five_days_ago = datetime.now() - timedelta(days=5)
+        with session_scope(hass=self.hass) as session:
+            old_state = session.query(States).filter_by(state='on').one()
+            old_state.last_updated = five_days_ago
+            session.query(Events).filter_by(
+                event_id=old_state.event_id).one().time_fired = five_days_ago
+
+        purge_old_data(self.hass.data[DATA_INSTANCE], 4)
+
+        with session_scope(hass=self.hass) as session:
+            self.assertEqual(session.query(States).count(), 1)
+            event = session.query(Events).filter_by(
+                event_type=EVENT_STATE_CHANGED).one().to_native()
+
+        self.assertEqual(event.data['old_state']['state'], 'on')
+        self.assertEqual(
+            event.data['old_state']['attributes'], {'test_attr': 5})
+        self.assertEqual(event.data['new_state']['state'], 'off')
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {'keep_days': 4}
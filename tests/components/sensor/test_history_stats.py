@@ -136,6 +136,52 @@ class TestHistoryStatsSensor(unittest.TestCase):
         self.assertEqual(sensor3.state, 2)
         self.assertEqual(sensor4.state, 50)
 
+    def test_measure_incrementally(self):
+        """Test the history is loaded once and changes are recorded."""
+        start = dt_util.utcnow() - timedelta(minutes=60)
+        t0 = start + timedelta(minutes=20)
+
+        # Start     t0          now
+        # |--20min--|---40min---|
+        # |---off---|----on-----|
+
+        fake_states = {
+            'binary_sensor.test_id': [
+                ha.State('binary_sensor.test_id', 'on', last_changed=t0),
+            ]
+        }
+
+        sensor = HistoryStatsSensor(
+            self.hass, 'binary_sensor.test_id', 'on',
+            Template(str(int(start.timestamp())), self.hass),
+            Template('{{ now() }}', self.hass), None, 'count', 'Test')
+        sensor.hass = self.hass
+        sensor.entity_id = 'sensor.test'
+
+        with patch('homeassistant.components.history.'
+                   'state_changes_during_period',
+                   return_value=fake_states) as mock_changes:
+            with patch('homeassistant.components.history.get_state',
+                       return_value=None):
+                sensor.update()
+                self.assertEqual(round(sensor.value, 2), 0.67)
+                self.assertEqual(sensor.state, 1)
+
+                for state in ('off', 'on', 'on'):
+                    self.hass.states.set('binary_sensor.test_id', state)
+                    self.hass.block_till_done()
+                sensor.update()
+                self.assertEqual(round(sensor.value, 2), 0.67)
+                self.assertEqual(sensor.state, 2)
+                self.assertEqual(mock_changes.call_count, 1)
+
+                # Moving the start of the period back loads the history
+                sensor._start = Template(
+                    str(int(start.timestamp()) - 60), self.hass)
+                sensor.update()
+                self.assertEqual(sensor.state, 2)
+                self.assertEqual(mock_changes.call_count, 2)
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template('{{ now() }}', self.hass)
@@ -1,4 +1,5 @@
 """The test for the statistics sensor platform."""
+import random
 import unittest
 import statistics
 
@@ -10,6 +11,53 @@ from unittest.mock import patch
 from datetime import datetime, timedelta
 from tests.common import init_recorder_component
 from homeassistant.components import recorder
+from homeassistant.components.sensor.statistics import RunningStatistics
+
+
+def test_running_statistics():
+    """Test the running statistics match the statistics module."""
+    rand = random.Random(42)
+    stats = RunningStatistics()
+    window = []
+
+    for _ in range(500):
+        value = round(rand.uniform(-100, 100), 1)
+        stats.append(value)
+        window.append(value)
+        if len(window) > 25:
+            assert stats.popleft() == window.pop(0)
+
+        assert stats.min == min(window)
+        assert stats.max == max(window)
+        assert stats.median == statistics.median(window)
+        assert round(stats.mean, 6) == round(statistics.mean(window), 6)
+        assert round(stats.total, 6) == round(sum(window), 6)
+        if len(window) > 1:
+            assert round(stats.variance, 6) == \
+                round(statistics.variance(window), 6)
+
+    while window:
+        assert stats.popleft() == window.pop(0)
+    assert stats.total == 0
+
+
+def test_running_statistics_median():
+    """Test the median with repeated values and a rising window."""
+    rand = random.Random(42)
+    stats = RunningStatistics()
+    window = []
+
+    values = [rand.randint(0, 5) for _ in range(300)] + list(range(300))
+    for value in values:
+        stats.append(value)
+        window.append(value)
+        if len(window) > 10:
+            assert stats.popleft() == window.pop(0)
+
+        assert stats.median == statistics.median(window)
+        # Removed values do not pile up in the heaps
+        # pylint: disable=protected-access
+        assert len(stats._low) + len(stats._high) <= 2 * len(window)
 
 
 class TestStatisticsSensor(unittest.TestCase):
@@ -162,3 +210,31 @@ class TestStatisticsSensor(unittest.TestCase):
         # check if the result is as in test_sensor_source()
         state = self.hass.states.get('sensor.test_mean')
         self.assertEqual(str(self.mean), state.state)
+
+    def test_initialize_from_database_with_max_age(self):
+        """Test initializing from the database when using max_age."""
+        init_recorder_component(self.hass)
+        for value in self.values:
+            self.hass.states.set('sensor.test_monitored', value,
+                                 {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS})
+            self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+
+        assert setup_component(self.hass, 'sensor', {
+            'sensor': {
+                'platform': 'statistics',
+                'name': 'test',
+                'entity_id': 'sensor.test_monitored',
+                'sampling_size': 100,
+                'max_age': {'hours': 1},
+            }
+        })
+        state = self.hass.states.get('sensor.test_mean')
+        self.assertEqual(str(self.mean), state.state)
+
+        # The loaded states are compared with the current time on updates
+        self.hass.states.set('sensor.test_monitored', self.values[0],
+                             {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS})
+        self.hass.block_till_done()
+        state = self.hass.states.get('sensor.test_mean')
+        self.assertEqual(self.count + 1, state.attributes.get('count'))
@@ -2,11 +2,16 @@
 # pylint: disable=protected-access
 import asyncio
 import json
+import logging
+from unittest.mock import Mock
 
 import pytest
 
 from homeassistant import const
 import homeassistant.core as ha
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.setup import async_setup_component
 
 
@@ -312,6 +317,60 @@ def test_api_call_service_with_data(hass, mock_api_client):
     assert len(test_value) == 1
 
 
+@asyncio.coroutine
+def test_api_polling(hass, mock_api_client):
+    """Test the polling statistics of the entity platforms."""
+    component = EntityComponent(
+        logging.getLogger(__name__), 'test_domain', hass)
+    yield from component.async_add_entities([Entity()])
+
+    resp = yield from mock_api_client.get(const.URL_API_POLLING)
+    result = yield from resp.json()
+
+    assert result == [{
+        'domain': 'test_domain',
+        'platform': 'test_domain',
+        'scan_interval': 15,
+        'entities': 1,
+        'polls': 0,
+        'overruns': 0,
+        'duration_mean': None,
+        'duration_max': 0,
+    }]
+
+
+@asyncio.coroutine
+def test_api_recorder(hass, mock_api_client):
+    """Test the recorder statistics."""
+    resp = yield from mock_api_client.get(const.URL_API_RECORDER)
+    assert resp.status == 404
+
+    hass.data[DATA_INSTANCE] = Mock(
+        queue_depth=3, commit_latency=0.5, events_dropped=1)
+
+    resp = yield from mock_api_client.get(const.URL_API_RECORDER)
+    result = yield from resp.json()
+
+    assert result == {
+        'queue_depth': 3,
+        'commit_latency': 0.5,
+        'events_dropped': 1,
+    }
+
+
+@asyncio.coroutine
+def test_api_timeline(hass, mock_api_client):
+    """Test the setup timeline is returned as Chrome trace events."""
+    resp = yield from mock_api_client.get(const.URL_API_TIMELINE)
+    result = yield from resp.json()
+
+    assert resp.status == 200
+    tracks = [event['args']['name'] for event in result['traceEvents']
+              if event['ph'] == 'M']
+    assert 'api' in tracks
+    assert 'http' in tracks
+
+
 @asyncio.coroutine
 def test_api_template(hass, mock_api_client):
     """Test the template API."""
@@ -374,6 +433,32 @@ def test_stream_with_restricted(hass, mock_api_client):
     assert data['event_type'] == 'test_event3'
 
 
+@asyncio.coroutine
+def test_stream_with_delta(hass, mock_api_client):
+    """Test the stream sends a snapshot and then state diffs."""
+    hass.states.async_set('light.kitchen', 'on', {'brightness': 100})
+
+    resp = yield from mock_api_client.get(
+        '{}?delta=1'.format(const.URL_API_STREAM))
+    assert resp.status == 200
+
+    data = yield from _stream_next_event(resp.content)
+    assert data['data']['entity_id'] == 'light.kitchen'
+    assert data['data']['diff']['state'] == 'on'
+    assert data['data']['diff']['attributes'] == {'brightness': 100}
+
+    hass.states.async_set('light.kitchen', 'on', {'brightness': 120})
+    data = yield from _stream_next_event(resp.content)
+    assert data['event_type'] == 'state_changed'
+    diff = data['data']['diff']
+    assert 'state' not in diff
+    assert diff['attributes'] == {'brightness': 120}
+
+    hass.states.async_remove('light.kitchen')
+    data = yield from _stream_next_event(resp.content)
+    assert data['data'] == {'entity_id': 'light.kitchen', 'new_state': None}
+
+
 @asyncio.coroutine
 def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
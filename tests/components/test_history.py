@@ -1,10 +1,15 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from datetime import timedelta
 import unittest
 from unittest.mock import patch, sentinel
 
-from homeassistant.setup import setup_component
+import aiohttp
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.core as ha
 import homeassistant.util.dt as dt_util
 from homeassistant.components import history, recorder
@@ -145,6 +150,52 @@ class TestComponentHistory(unittest.TestCase):
             self.hass, zero, four, filters=history.Filters())
         assert states == hist
 
+    def test_get_significant_states_from_database(self):
+        """Test the database returns the same states as the cache."""
+        zero, four, states = self.record_states()
+        one_and_half = zero + timedelta(seconds=1.5)
+        cache = self.hass.data[recorder.DATA_INSTANCE].cache
+
+        cached = history.get_significant_states(
+            self.hass, one_and_half, four, filters=history.Filters())
+        assert cache.hits == 1
+
+        cache.states_complete_since = four
+        hist = history.get_significant_states(
+            self.hass, one_and_half, four, filters=history.Filters())
+        assert cache.misses == 1
+        assert cached == hist
+
+    def test_stream_significant_states(self):
+        """Test streaming returns the same states per entity."""
+        zero, four, states = self.record_states()
+        one_and_half = zero + timedelta(seconds=1.5)
+
+        hist = dict(history.stream_significant_states(
+            self.hass, zero, four, filters=history.Filters()))
+        assert states == hist
+
+        hist = dict(history.stream_significant_states(
+            self.hass, one_and_half, four, filters=history.Filters()))
+        assert hist == history.get_significant_states(
+            self.hass, one_and_half, four, filters=history.Filters())
+
+    def test_states_to_minimal_json(self):
+        """Test encoding states as parallel arrays."""
+        states = [
+            ha.State('sensor.test', '1', {'unit': 'W'}),
+            ha.State('sensor.test', '2', {'unit': 'W'}),
+            ha.State('sensor.test', '3', {'unit': 'kW'}),
+        ]
+
+        result = history.states_to_minimal_json('sensor.test', states)
+
+        assert result['entity_id'] == 'sensor.test'
+        assert result['state'] == ['1', '2', '3']
+        assert result['attributes'] == [{'unit': 'W'}, None, {'unit': 'kW'}]
+        assert result['last_changed'] == [
+            dt_util.as_timestamp(state.last_changed) for state in states]
+
     def test_get_significant_states_with_initial(self):
         """Test that only significant states are returned.
 
@@ -483,3 +534,24 @@ class TestComponentHistory(unittest.TestCase):
             set_state(therm, 22, attributes={'current_temperature': 21,
                                              'hidden': True})
         return zero, four, states
+
+
+@asyncio.coroutine
+def test_stream_aborts_on_error(hass, test_client):
+    """Test a database error aborts a streamed response."""
+    hass.config.components.add(recorder.DOMAIN)
+    assert (yield from async_setup_component(
+        hass, history.DOMAIN, {history.DOMAIN: {}}))
+    client = yield from test_client(hass.http.app)
+
+    def stream_states(*args):
+        """Yield one entity, then fail like a lost database."""
+        yield 'light.kitchen', [ha.State('light.kitchen', 'on')]
+        raise SQLAlchemyError('connection lost')
+
+    with patch('homeassistant.components.history.stream_significant_states',
+               side_effect=stream_states):
+        resp = yield from client.get('/api/history/period?stream')
+        assert resp.status == 200
+        with pytest.raises(aiohttp.ClientPayloadError):
+            yield from resp.read()
@@ -1,9 +1,11 @@
 """The tests for the InfluxDB component."""
+import threading
 import unittest
 import datetime
 from unittest import mock
 
 import influxdb as influx_client
+import requests.exceptions
 
 from homeassistant.setup import setup_component
 import homeassistant.components.influxdb as influxdb
@@ -107,6 +109,112 @@ class TestInfluxDB(unittest.TestCase):
         assert setup_component(self.hass, influxdb.DOMAIN, config)
         self.handler_method = self.hass.bus.listen.call_args_list[0][0][1]
 
+    def _block_writes(self, mock_client):
+        """Block writes till the returned event is set."""
+        write_started = threading.Event()
+        release = threading.Event()
+
+        def write_points(points):
+            """Wait till the write is released."""
+            write_started.set()
+            release.wait()
+
+        mock_client.return_value.write_points.side_effect = write_points
+        return write_started, release
+
+    def _send_events(self, count, write_started=None):
+        """Send events and wait for the first write to start."""
+        for time_fired in range(count):
+            state = mock.MagicMock(
+                state=1, domain='fake', entity_id='fake.entity-id',
+                object_id='entity', attributes={})
+            self.handler_method(mock.MagicMock(
+                data={'new_state': state}, time_fired=time_fired))
+            if time_fired == 0 and write_started is not None:
+                write_started.wait()
+
+    def test_write_batches(self, mock_client):
+        """Test points queued during a write are written together."""
+        self._setup()
+        writer = self.hass.data[influxdb.DOMAIN]
+        write_started, release = self._block_writes(mock_client)
+
+        self._send_events(4, write_started)
+        release.set()
+        writer.block_till_done()
+
+        calls = mock_client.return_value.write_points.call_args_list
+        self.assertEqual([len(call[0][0]) for call in calls], [1, 3])
+        self.assertEqual(
+            [point['time'] for point in calls[1][0][0]], [1, 2, 3])
+        self.assertEqual(writer.written, 4)
+
+    @mock.patch('homeassistant.components.influxdb.RETRY_DELAY', 0)
+    def test_write_retry(self, mock_client):
+        """Test writes are retried when InfluxDB is not reachable."""
+        self._setup()
+        writer = self.hass.data[influxdb.DOMAIN]
+        mock_client.return_value.write_points.side_effect = [
+            requests.exceptions.ConnectionError('fake'), None]
+
+        self._send_events(1)
+        writer.block_till_done()
+
+        self.assertEqual(
+            mock_client.return_value.write_points.call_count, 2)
+        self.assertEqual(writer.written, 1)
+        self.assertEqual(writer.failed, 0)
+
+    @mock.patch('homeassistant.components.influxdb.QUEUE_MAX_SIZE', 1)
+    def test_queue_full(self, mock_client):
+        """Test points are dropped when the queue is full."""
+        self._setup()
+        writer = self.hass.data[influxdb.DOMAIN]
+        write_started, release = self._block_writes(mock_client)
+
+        self._send_events(3, write_started)
+        self.assertEqual(writer.dropped, 1)
+
+        release.set()
+        writer.block_till_done()
+        self.assertEqual(writer.written, 2)
+
+    def test_write_on_stop(self, mock_client):
+        """Test the queued points are written when stopping."""
+        self._setup()
+        writer = self.hass.data[influxdb.DOMAIN]
+        write_started, release = self._block_writes(mock_client)
+
+        self._send_events(3, write_started)
+        release.set()
+        writer.shutdown(None)
+
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(writer.written, 3)
+
+    @mock.patch('homeassistant.components.influxdb.QUEUE_MAX_SIZE', 2)
+    def test_write_fails_on_stop(self, mock_client):
+        """Test the queued points are dropped when a write fails on stop."""
+        self._setup()
+        writer = self.hass.data[influxdb.DOMAIN]
+        write_started = threading.Event()
+        release = threading.Event()
+
+        def write_points(points):
+            """Fail once the write is released."""
+            write_started.set()
+            release.wait()
+            raise requests.exceptions.ConnectionError('fake')
+
+        mock_client.return_value.write_points.side_effect = write_points
+        self._send_events(3, write_started)
+        release.set()
+        writer.shutdown(None)
+
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(writer.written, 0)
+        self.assertEqual(writer.failed, 3)
+
     def test_event_listener(self, mock_client):
         """Test the event listener."""
         self._setup()
@@ -162,6 +270,7 @@ class TestInfluxDB(unittest.TestCase):
                 body[0]['fields']['value'] = out[1]
 
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             self.assertEqual(
                 mock_client.return_value.write_points.call_count, 1
             )
@@ -196,6 +305,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             self.assertEqual(
                 mock_client.return_value.write_points.call_count, 1
             )
@@ -216,6 +326,7 @@ class TestInfluxDB(unittest.TestCase):
         mock_client.return_value.write_points.side_effect = \
             influx_client.exceptions.InfluxDBClientError('foo')
         self.handler_method(event)
+        self.hass.data[influxdb.DOMAIN].block_till_done()
 
     def test_event_listener_states(self, mock_client):
         """Test the event listener against ignored states."""
@@ -238,6 +349,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if state_state == 1:
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -271,6 +383,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == 'ok':
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -305,6 +418,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if domain == 'ok':
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -349,6 +463,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == 'included':
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -394,6 +509,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if domain == 'fake':
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -449,6 +565,7 @@ class TestInfluxDB(unittest.TestCase):
                 body[0]['fields']['value'] = out[1]
 
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             self.assertEqual(
                 mock_client.return_value.write_points.call_count, 1
             )
@@ -491,6 +608,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == 'ok':
                 self.assertEqual(
                     mock_client.return_value.write_points.call_count, 1
@@ -536,6 +654,7 @@ class TestInfluxDB(unittest.TestCase):
             },
         }]
         self.handler_method(event)
+        self.hass.data[influxdb.DOMAIN].block_till_done()
         self.assertEqual(
             mock_client.return_value.write_points.call_count, 1
         )
@@ -581,6 +700,7 @@ class TestInfluxDB(unittest.TestCase):
             },
         }]
         self.handler_method(event)
+        self.hass.data[influxdb.DOMAIN].block_till_done()
         self.assertEqual(
             mock_client.return_value.write_points.call_count, 1
         )
@@ -641,6 +761,7 @@ class TestInfluxDB(unittest.TestCase):
                 },
             }]
             self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
             self.assertEqual(
                 mock_client.return_value.write_points.call_count, 1
             )
@@ -10,7 +10,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED, EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP,
     ATTR_HIDDEN, STATE_NOT_HOME, STATE_ON, STATE_OFF)
 import homeassistant.util.dt as dt_util
-from homeassistant.components import logbook
+from homeassistant.components import logbook, recorder
 from homeassistant.setup import setup_component
 
 from tests.common import (
@@ -90,6 +90,41 @@ class TestComponentLogbook(unittest.TestCase):
 
         self.assertEqual(0, len(calls))
 
+    def test_get_events_filtered_in_query(self):
+        """Test the database query only returns events for the logbook."""
+        self.hass.states.set('light.kitchen', 'off')
+        self.hass.states.set('light.kitchen', 'on')
+        self.hass.states.set('light.kitchen', 'on', {'brightness': 100})
+        self.hass.states.set('light.hall', 'on')
+        self.hass.states.set('light.hall', 'off')
+        self.hass.bus.fire('some_event')
+        self.hass.block_till_done()
+        instance = self.hass.data[recorder.DATA_INSTANCE]
+        instance.block_till_done()
+
+        start = dt_util.utcnow() - timedelta(hours=1)
+        end = start + timedelta(hours=2)
+        # Make sure the events are read from the database
+        instance.cache.events_complete_since = end
+        config = logbook.CONFIG_SCHEMA({logbook.DOMAIN: {
+            logbook.CONF_EXCLUDE: {
+                logbook.CONF_ENTITIES: ['light.hall'],
+            }}})[logbook.DOMAIN]
+
+        events = [
+            event for event in logbook._get_events(
+                self.hass, config, start, end)
+            if event.event_type == EVENT_STATE_CHANGED]
+
+        self.assertEqual(
+            [('light.kitchen', 'off'), ('light.kitchen', 'on')],
+            [(event.data['entity_id'], event.data['new_state']['state'])
+             for event in events])
+
+        entries = logbook._get_entries(self.hass, config, start, end)
+        self.assert_entry(entries[-1], message='turned on',
+                          entity_id='light.kitchen')
+
     def test_humanify_filter_sensor(self):
         """Test humanify filter too frequent sensor values."""
         entity_id = 'sensor.bla'
@@ -1,13 +1,16 @@
 """Tests for the Home Assistant Websocket API."""
 import asyncio
-from unittest.mock import patch
+import json
+from unittest.mock import Mock, patch
 
 from aiohttp import WSMsgType
 from async_timeout import timeout
 import pytest
 
+import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.components import websocket_api as wapi, frontend
+from homeassistant.const import EVENT_STATE_CHANGED
 
 from tests.common import mock_http_component_app, mock_coro
 
@@ -222,6 +225,151 @@ def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+@asyncio.coroutine
+def test_subscribe_events_entity_filter(hass, websocket_client):
+    """Test subscribing to state changes of some entities."""
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_SUBSCRIBE_EVENTS,
+        'event_type': 'state_changed',
+        'entity_ids': 'light.kitchen',
+        'domains': 'switch',
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['success']
+
+    hass.states.async_set('light.hall', 'on')
+    hass.states.async_set('light.kitchen', 'on')
+    hass.states.async_set('switch.tv', 'on')
+
+    entity_ids = []
+    with timeout(3, loop=hass.loop):
+        for _ in range(2):
+            msg = yield from websocket_client.receive_json()
+            assert msg['id'] == 5
+            entity_ids.append(msg['event']['data']['entity_id'])
+
+    assert entity_ids == ['light.kitchen', 'switch.tv']
+
+
+@asyncio.coroutine
+def test_subscribe_events_delta(hass, websocket_client):
+    """Test subscribing to state changes as diff to the last sent state."""
+    hass.states.async_set('light.kitchen', 'on', {'brightness': 100})
+    hass.states.async_set('switch.tv', 'off')
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_SUBSCRIBE_EVENTS,
+        'event_type': 'state_changed',
+        'domains': 'light',
+        'delta': True,
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['success']
+    assert [state['entity_id'] for state in msg['result']] == [
+        'light.kitchen']
+
+    hass.states.async_set('light.kitchen', 'on', {'brightness': 120})
+    hass.states.async_set('light.hall', 'on')
+
+    with timeout(3, loop=hass.loop):
+        msg = yield from websocket_client.receive_json()
+        assert msg['id'] == 5
+        diff = msg['event']['data']['diff']
+        assert 'state' not in diff
+        assert diff['attributes'] == {'brightness': 120}
+
+        msg = yield from websocket_client.receive_json()
+        diff = msg['event']['data']['diff']
+        assert diff['entity_id'] == 'light.hall'
+        assert diff['state'] == 'on'
+
+
+@asyncio.coroutine
+def test_coalesce_state_changes(hass):
+    """Test state changes are coalesced for a congested connection."""
+    connection = wapi.ActiveConnection(hass, None)
+
+    def state_changed(entity_id, state):
+        """Return a state changed event."""
+        return ha.Event(EVENT_STATE_CHANGED, {
+            'entity_id': entity_id,
+            'old_state': None,
+            'new_state': ha.State(entity_id, state),
+        })
+
+    with patch.object(wapi, 'COALESCE_PENDING_MSG', 1):
+        connection.send_event_outside(5, state_changed('light.kitchen', '1'))
+        connection.send_event_outside(5, state_changed('light.kitchen', '2'))
+        connection.send_event_outside(5, state_changed('light.hall', '3'))
+        connection.send_event_outside(5, state_changed('light.kitchen', '4'))
+        connection.send_event_outside(5, ha.Event('test_event'))
+
+    assert connection.to_write.qsize() == 2
+    assert [
+        json.loads(message)['event']['data']['new_state']['state']
+        for _, message in connection._coalesced.values()] == ['4', '3']
+
+
+@asyncio.coroutine
+def test_coalesced_interleaved(hass):
+    """Test held back state changes are sent while the queue is busy."""
+    connection = wapi.ActiveConnection(hass, None)
+    sent = []
+
+    @asyncio.coroutine
+    def send_str(message):
+        """Record the sent message."""
+        sent.append(message)
+
+    connection.wsock = Mock(closed=False, send_str=send_str)
+    for message in ('a', 'b', 'c', 'd', None):
+        connection.to_write.put_nowait(message)
+    connection._coalesced['x'] = (0, 'x')
+    connection._coalesced['y'] = (0, 'y')
+
+    with patch.object(wapi, 'COALESCE_INTERLEAVE', 2):
+        yield from connection._writer()
+
+    assert sent == ['a', 'b', 'x', 'c', 'd', 'y']
+
+
+@asyncio.coroutine
+def test_coalesced_after_queued(hass):
+    """Test a held back state change is not sent before an older one."""
+    connection = wapi.ActiveConnection(hass, None)
+    sent = []
+
+    @asyncio.coroutine
+    def send_str(message):
+        """Record the sent state."""
+        data = json.loads(message)['event']['data']
+        sent.append(data.get('new_state', {}).get('state'))
+
+    connection.wsock = Mock(closed=False, send_str=send_str)
+
+    def state_changed(state):
+        """Return a state changed event."""
+        return ha.Event(EVENT_STATE_CHANGED, {
+            'entity_id': 'light.x',
+            'old_state': None,
+            'new_state': ha.State('light.x', state),
+        })
+
+    with patch.object(wapi, 'COALESCE_PENDING_MSG', 2), \
+            patch.object(wapi, 'COALESCE_INTERLEAVE', 1):
+        connection.send_event_outside(5, ha.Event('test_event'))
+        connection.send_event_outside(5, state_changed('old'))
+        connection.send_event_outside(5, state_changed('new'))
+        connection.to_write.put_nowait(None)
+        yield from connection._writer()
+
+    assert sent == [None, 'old', 'new']
+
+
 @asyncio.coroutine
 def test_get_states(hass, websocket_client):
     """Test get_states command."""
@@ -7,6 +7,8 @@ import unittest
 from unittest.mock import patch, Mock, MagicMock
 from datetime import timedelta
 
+import pytest
+
 import homeassistant.core as ha
 import homeassistant.loader as loader
 from homeassistant.exceptions import PlatformNotReady
@@ -342,9 +344,7 @@ class TestHelpersEntityComponent(unittest.TestCase):
         assert ('platform_test', {}, {'msg': 'discovery_info'}) == \
             mock_setup.call_args[0]
 
-    @patch('homeassistant.helpers.entity_component.'
-           'async_track_time_interval')
-    def test_set_scan_interval_via_config(self, mock_track):
+    def test_set_scan_interval_via_config(self):
         """Test the setting of the scan interval via configuration."""
         def platform_setup(hass, config, add_devices, discovery_info=None):
             """Test the platform setup."""
@@ -363,12 +363,11 @@ class TestHelpersEntityComponent(unittest.TestCase):
         })
 
         self.hass.block_till_done()
-        assert mock_track.called
-        assert timedelta(seconds=30) == mock_track.call_args[0][2]
+        stats = entity_component.async_polling_stats(self.hass)
+        assert [(stat['platform'], stat['scan_interval'])
+                for stat in stats] == [('platform', 30)]
 
-    @patch('homeassistant.helpers.entity_component.'
-           'async_track_time_interval')
-    def test_set_scan_interval_via_platform(self, mock_track):
+    def test_set_scan_interval_via_platform(self):
         """Test the setting of the scan interval via platform."""
         def platform_setup(hass, config, add_devices, discovery_info=None):
             """Test the platform setup."""
@@ -388,8 +387,9 @@ class TestHelpersEntityComponent(unittest.TestCase):
         })
 
         self.hass.block_till_done()
-        assert mock_track.called
-        assert timedelta(seconds=30) == mock_track.call_args[0][2]
+        stats = entity_component.async_polling_stats(self.hass)
+        assert [(stat['platform'], stat['scan_interval'])
+                for stat in stats] == [('platform', 30)]
 
     def test_set_entity_namespace_via_config(self):
         """Test setting an entity namespace."""
@@ -671,3 +671,171 @@ def test_raise_error_on_update(hass):
 
     assert len(updates) == 1
     assert 1 in updates
+
+
+@asyncio.coroutine
+def test_polling_spread_over_interval(hass):
+    """Test entities are polled at a fixed offset in the scan interval."""
+    component = EntityComponent(
+        _LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    updates = []
+
+    class PollingEntity(EntityTest):
+        """Entity recording its polls."""
+
+        @asyncio.coroutine
+        def async_update(self):
+            """Record the poll."""
+            updates.append(self.entity_id)
+
+    start = dt_util.utc_from_timestamp(1500000000)
+
+    with patch('homeassistant.util.dt.utcnow', return_value=start):
+        yield from component.async_add_entities([
+            PollingEntity(should_poll=True) for _ in range(10)])
+
+    async_fire_time_changed(hass, start + timedelta(seconds=10))
+    yield from hass.async_block_till_done()
+    first_half = set(updates)
+    assert 0 < len(first_half) < 10
+
+    async_fire_time_changed(hass, start + timedelta(seconds=20))
+    yield from hass.async_block_till_done()
+    assert len(updates) == 10
+    assert len(set(updates)) == 10
+
+    del updates[:]
+    async_fire_time_changed(hass, start + timedelta(seconds=30))
+    yield from hass.async_block_till_done()
+    assert set(updates) == first_half
+
+    stats = entity_component.async_polling_stats(hass)
+    assert stats[0]['entities'] == 10
+    assert stats[0]['polls'] == 10 + len(first_half)
+    assert stats[0]['overruns'] == 0
+
+
+@asyncio.coroutine
+def test_polling_overrun(hass):
+    """Test a poll is skipped while the previous one still runs."""
+    component = EntityComponent(
+        _LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    release = asyncio.Event(loop=hass.loop)
+    updates = []
+
+    class SlowEntity(EntityTest):
+        """Entity with a slow update."""
+
+        @asyncio.coroutine
+        def async_update(self):
+            """Wait for the update to be released."""
+            updates.append(self.entity_id)
+            yield from release.wait()
+
+    start = dt_util.utc_from_timestamp(1500000000)
+
+    with patch('homeassistant.util.dt.utcnow', return_value=start):
+        yield from component.async_add_entities([
+            SlowEntity(should_poll=True)])
+
+    async_fire_time_changed(hass, start + timedelta(seconds=20))
+    while not updates:
+        yield from asyncio.sleep(0, loop=hass.loop)
+
+    async_fire_time_changed(hass, start + timedelta(seconds=40))
+    for _ in range(3):
+        yield from asyncio.sleep(0, loop=hass.loop)
+
+    release.set()
+    yield from hass.async_block_till_done()
+
+    assert len(updates) == 1
+    stats = entity_component.async_polling_stats(hass)
+    assert stats[0]['polls'] == 1
+    assert stats[0]['overruns'] == 1
+
+
+@asyncio.coroutine
+def test_call_entities_concurrently(hass):
+    """Test a service method is called on entities at the same time."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entities = [EntityTest(should_poll=True) for _ in range(4)]
+    yield from component.async_add_entities(entities)
+    running = []
+    max_running = 0
+    updates = []
+
+    @asyncio.coroutine
+    def update():
+        """Record an update."""
+        updates.append(1)
+
+    for entity in entities:
+        entity.async_update = update
+
+    @asyncio.coroutine
+    def call(entity):
+        """Run a service method that takes a while."""
+        nonlocal max_running
+        running.append(entity)
+        max_running = max(max_running, len(running))
+        yield from asyncio.sleep(0, loop=hass.loop)
+        running.remove(entity)
+
+    yield from component.async_call_entities(entities, call, parallel=3)
+
+    assert max_running == 3
+    assert len(updates) == 4
+
+
+@asyncio.coroutine
+def test_call_entities_parallel_updates(hass):
+    """Test entities limiting parallel updates are called one at a time."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entities = [EntityTest(should_poll=False) for _ in range(3)]
+    yield from component.async_add_entities(entities)
+    parallel_updates = asyncio.Semaphore(1, loop=hass.loop)
+    running = []
+    max_running = 0
+
+    for entity in entities:
+        entity.parallel_updates = parallel_updates
+
+    @asyncio.coroutine
+    def call(entity):
+        """Run a service method that takes a while."""
+        nonlocal max_running
+        running.append(entity)
+        max_running = max(max_running, len(running))
+        yield from asyncio.sleep(0, loop=hass.loop)
+        running.remove(entity)
+
+    yield from component.async_call_entities(entities, call)
+
+    assert max_running == 1
+    assert not parallel_updates.locked()
+
+
+@asyncio.coroutine
+def test_call_entities_timeout_and_error(hass):
+    """Test a slow or failing entity does not stop the other calls."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entities = [EntityTest(name=name, should_poll=False)
+                for name in ('slow', 'fail', 'ok')]
+    yield from component.async_add_entities(entities)
+    done = []
+
+    @asyncio.coroutine
+    def call(entity):
+        """Run a service method depending on the entity."""
+        if entity.name == 'slow':
+            yield from asyncio.sleep(1, loop=hass.loop)
+        elif entity.name == 'fail':
+            raise ValueError('Fake error')
+        done.append(entity.name)
+
+    with pytest.raises(ValueError):
+        yield from component.async_call_entities(
+            entities, call, timeout=0.01)
+
+    assert done == ['ok']
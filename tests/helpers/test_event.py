@@ -18,6 +18,7 @@ from homeassistant.helpers.event import (
     track_state_change,
     track_time_interval,
     track_template,
+    track_template_result,
     track_same_state,
     track_sunrise,
     track_sunset,
@@ -264,6 +265,50 @@ class TestEventHelpers(unittest.TestCase):
         self.assertEqual(2, len(wildcard_runs))
         self.assertEqual(2, len(wildercard_runs))
 
+    def test_track_template_result(self):
+        """Test tracking the states a template reads."""
+        runs = []
+
+        template_switch = Template(
+            "{% if is_state('input_boolean.use_b', 'on') %}"
+            "{{ states.switch.b.state }}{% else %}"
+            "{{ states.switch.a.state }}{% endif %}", self.hass)
+
+        @ha.callback
+        def result_callback(event, info):
+            runs.append((event.data['entity_id'], info.result))
+
+        track_template_result(self.hass, template_switch, result_callback)
+
+        for entity_id, state in (('switch.b', 'on'), ('switch.a', 'on'),
+                                 ('input_boolean.use_b', 'on'),
+                                 ('switch.a', 'off'), ('switch.b', 'off')):
+            self.hass.states.set(entity_id, state)
+            self.hass.block_till_done()
+
+        self.assertEqual([('switch.a', 'on'), ('input_boolean.use_b', 'on'),
+                          ('switch.b', 'off')], runs)
+
+    def test_track_template_result_domain(self):
+        """Test tracking a template iterating over a domain."""
+        runs = []
+
+        template_count = Template(
+            "{{ states.light | selectattr('state', 'eq', 'on') | list "
+            "| count }}", self.hass)
+
+        @ha.callback
+        def result_callback(event, info):
+            runs.append(info.result)
+
+        track_template_result(self.hass, template_count, result_callback)
+
+        for entity_id in ('light.kitchen', 'switch.tv', 'light.hall'):
+            self.hass.states.set(entity_id, 'on')
+            self.hass.block_till_done()
+
+        self.assertEqual(['1', '2'], runs)
+
     def test_track_same_state_simple_trigger(self):
         """Test track_same_change with trigger simple."""
         thread_runs = []
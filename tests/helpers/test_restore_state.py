@@ -4,10 +4,12 @@ from datetime import timedelta
 from unittest.mock import patch, MagicMock
 
 from homeassistant.setup import setup_component
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP)
 from homeassistant.core import CoreState, split_entity_id, State
 import homeassistant.util.dt as dt_util
 from homeassistant.components import input_boolean, recorder
+from homeassistant.helpers import state_snapshot
 from homeassistant.helpers.restore_state import (
     async_get_last_state, DATA_RESTORE_CACHE)
 from homeassistant.components.recorder.models import RecorderRuns, States
@@ -130,6 +132,32 @@ def test_cache_timeout(hass):
     assert state is None
 
 
+@asyncio.coroutine
+def test_snapshot(hass, tmpdir):
+    """Test states are restored from the snapshot written at shutdown."""
+    hass.config.config_dir = str(tmpdir)
+    state_snapshot.async_setup_snapshot(hass)
+    hass.states.async_set('input_boolean.b1', 'on', {'hello': 'world'})
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    yield from hass.async_block_till_done()
+
+    assert tmpdir.join(state_snapshot.SNAPSHOT_FILE).check()
+
+    hass.states.async_remove('input_boolean.b1')
+    hass.state = CoreState.starting
+
+    with patch('homeassistant.helpers.restore_state.last_recorder_run') \
+            as mock_last_run:
+        state = yield from async_get_last_state(hass, 'input_boolean.b1')
+
+    assert not mock_last_run.called
+    assert state.state == 'on'
+    assert state.attributes == {'hello': 'world'}
+    assert state == hass.data[DATA_RESTORE_CACHE]['input_boolean.b1']
+
+
 def _add_data_in_last_run(hass, entities):
     """Add test data in the last recorder_run."""
     # pylint: disable=protected-access
@@ -135,3 +135,23 @@ class TestServiceHelpers(unittest.TestCase):
 
         self.assertEqual(['group.test'], service.extract_entity_ids(
             self.hass, call, expand_group=False))
+
+    def test_lazy_descriptions(self):
+        """Test descriptions are loaded from the file when called."""
+        service._load_services_file.cache_clear()
+        descriptions = service.lazy_descriptions('services.yaml')
+
+        with patch('homeassistant.config.load_yaml_config_file',
+                   return_value={'test_domain': {'test_service': {
+                       'description': 'Test service'}}}) as mock_load:
+            description = descriptions['test_domain'].get('test_service')
+            assert not mock_load.called
+
+            assert description() == {'description': 'Test service'}
+            assert descriptions.get('test_domain')['missing']() == {}
+            assert descriptions['test_domain'].get(
+                'missing', {'description': 'Default'})() == {
+                    'description': 'Default'}
+            assert mock_load.call_count == 1
+
+        service._load_services_file.cache_clear()
@@ -49,6 +49,53 @@ def test_async_track_states(hass):
         sorted(states, key=lambda state: state.entity_id)
 
 
+def test_state_diff():
+    """Test the diff between two states."""
+    point1 = dt_util.utcnow()
+    point2 = point1 + timedelta(seconds=5)
+    old_state = ha.State('light.test', 'on', {
+        'brightness': 100, 'friendly_name': 'Test', 'rgb_color': [1, 2, 3]},
+                         point1, point1)
+
+    new_state = ha.State('light.test', 'on', {
+        'brightness': 120, 'friendly_name': 'Test', 'xy_color': [0.5, 0.5]},
+                         point1, point2)
+    assert state.state_diff(old_state, new_state) == {
+        'last_updated': point2,
+        'attributes': {'brightness': 120, 'xy_color': [0.5, 0.5]},
+        'removed_attributes': ['rgb_color'],
+    }
+
+    new_state = ha.State('light.test', 'off', old_state.attributes,
+                         point2, point2)
+    assert state.state_diff(old_state, new_state) == {
+        'state': 'off',
+        'last_changed': point2,
+        'last_updated': point2,
+    }
+
+    assert state.state_diff(None, new_state) == new_state.as_dict()
+
+
+def test_state_changed_delta():
+    """Test state changes are sent as diff to the last sent state."""
+    old_state = ha.State('light.test', 'on', {'brightness': 100})
+    new_state = ha.State('light.test', 'on', {'brightness': 120})
+    last_states = {'light.test': old_state}
+
+    data = state.state_changed_delta(ha.Event('state_changed', {
+        'entity_id': 'light.test', 'old_state': None,
+        'new_state': new_state}), last_states)
+    assert data['diff']['attributes'] == {'brightness': 120}
+    assert last_states['light.test'] is new_state
+
+    data = state.state_changed_delta(ha.Event('state_changed', {
+        'entity_id': 'light.test', 'old_state': new_state,
+        'new_state': None}), last_states)
+    assert data == {'entity_id': 'light.test', 'new_state': None}
+    assert last_states == {}
+
+
 class TestStateHelpers(unittest.TestCase):
     """Test the Home Assistant event helpers."""
 
@@ -0,0 +1,59 @@
+"""The tests for the state snapshot helper."""
+import asyncio
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP)
+from homeassistant.core import State
+from homeassistant.helpers import state_snapshot
+
+
+def test_save_load_snapshot(tmpdir):
+    """Test the saved states are loaded."""
+    path = str(tmpdir.join(state_snapshot.SNAPSHOT_FILE))
+    state = State('input_boolean.b1', 'on', {'hello': 'world'})
+
+    state_snapshot.save_snapshot(path, [state])
+
+    assert state_snapshot.load_snapshot(path) == {'input_boolean.b1': state}
+    assert not tmpdir.join(state_snapshot.SNAPSHOT_FILE + '.tmp').check()
+
+
+def test_load_invalid_snapshot(tmpdir):
+    """Test a missing or invalid snapshot is not used."""
+    path = tmpdir.join(state_snapshot.SNAPSHOT_FILE)
+    assert state_snapshot.load_snapshot(str(path)) is None
+
+    path.write('not json')
+    assert state_snapshot.load_snapshot(str(path)) is None
+
+    path.write('{"not": "a list"}')
+    assert state_snapshot.load_snapshot(str(path)) is None
+
+
+@asyncio.coroutine
+def test_snapshot_on_stop(hass, tmpdir):
+    """Test a snapshot is written when stopping after the start."""
+    hass.config.config_dir = str(tmpdir)
+    state_snapshot.async_setup_snapshot(hass)
+    hass.states.async_set('input_boolean.b1', 'on')
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    yield from hass.async_block_till_done()
+
+    states = state_snapshot.load_snapshot(
+        str(tmpdir.join(state_snapshot.SNAPSHOT_FILE)))
+    assert list(states) == ['input_boolean.b1']
+
+
+@asyncio.coroutine
+def test_no_snapshot_before_start(hass, tmpdir):
+    """Test no snapshot is written when stopping before the start."""
+    hass.config.config_dir = str(tmpdir)
+    state_snapshot.async_setup_snapshot(hass)
+    hass.states.async_set('input_boolean.b1', 'on')
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    yield from hass.async_block_till_done()
+
+    assert not tmpdir.join(state_snapshot.SNAPSHOT_FILE).check()
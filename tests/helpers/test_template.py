@@ -783,6 +783,46 @@ is_state_attr('device_tracker.phone_2', 'battery', 40)
                 {'trigger': {'entity_id': 'input_boolean.switch'}}))
 
 
+@asyncio.coroutine
+def test_render_to_info(hass):
+    """Test the states read during a render are recorded."""
+    hass.states.async_set('light.kitchen', 'on')
+
+    info = template.Template(
+        "{{ states.light.kitchen.state }} {{ is_state('switch.tv', 'on') }} "
+        "{{ states('sensor.Temp') }} {{ states.group | list }}",
+        hass).async_render_to_info()
+    assert info.result == 'on False unknown []'
+    assert info.entities == {'light.kitchen', 'switch.tv', 'sensor.temp'}
+    assert info.domains == {'group'}
+    assert not info.all_states
+    assert info.filter('group.all')
+    assert not info.filter('light.hall')
+
+    info = template.Template(
+        '{{ states | count }}', hass).async_render_to_info()
+    assert info.all_states
+
+    info = template.Template(
+        '{{ now().year }}', hass).async_render_to_info()
+    assert info.time
+    assert info.all_states
+
+    info = template.Template('{{ true }}', hass).async_render_to_info()
+    assert info.all_states
+
+    info = template.Template(
+        '{{ states.light.kitchen.state }} {{ now().year }}',
+        hass).async_render_to_info()
+    assert not info.all_states
+
+    info = template.Template(
+        '{{ states.light.hall.attributes.brightness }}',
+        hass).async_render_to_info()
+    assert isinstance(info.exception, TemplateError)
+    assert info.all_states
+
+
 @asyncio.coroutine
 def test_state_with_unit(hass):
     """Test the state_with_unit property helper."""
@@ -27,6 +27,7 @@ _LOGGER = logging.getLogger(__name__)
 @patch('os.access', Mock(return_value=True))
 @patch('homeassistant.bootstrap.async_enable_logging',
        Mock(return_value=True))
+@patch('homeassistant.bootstrap.enable_cache', Mock())
 def test_from_config_file(hass):
     """Test with configuration file."""
     components = set(['browser', 'conversation', 'script'])
@@ -1,6 +1,7 @@
 """Test to verify that Home Assistant core works."""
 # pylint: disable=protected-access
 import asyncio
+import json
 import logging
 import os
 import unittest
@@ -12,6 +13,7 @@ import pytz
 import pytest
 
 import homeassistant.core as ha
+from homeassistant.remote import JSONEncoder
 from homeassistant.exceptions import (InvalidEntityFormatError,
                                       InvalidStateError)
 from homeassistant.util.async import run_coroutine_threadsafe
@@ -268,6 +270,34 @@ class TestEvent(unittest.TestCase):
         }
         self.assertEqual(expected, event.as_dict())
 
+    def test_as_json(self):
+        """Test the JSON encoding matches the dictionary."""
+        old_state = ha.State('light.kitchen', 'off')
+        new_state = ha.State('light.kitchen', 'on', {'brightness': 144})
+        events = [
+            ha.Event('some_type', {'some': 'attr'}),
+            ha.Event(EVENT_STATE_CHANGED, {
+                'entity_id': 'light.kitchen',
+                'old_state': old_state,
+                'new_state': new_state,
+            }),
+            ha.Event(EVENT_STATE_CHANGED, {
+                'entity_id': 'light.kitchen',
+                'old_state': new_state,
+                'new_state': None,
+            }),
+        ]
+
+        for event in events:
+            self.assertEqual(
+                json.loads(json.dumps(event.as_dict(), cls=JSONEncoder)),
+                json.loads(event.as_json()))
+            self.assertIs(event.as_json(), event.as_json())
+
+        # The encoded new state is reused as old state of the next event
+        self.assertIn(new_state.as_json(), events[1].as_json())
+        self.assertIn(new_state.as_json(), events[2].as_json())
+
 
 class TestEventBus(unittest.TestCase):
     """Test EventBus methods."""
@@ -453,6 +483,16 @@ class TestState(unittest.TestCase):
         state = ha.State('domain.hello', 'world', {'some': 'attr'})
         self.assertEqual(state, ha.State.from_dict(state.as_dict()))
 
+    def test_as_json(self):
+        """Test the JSON encoding matches the dictionary."""
+        state = ha.State('domain.hello', 'world', {
+            'some': 'attr', 'list': [1, 2], 'when': dt_util.utcnow()})
+
+        self.assertEqual(
+            json.loads(json.dumps(state.as_dict(), cls=JSONEncoder)),
+            json.loads(state.as_json()))
+        self.assertIs(state.as_json(), state.as_json())
+
     def test_dict_conversion_with_wrong_data(self):
         """Test conversion with wrong data."""
         self.assertIsNone(ha.State.from_dict(None))
@@ -511,6 +551,22 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         self.assertEqual(['light.bowl', 'switch.ac'], states)
 
+    def test_domain_filter(self):
+        """Test the states of a domain follow sets and removals."""
+        self.states.set('light.Kitchen', 'off')
+        self.states.set('light.bowl', 'off')
+
+        states = sorted((state.entity_id, state.state)
+                        for state in self.states.all('Light'))
+        self.assertEqual([('light.bowl', 'off'), ('light.kitchen', 'off')],
+                         states)
+        self.assertEqual([], self.states.all('sensor'))
+
+        self.states.remove('light.bowl')
+        self.states.remove('switch.ac')
+        self.assertEqual(['light.kitchen'], self.states.entity_ids('light'))
+        self.assertEqual([], self.states.entity_ids('switch'))
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -645,6 +701,26 @@ class TestServiceRegistry(unittest.TestCase):
         }
         self.assertEqual(expected, self.services.services)
 
+    def test_lazy_description(self):
+        """Test a description is only loaded when it is requested."""
+        load = MagicMock(return_value={
+            'description': 'Lazy service', 'fields': {'entity_id': {}}})
+        self.services.register(
+            'test_domain', 'lazy_service', lambda call: None, load)
+        self.hass.block_till_done()
+        assert self.services.services['test_domain']['lazy_service'] == {
+            'description': '', 'fields': {}}
+        assert not load.called
+
+        run_coroutine_threadsafe(
+            self.services.async_load_descriptions(), self.hass.loop).result()
+        assert load.call_count == 1
+
+        services = self.services.services
+        assert services['test_domain']['lazy_service'] == {
+            'description': 'Lazy service', 'fields': {'entity_id': {}}}
+        assert load.call_count == 1
+
     def test_call_with_blocking_done_in_time(self):
         """Test call with blocking."""
         calls = []
@@ -953,3 +1029,105 @@ def test_track_task_functions(loop):
         assert hass._track_task
     finally:
         yield from hass.async_stop()
+
+
+@asyncio.coroutine
+def test_scheduler_runs_due_actions_in_order(hass):
+    """Test the scheduler only runs actions that are due, in order."""
+    calls = []
+    now = dt_util.utcnow()
+
+    for offset in (3, 1, 2):
+        hass.scheduler.async_schedule(
+            now + timedelta(seconds=offset),
+            ha.callback(lambda now, offset=offset: calls.append(offset)))
+
+    assert hass.scheduler.pending == 3
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == 1
+
+    hass.scheduler.async_run_due(now + timedelta(seconds=2))
+    yield from hass.async_block_till_done()
+    assert calls == [1, 2]
+    assert hass.scheduler.pending == 1
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED,
+                        {ATTR_NOW: now + timedelta(seconds=5)})
+    yield from hass.async_block_till_done()
+    assert calls == [1, 2, 3]
+    assert hass.scheduler.pending == 0
+    assert EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+
+@asyncio.coroutine
+def test_scheduler_cancel(hass):
+    """Test cancelling a scheduled action."""
+    calls = []
+    now = dt_util.utcnow()
+
+    @ha.callback
+    def action(now):
+        """Record the call."""
+        calls.append(now)
+
+    cancel = hass.scheduler.async_schedule(now + timedelta(seconds=1), action)
+    cancel()
+    # Cancelling twice is a no-op
+    cancel()
+
+    assert hass.scheduler.pending == 0
+    assert EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+    hass.scheduler.async_run_due(now + timedelta(seconds=2))
+    yield from hass.async_block_till_done()
+    assert calls == []
+
+
+@asyncio.coroutine
+def test_scheduler_timer_fires_action(hass):
+    """Test the event loop timer runs the action when it is due."""
+    calls = []
+
+    @ha.callback
+    def action(now):
+        """Record the call."""
+        calls.append(now)
+
+    hass.scheduler.async_start_timer()
+    hass.scheduler.async_schedule(
+        dt_util.utcnow() + timedelta(milliseconds=10), action)
+
+    yield from asyncio.sleep(0.05, loop=hass.loop)
+    assert len(calls) == 1
+    assert hass.scheduler.pending == 0
+
+    hass.scheduler.async_stop_timer()
+
+
+@asyncio.coroutine
+def test_bus_listen_entity(hass):
+    """Test listening for state changes of specific entities."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Record the event."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entity(
+        ('light.kitchen', 'light.bowl', 'light.kitchen'), listener)
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 1
+
+    hass.states.async_set('light.kitchen', 'on')
+    hass.states.async_set('light.living_room', 'on')
+    hass.states.async_set('light.bowl', 'on')
+    yield from hass.async_block_till_done()
+
+    assert [event.data['entity_id'] for event in calls] == \
+        ['light.kitchen', 'light.bowl']
+
+    unsub()
+    assert EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+    hass.states.async_set('light.kitchen', 'off')
+    yield from hass.async_block_till_done()
+    assert len(calls) == 2
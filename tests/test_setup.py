@@ -22,6 +22,8 @@ from tests.common import \
 
 ORIG_TIMEZONE = dt_util.DEFAULT_TIME_ZONE
 VERSION_PATH = os.path.join(get_test_config_dir(), config_util.VERSION_FILE)
+MANIFEST_PATH = os.path.join(
+    get_test_config_dir(), setup.REQUIREMENTS_MANIFEST)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +43,9 @@ class TestSetup:
         """Clean up."""
         self.hass.stop()
 
+        if os.path.isfile(MANIFEST_PATH):
+            os.remove(MANIFEST_PATH)
+
         # if os.path.isfile(VERSION_PATH):
         #     os.remove(VERSION_PATH)
 
@@ -240,6 +245,65 @@ class TestSetup:
             'package==0.0.1', target=self.hass.config.path('deps'),
             constraints=os.path.join('ha_package_path', CONSTRAINT_FILE))
 
+    @mock.patch('homeassistant.util.package.check_package_exists',
+                return_value=False)
+    @mock.patch('homeassistant.util.package.install_package',
+                return_value=True)
+    def test_requirement_satisfied_at_earlier_start(
+            self, mock_install, mock_exists):
+        """Test a requirement installed before is not checked again."""
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        assert setup.setup_component(self.hass, 'comp')
+        assert mock_install.call_count == 1
+        assert os.path.isfile(MANIFEST_PATH)
+
+        self.hass.stop()
+        self.hass = get_test_home_assistant()
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        assert setup.setup_component(self.hass, 'comp')
+        assert mock_install.call_count == 1
+        assert mock_exists.call_count == 1
+        assert setup.DATA_PIP_LOCK not in self.hass.data
+
+    @mock.patch('homeassistant.util.package.check_package_exists',
+                return_value=True)
+    def test_requirement_checked_after_target_changed(self, mock_exists):
+        """Test requirements are checked again when packages changed."""
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        with mock.patch('homeassistant.setup.os.path.getmtime',
+                        return_value=1):
+            assert setup.setup_component(self.hass, 'comp')
+        assert mock_exists.call_count == 1
+
+        self.hass.stop()
+        self.hass = get_test_home_assistant()
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        with mock.patch('homeassistant.setup.os.path.getmtime',
+                        return_value=2):
+            assert setup.setup_component(self.hass, 'comp')
+        assert mock_exists.call_count == 2
+
+    @mock.patch('homeassistant.util.package.check_package_exists',
+                return_value=True)
+    @mock.patch('homeassistant.util.package.install_package')
+    def test_requirement_already_installed(self, mock_install, mock_exists):
+        """Test an installed requirement is added to the manifest."""
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        assert setup.setup_component(self.hass, 'comp')
+        assert not mock_install.called
+        assert 'package==0.0.1' in self.hass.data[setup.DATA_REQUIREMENTS] \
+            .result()
+
     def test_component_not_setup_twice_if_loaded_during_other_setup(self):
         """Test component setup while waiting for lock is not setup twice."""
         result = []
@@ -464,3 +528,24 @@ def test_component_warn_slow_setup(hass):
         assert logger_method == setup._LOGGER.warning
 
         assert mock_call().cancel.called
+
+
+@asyncio.coroutine
+def test_component_setup_timeline(hass):
+    """Test the stages of setting up a component are recorded."""
+    loader.set_component('comp_a', MockModule('comp_a'))
+    loader.set_component(
+        'comp_b', MockModule('comp_b', dependencies=['comp_a']))
+
+    result = yield from setup.async_setup_component(hass, 'comp_b', {})
+    assert result
+
+    timeline = setup.async_get_timeline(hass)
+    stages = [(span.track, span.name) for span in timeline.spans]
+
+    assert ('comp_a', 'setup') in stages
+    assert ('comp_b', 'dependencies') in stages
+    assert ('comp_b', 'setup') in stages
+    assert ('comp_b', 'component') in stages
+    assert [item['track'] for item in timeline.critical_path()] == \
+        ['comp_a', 'comp_b']
@@ -201,6 +201,19 @@ def test_check_package_zip():
     assert not package.check_package_exists(TEST_ZIP_REQ)
 
 
+def test_satisfied_requirements(tmpdir):
+    """Test the satisfied requirements are saved per environment."""
+    path = str(tmpdir.join('manifest.json'))
+    assert package.load_satisfied_requirements(path, 'env') == set()
+
+    package.save_satisfied_requirements(
+        path, 'env', {TEST_NEW_REQ, TEST_EXIST_REQ})
+
+    assert package.load_satisfied_requirements(path, 'env') == {
+        TEST_NEW_REQ, TEST_EXIST_REQ}
+    assert package.load_satisfied_requirements(path, 'other') == set()
+
+
 def test_get_user_site(deps_dir, lib_dir, mock_popen, mock_env_copy):
     """Test get user site directory."""
     env = mock_env_copy()
@@ -0,0 +1,65 @@
+"""Test Home Assistant timeline util methods."""
+from homeassistant.util.timeline import Timeline
+
+
+def _timeline():
+    """Return a timeline with three components."""
+    timeline = Timeline()
+    timeline.start = 0
+    timeline.add('bootstrap', 'stage_1', 0, 10)
+    timeline.add('http', 'setup', 1, 3)
+    timeline.add('api', 'dependencies', 1, 3)
+    timeline.add('api', 'setup', 3, 4)
+    timeline.add('frontend', 'setup', 1, 6)
+    timeline.add('light', 'setup', 2, 2.5)
+    timeline.add_dependencies('http', [])
+    timeline.add_dependencies('api', ['http'])
+    timeline.add_dependencies('frontend', ['api', 'http'])
+    timeline.add_dependencies('light', ['http'])
+    return timeline
+
+
+def test_critical_path():
+    """Test the critical path follows the dependencies waited for."""
+    path = _timeline().critical_path()
+
+    assert [item['track'] for item in path] == ['http', 'api', 'frontend']
+    assert path[1] == {'track': 'api', 'start': 1, 'end': 4, 'duration': 3}
+
+    timeline = _timeline()
+    timeline.add('sensor', 'setup', 5, 7)
+    timeline.add_dependencies('sensor', ['http'])
+    path = timeline.critical_path()
+
+    assert [item['track'] for item in path] == ['sensor']
+
+
+def test_as_trace():
+    """Test the timeline is returned as Chrome trace events."""
+    trace = _timeline().as_trace()
+    events = trace['traceEvents']
+
+    assert events[0] == {
+        'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1,
+        'args': {'name': 'bootstrap'}}
+    assert events[1] == {
+        'name': 'stage_1', 'cat': 'startup', 'ph': 'X', 'ts': 0,
+        'dur': 10000000, 'pid': 1, 'tid': 1, 'args': {'track': 'bootstrap'}}
+
+    frontend = [event for event in events
+                if event['args'].get('track') == 'frontend']
+    assert frontend[0]['cat'] == 'critical_path'
+    assert trace['criticalPath'][-1]['track'] == 'frontend'
+
+
+def test_max_spans():
+    """Test spans over the maximum are dropped."""
+    timeline = Timeline(max_spans=1)
+
+    with timeline.span('test', 'first'):
+        pass
+    with timeline.span('test', 'second'):
+        pass
+
+    assert [span.name for span in timeline.spans] == ['first']
+    assert timeline.as_trace()['droppedSpans'] == 1
@@ -426,3 +426,125 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert 'contains duplicate key' in caplog.text
+
+
+@pytest.fixture
+def yaml_cache(tmpdir):
+    """Enable the YAML cache for a temporary config dir."""
+    cache_file = tmpdir.join('.yaml_cache')
+    yaml.enable_cache(str(tmpdir), str(cache_file))
+    yield tmpdir
+    yaml.disable_cache()
+    yaml.clear_secret_cache()
+
+
+def _write(path, content):
+    """Write a file and make sure its modification time changes."""
+    path.write(content)
+    stat = os.stat(str(path))
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+
+def test_cache_reuses_parsed_file(yaml_cache):
+    """Test a file is only parsed again after it changed."""
+    config = yaml_cache.join('configuration.yaml')
+    _write(config, 'key:\n  - value\n')
+
+    with patch.object(yaml.yaml, 'load', wraps=yaml.yaml.load) as mock_load:
+        first = yaml.load_yaml(str(config))
+        first['key'].append('changed')
+        second = yaml.load_yaml(str(config))
+        assert mock_load.call_count == 1
+
+        assert second == {'key': ['value']}
+        assert second['key'].__line__ == 1
+        assert second['key'].__config_file__ == str(config)
+
+        _write(config, 'key: other\n')
+        assert yaml.load_yaml(str(config)) == {'key': 'other'}
+        assert mock_load.call_count == 2
+
+
+def test_cache_tracks_dependencies(yaml_cache):
+    """Test changed includes, secrets and env vars invalidate the cache."""
+    config = yaml_cache.join('configuration.yaml')
+    include = yaml_cache.join('include.yaml')
+    secrets = yaml_cache.join(yaml.SECRET_YAML)
+    sensors = yaml_cache.mkdir('sensors')
+    _write(config, 'inc: !include include.yaml\n'
+                   'password: !secret password\n'
+                   'env: !env_var YAML_CACHE_TEST default\n'
+                   'sensors: !include_dir_list sensors\n')
+    _write(include, 'one')
+    _write(secrets, 'password: pwhere')
+    _write(sensors.join('first.yaml'), 'platform: first')
+
+    def load():
+        """Load the config without the secrets cached in memory."""
+        yaml.clear_secret_cache()
+        return yaml.load_yaml(str(config))
+
+    assert load() == {
+        'inc': 'one', 'password': 'pwhere', 'env': 'default',
+        'sensors': [{'platform': 'first'}]}
+
+    _write(include, 'two')
+    assert load()['inc'] == 'two'
+
+    _write(secrets, 'password: other')
+    assert load()['password'] == 'other'
+
+    with patch.dict(os.environ, {'YAML_CACHE_TEST': 'set'}):
+        assert load()['env'] == 'set'
+
+    _write(sensors.join('second.yaml'), 'platform: second')
+    assert len(load()['sensors']) == 2
+
+
+def test_cache_stored_on_disk(yaml_cache):
+    """Test the cache is used again after a restart."""
+    config = yaml_cache.join('configuration.yaml')
+    _write(config, 'key: value')
+    yaml.load_yaml(str(config))
+    assert yaml_cache.join('.yaml_cache').check()
+
+    yaml.enable_cache(str(yaml_cache), str(yaml_cache.join('.yaml_cache')))
+    with patch.object(yaml.yaml, 'load') as mock_load:
+        assert yaml.load_yaml(str(config)) == {'key': 'value'}
+    assert not mock_load.called
+
+
+def test_cache_on_disk_without_secrets(yaml_cache):
+    """Test secrets and environment values are not written to disk."""
+    config = yaml_cache.join('configuration.yaml')
+    _write(config, 'inc: !include include.yaml\n'
+                   'secret: !include secret.yaml\n'
+                   'env: !include env.yaml\n')
+    _write(yaml_cache.join('include.yaml'), 'plain')
+    _write(yaml_cache.join('secret.yaml'), '!secret password')
+    _write(yaml_cache.join('env.yaml'), '!env_var YAML_CACHE_TEST default')
+    _write(yaml_cache.join(yaml.SECRET_YAML), 'password: pwhere')
+
+    assert yaml.load_yaml(str(config)) == {
+        'inc': 'plain', 'secret': 'pwhere', 'env': 'default'}
+
+    cache_file = yaml_cache.join('.yaml_cache')
+    assert os.stat(str(cache_file)).st_mode & 0o777 == 0o600
+    content = cache_file.read_binary()
+    assert b'pwhere' not in content
+    assert b'default' not in content
+    assert b'plain' in content
+
+
+def test_cache_skips_keyring_secrets(yaml_cache):
+    """Test files using secrets from the keyring are not cached."""
+    config = yaml_cache.join('configuration.yaml')
+    _write(config, 'password: !secret keyring_password')
+    _write(yaml_cache.join(yaml.SECRET_YAML), 'other: secret')
+
+    with patch.object(yaml, 'keyring', FakeKeyring({
+            'keyring_password': 'first'})):
+        assert yaml.load_yaml(str(config))['password'] == 'first'
+    with patch.object(yaml, 'keyring', FakeKeyring({
+            'keyring_password': 'second'})):
+        assert yaml.load_yaml(str(config))['password'] == 'second'